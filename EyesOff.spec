@@ -1,5 +1,7 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+import glob
+
 from PyInstaller.building.build_main import Tree
 
 # Define the data files to include
@@ -10,6 +12,8 @@ added_files = [
 	('models/best_classification_model_pretrain_finetune_VCD_and_customv2_b.onnx', 'models'),
     ('gui/resources/styles/default.qss', 'gui/resources/styles'),
 ]
+# INT8 model variants that passed utils/quantize_models.py's checks
+added_files += [(path, 'models') for path in sorted(glob.glob('models/*_int8.onnx'))]
 
 a = Analysis(
     ['gui_main.py'],
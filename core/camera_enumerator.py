@@ -0,0 +1,224 @@
+import threading
+import time
+from typing import Dict, List, Optional, Any
+
+import cv2
+from PyQt5.QtCore import QObject, pyqtSignal
+
+
+class CameraEnumerator(QObject):
+    """
+    Enumerates camera devices without blocking the caller.
+    All indices are probed concurrently with a per-device timeout, the result is cached
+    with a TTL and refreshed in the background, and cameras_updated is emitted whenever
+    a refresh completes. Device names that arrive after the probes are merged in and
+    cameras_updated is emitted again.
+    """
+    # Signal emitted with the list of camera info dicts after each refresh
+    cameras_updated = pyqtSignal(list)
+
+    def __init__(self, max_index: int = 10, probe_timeout: float = 3.0, ttl: float = 60.0,
+                 name_timeout: float = 6.0):
+        """
+        Initialize the camera enumerator.
+
+        Args:
+            max_index: Number of camera indices to probe (0..max_index-1)
+            probe_timeout: Seconds to wait for all devices before giving up on slow ones
+            ttl: Seconds a cached result is considered fresh
+            name_timeout: Seconds to wait for the device names (system_profiler on macOS can
+                take up to 5 s) before keeping the generic "Camera i" names
+        """
+        super().__init__()
+        self.max_index = max_index
+        self.probe_timeout = probe_timeout
+        self.ttl = ttl
+        self.name_timeout = name_timeout
+
+        self._lock = threading.Lock()
+        self._cameras: List[Dict[str, Any]] = []
+        self._last_refresh = None
+        self._refresh_thread = None
+        # Probe thread per index - one that timed out may still hold its device open
+        self._probe_threads: Dict[int, threading.Thread] = {}
+
+    def get_cameras(self, refresh_if_stale: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get the cached camera list immediately.
+
+        Args:
+            refresh_if_stale: Start a background refresh if the cache is empty or older than the TTL
+
+        Returns:
+            List of dicts with 'id', 'name', 'backend' and 'resolution' (may be empty before the first refresh)
+        """
+        with self._lock:
+            cameras = list(self._cameras)
+            is_stale = self._last_refresh is None or time.monotonic() - self._last_refresh > self.ttl
+
+        if refresh_if_stale and is_stale:
+            self.refresh()
+
+        return cameras
+
+    def has_results(self) -> bool:
+        """Whether at least one enumeration has completed."""
+        with self._lock:
+            return self._last_refresh is not None
+
+    def get_display_name(self, camera_id: int) -> str:
+        """
+        Get display name for a camera from the cached list.
+
+        Args:
+            camera_id: Camera index
+
+        Returns:
+            str: Display name for the camera
+        """
+        for camera_info in self.get_cameras():
+            if camera_info['id'] == camera_id:
+                name = camera_info['name']
+                resolution = camera_info.get('resolution', '')
+                if resolution and resolution != 'Unknown':
+                    return f"{name} ({resolution})"
+                return name
+
+        return f"Camera {camera_id}"
+
+    def refresh(self, blocking: bool = False):
+        """
+        Re-enumerate cameras in the background.
+
+        Args:
+            blocking: Wait for the enumeration to finish before returning
+        """
+        with self._lock:
+            if self._refresh_thread is None or not self._refresh_thread.is_alive():
+                self._refresh_thread = threading.Thread(target=self._refresh, name="EyesOffCameraEnum", daemon=True)
+                self._refresh_thread.start()
+            refresh_thread = self._refresh_thread
+
+        if blocking:
+            refresh_thread.join()
+
+    def invalidate(self):
+        """Mark the cached list as stale so the next get_cameras() refreshes it."""
+        with self._lock:
+            self._last_refresh = None
+
+    def _refresh(self):
+        """Probe all indices concurrently and publish the result."""
+        # Imported here to avoid a circular import - WebcamManager uses this enumerator
+        from core.webcam import WebcamManager
+
+        results: Dict[int, Optional[Dict[str, Any]]] = {}
+        camera_names: Dict[int, str] = {}
+
+        def fetch_names():
+            camera_names.update(WebcamManager._get_camera_names())
+
+        start = time.monotonic()
+        name_thread = threading.Thread(target=fetch_names, daemon=True)
+        name_thread.start()
+
+        # Indices still held by a probe from an earlier round are not opened a second time
+        with self._lock:
+            busy = {i for i, thread in self._probe_threads.items() if thread.is_alive()}
+            previous = {camera_info['id']: camera_info for camera_info in self._cameras}
+            probe_threads = []
+            for i in range(self.max_index):
+                if i in busy:
+                    continue
+                thread = threading.Thread(target=self._probe_device, args=(i, results), daemon=True)
+                self._probe_threads[i] = thread
+                probe_threads.append(thread)
+        for thread in probe_threads:
+            thread.start()
+
+        # Devices that do not answer within the timeout are left out of this round
+        deadline = start + self.probe_timeout
+        for thread in probe_threads + [name_thread]:
+            thread.join(max(0.0, deadline - time.monotonic()))
+
+        # Snapshot - probes that timed out may still write into results later
+        finished = dict(results)
+
+        cameras = []
+        for i in range(self.max_index):
+            # A device still being probed keeps what the earlier round found
+            camera_info = previous.get(i) if i in busy else finished.get(i)
+            if camera_info is None:
+                continue
+            if i in previous:
+                # Keep the known name until the name lookup answers
+                camera_info = dict(camera_info, name=previous[i]['name'])
+            cameras.append(camera_info)
+
+        names = dict(camera_names)
+        self._publish(cameras, names)
+        print(f"Camera enumeration found {len(cameras)} device(s)")
+
+        # Name lookups can outlast the probes - publish again once the names arrive
+        name_thread.join(max(0.0, start + self.name_timeout - time.monotonic()))
+        if dict(camera_names) != names:
+            self._publish(cameras, dict(camera_names))
+
+    def _publish(self, cameras: List[Dict[str, Any]], camera_names: Dict[int, str]):
+        """
+        Store the camera list with the given names and emit cameras_updated.
+
+        Args:
+            cameras: Camera info dicts of the devices found
+            camera_names: Device name per index, cameras without one keep their current name
+        """
+        cameras = [dict(camera_info, name=camera_names.get(camera_info['id'], camera_info['name']))
+                   for camera_info in cameras]
+
+        with self._lock:
+            self._cameras = cameras
+            self._last_refresh = time.monotonic()
+
+        self.cameras_updated.emit(list(cameras))
+
+    @staticmethod
+    def _probe_device(index: int, results: Dict[int, Optional[Dict[str, Any]]]):
+        """
+        Open a single camera index and record its info.
+
+        Args:
+            index: Camera index to probe
+            results: Shared dict the result is written into (None if not available)
+        """
+        cap = cv2.VideoCapture(index)
+        try:
+            if not cap.isOpened():
+                results[index] = None
+                return
+
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            results[index] = {
+                'id': index,
+                'name': f"Camera {index}",
+                'backend': cap.getBackendName(),
+                'resolution': f"{width}x{height}" if width > 0 and height > 0 else "Unknown"
+            }
+        finally:
+            cap.release()
+
+
+_camera_enumerator = None
+
+
+def get_camera_enumerator() -> CameraEnumerator:
+    """
+    Get the shared camera enumerator.
+
+    Returns:
+        CameraEnumerator: Application-wide enumerator instance
+    """
+    global _camera_enumerator
+    if _camera_enumerator is None:
+        _camera_enumerator = CameraEnumerator()
+    return _camera_enumerator
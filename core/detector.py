@@ -1,3 +1,6 @@
+import os
+import threading
+import time
 from typing import Tuple, List, Dict, Any, Optional
 
 import cv2
@@ -9,13 +12,17 @@ from PyQt5.QtCore import QObject, pyqtSignal
 from yunet_detector import YuNetDetector
 from eyesoff_detector import EyesOffDetector
 
+from core.input_size import AdaptiveInputSize
+from core.tracker import FaceTracker
+from utils.eyesoff_model import is_quantized_model, ort_settings_from_config, quantized_model_path
+from utils.face_regions import plan_regions, merge_detections, TiledFaceDetector
+from utils.model_cache import OptimizedModelCache
+from utils.motion import make_thumbnail, changed_fraction
 from utils.resource_path import resource_path
 
 
 class FaceDetectorSignals(QObject):
-    """Signals for the face detector."""
-    # Signal emitted when detection results are ready
-    detection_ready = pyqtSignal(int, list, np.ndarray, int)
+    """Signals for the face detector - results are delivered by DetectionWorker.signals.detection_ready."""
     # Signal emitted when an error occurs
     error_occurred = pyqtSignal(str)
 
@@ -24,9 +31,23 @@ class FaceDetector:
     """
     Face detector with PyQt signal integration.
     """
+
+    # Width in detector input pixels below which YuNet's regular pass misses faces
+    MIN_DETECTABLE_FACE = 20.0
     
     def __init__(self, detector_type: str, model_path: str, confidence_threshold: float = 0.5,
-                 gaze_model_path: str = None, gaze_threshold: float = 0.4):
+                 gaze_model_path: str = None, gaze_threshold: float = 0.4,
+                 motion_gate: bool = False, motion_gate_threshold: float = 0.002,
+                 motion_gate_max_interval: float = 1.0, face_tracking: bool = False,
+                 detection_interval: int = 5, gaze_cache: bool = False,
+                 gaze_cache_max_age: float = 1.0, roi_detection: bool = False,
+                 full_scan_interval: float = 1.0, tiled_detection: bool = False,
+                 tile_sweep_interval: float = 5.0, adaptive_input_size: bool = False,
+                 input_size_min: int = 224, input_size_max: int = 640, face_threshold: int = 1,
+                 gaze_cascade: bool = False, head_pose_filter: bool = False,
+                 head_pose_max_yaw: float = 45.0, head_pose_max_pitch: float = 40.0,
+                 gaze_max_per_frame: int = 0, gaze_time_budget_ms: float = 0.0,
+                 ort_settings: Optional[Dict[str, Any]] = None, model_cache_dir: Optional[str] = None):
         # TODO: Gaze model path is not provided to the init of FaceDetector
         """
         Initialize the face detector.
@@ -35,6 +56,44 @@ class FaceDetector:
             detector_type: Type of detector ('yunet')
             model_path: Path to the detector model file
             confidence_threshold: Minimum confidence for detection
+            motion_gate: Reuse the previous result while the frame has not changed since the
+                last analysed frame
+            motion_gate_threshold: Fraction of thumbnail pixels that must change to run detection
+            motion_gate_max_interval: Seconds after which detection runs even without changes,
+                so a person keeping still is still re-checked
+            face_tracking: Follow faces between detector runs with optical flow and run
+                the detector only every detection_interval frames, or when a face is lost or
+                something new moves
+            detection_interval: Frames between detector runs while tracking
+            gaze_cache: Reuse the gaze result of a tracked face while it is unchanged
+                (gaze model with face tracking only)
+            gaze_cache_max_age: Seconds after which a tracked face's gaze is re-classified
+            roi_detection: Between full-frame scans, only search around known faces and along
+                the left and right edges where people walk into view
+            full_scan_interval: Seconds between full-frame scans in ROI detection mode
+            tiled_detection: Periodically also search the frame at full resolution in tiles,
+                to find the small faces of people further away (with face_tracking only -
+                the tracker holds those faces between sweeps)
+            tile_sweep_interval: Seconds between tiled full-resolution sweeps
+            adaptive_input_size: Choose the YuNet input size from the sizes of recently seen
+                faces instead of using the detector's fixed target size
+            input_size_min: Smallest adaptive input size
+            input_size_max: Largest adaptive input size
+            face_threshold: Alert threshold of the detection manager
+            gaze_cascade: Only classify gaze while the result can still change whether an
+                alert fires (see EyesOffDetector._classify)
+            head_pose_filter: Treat faces whose landmarks show them turned away from the camera
+                as not looking, without running the gaze model
+            head_pose_max_yaw: Largest head yaw in degrees classified by the gaze model
+            head_pose_max_pitch: Largest head pitch in degrees classified by the gaze model
+            gaze_max_per_frame: Most gaze classifications per frame (0 = no limit); other
+                faces keep their last result, or count as looking without one, and are
+                classified on later frames
+            gaze_time_budget_ms: Most milliseconds of gaze classification per frame (0 = no limit)
+            ort_settings: ONNX Runtime session settings of the gaze model
+                (see utils.eyesoff_model.make_session_options)
+            model_cache_dir: Directory to cache the ONNX Runtime-optimized gaze model in, so
+                later loads skip graph optimization (None = no cache)
         """
         self.detector_type = detector_type
         self.model_path = model_path
@@ -42,36 +101,127 @@ class FaceDetector:
         self.detector = None
         self.signals = FaceDetectorSignals()
 
+        # Guards the detector instance - detect() runs on the detection worker thread
+        # while update_settings() is called from the GUI thread
+        self._lock = threading.RLock()
+
         # Gaze detection settings
         self.gaze_model_path = gaze_model_path
         self.gaze_threshold = gaze_threshold
+        self.gaze_cache = gaze_cache
+        self.gaze_cache_max_age = gaze_cache_max_age
+        self.face_threshold = face_threshold
+        self.gaze_cascade = gaze_cascade
+        self.head_pose_filter = head_pose_filter
+        self.head_pose_max_yaw = head_pose_max_yaw
+        self.head_pose_max_pitch = head_pose_max_pitch
+        self.gaze_max_per_frame = gaze_max_per_frame
+        self.gaze_time_budget_ms = gaze_time_budget_ms
+        self.ort_settings = dict(ort_settings or {})
+        self.model_cache = OptimizedModelCache(model_cache_dir) if model_cache_dir else None
+
+        # Detector load time plus the duration of its first detect() call - the cold start
+        # cost of every (re)creation, without the time spent waiting for the camera
+        self.detector_load_ms = None
+        self.time_to_first_detection_ms = None
+
+        # Motion gate - result and thumbnail of the last frame that was actually analysed
+        self.motion_gate = motion_gate
+        self.motion_gate_threshold = motion_gate_threshold
+        self.motion_gate_max_interval = motion_gate_max_interval
+        self._last_result = None
+        self._last_thumbnail = None
+        self._last_analysed_time = 0.0
+        self.gate_stats = {
+            "analysed_frames": 0,
+            "skipped_frames": 0,
+        }
+
+        # ROI detection - searches near known faces between periodic full-frame scans
+        self.roi_detection = roi_detection
+        self.full_scan_interval = full_scan_interval
+        self._last_full_scan_time = 0.0
+        self.roi_stats = {
+            "full_scans": 0,
+            "roi_scans": 0,
+            "roi_area": 0.0,  # Sum of the searched frame fractions of the ROI scans
+        }
+
+        # Tiled sweeps - full-resolution search for distant faces, created on first use
+        self.tiled_detection = tiled_detection
+        self.tile_sweep_interval = tile_sweep_interval
+        self._tiled_detector = None
+        self._yunet_model_path = None
+        self._last_sweep_time = 0.0
+        self._swept = False  # Whether the last _locate() call included a sweep
+        self.sweep_stats = {
+            "sweeps": 0,
+            "last_sweep_ms": 0.0,
+            "last_sweep_faces": 0,
+        }
+
+        # Adaptive YuNet input size - the size used by the last detector run is reported per frame
+        self.input_size_min = input_size_min
+        self.input_size_max = input_size_max
+        self.input_size_controller = (AdaptiveInputSize(min_size=input_size_min, max_size=input_size_max)
+                                      if adaptive_input_size else None)
+        self._default_input_size = None
+        self.last_input_size = None
+
+        # Face tracking - keeps track IDs and moves boxes between detector runs
+        self.detection_interval = detection_interval
+        self.tracker = FaceTracker(detect_interval=detection_interval) if face_tracking else None
         
         # Create the appropriate detector
         self._create_detector()
     
     def _create_detector(self):
         """Create the appropriate detector based on the type."""
+        start = time.perf_counter()
+        self.time_to_first_detection_ms = None
         try:
+            # Tiled sweeps use the new detector's model and threshold
+            self._close_tiled_detector()
+
             if self.detector_type.lower() == 'yunet':
                 self.detector = YuNetDetector(self.model_path, self.confidence_threshold)
+                self._yunet_model_path = self.model_path
             elif self.detector_type.lower() == 'eyes_off_model':
                 # TODO how to bring this into config settings? We dont want to load the model directly here it should be handled by config and user dropdown
                 # TODO: pt2 centralise this to the config
                 gaze_model_path = resource_path('models/best_classification_model_pretrain_finetune_VCD_and_customv2_b.onnx')
                 yunet_model_path = resource_path('models/face_detection_yunet_2023mar.onnx')
+                # The INT8 gaze model runs with the INT8 face detector when that passed its checks too
+                if self.model_path in self.get_available_models()['eyes_off_model']:
+                    gaze_model_path = self.model_path
+                    if is_quantized_model(gaze_model_path) and os.path.exists(quantized_model_path(yunet_model_path)):
+                        yunet_model_path = quantized_model_path(yunet_model_path)
+                self._yunet_model_path = yunet_model_path
 
-                self.detector = EyesOffDetector(gaze_model_path, self.gaze_threshold, yunet_model_path, self.confidence_threshold)
+                self.detector = EyesOffDetector(gaze_model_path, self.gaze_threshold, yunet_model_path, self.confidence_threshold,
+                                                gaze_cache=self.gaze_cache, gaze_cache_max_age=self.gaze_cache_max_age,
+                                                face_threshold=self._cascade_threshold(),
+                                                head_pose_filter=self.head_pose_filter,
+                                                max_yaw=self.head_pose_max_yaw, max_pitch=self.head_pose_max_pitch,
+                                                max_classifications=self.gaze_max_per_frame,
+                                                time_budget_ms=self.gaze_time_budget_ms,
+                                                ort_settings=self.ort_settings, model_cache=self.model_cache)
             else:
                 raise ValueError(f"Unsupported detector type: {self.detector_type}")
+
+            self._default_input_size = getattr(self.detector, "target_size", None)
+            self.detector_load_ms = (time.perf_counter() - start) * 1000.0
         except Exception as e:
             self.signals.error_occurred.emit(f"Error creating detector: {e}")
 
-    def detect(self, frame: np.ndarray) -> Tuple[int, List[Tuple[int, int, int, int]], np.ndarray, int]:
+    def detect(self, frame: np.ndarray, in_place: bool = False) -> Tuple[int, List[Tuple[int, int, int, int]], np.ndarray, int]:
         """
         Detect faces in the given frame.
         
         Args:
             frame: Input image frame
+            in_place: Draw the annotations directly onto frame instead of a copy - use when
+                the caller owns the frame and does not need the unannotated image afterwards
             
         Returns:
             Tuple containing:
@@ -80,15 +230,44 @@ class FaceDetector:
                 - Annotated frame with visualizations
                 - Number of people looking (0 for non-gaze based methods)
         """
+        start = time.perf_counter()
         try:
-            if self.detector is None:
-                self._create_detector()
-                
-            # Perform detection
-            num_faces, bboxes, annotated_frame, num_looking = self.detector.detect(frame)
-            
-            # Emit signal with results
-            self.signals.detection_ready.emit(num_faces, bboxes, annotated_frame, num_looking)
+            with self._lock:
+                if self.detector is None:
+                    self._create_detector()
+                    start = time.perf_counter()
+
+                thumbnail = make_thumbnail(frame) if self.motion_gate else None
+
+                if thumbnail is not None and self._can_reuse_result(thumbnail):
+                    # Nothing changed - redraw the previous result on this frame
+                    num_faces, bboxes, num_looking = self._last_result
+                    annotated_frame = self.detector.annotate_last(frame, in_place=in_place)
+                    self.gate_stats["skipped_frames"] += 1
+                else:
+                    if self.tracker is not None and hasattr(self.detector, "locate"):
+                        # Faces only a sweep can find are held between sweeps
+                        self.tracker.min_detectable_size = (self._min_detectable_size(frame)
+                                                            if self.tiled_detection else 0.0)
+                        # Run the detector only when the tracked boxes cannot be trusted
+                        if self.tracker.begin_frame(frame):
+                            detections = self._locate(frame)
+                            self.tracker.update(detections, full_search=self._swept)
+                        num_faces, bboxes, annotated_frame, num_looking = self.detector.process_detections(
+                            frame, self.tracker.detections(), in_place=in_place, track_ids=self.tracker.track_ids)
+                    elif hasattr(self.detector, "locate"):
+                        num_faces, bboxes, annotated_frame, num_looking = self.detector.process_detections(
+                            frame, self._locate(frame), in_place=in_place)
+                    else:
+                        # Perform detection
+                        num_faces, bboxes, annotated_frame, num_looking = self.detector.detect(frame, in_place=in_place)
+                    self.gate_stats["analysed_frames"] += 1
+                    self._last_result = (num_faces, list(bboxes), num_looking)
+                    self._last_thumbnail = thumbnail
+                    self._last_analysed_time = time.monotonic()
+
+                if self.time_to_first_detection_ms is None and self.detector_load_ms is not None:
+                    self.time_to_first_detection_ms = self.detector_load_ms + (time.perf_counter() - start) * 1000.0
             
             return num_faces, bboxes, annotated_frame, num_looking
             
@@ -96,6 +275,273 @@ class FaceDetector:
             self.signals.error_occurred.emit(f"Detection error: {e}")
             return 0, [], frame, 0
     
+    def _locate(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Run the face detector, adding a tiled full-resolution sweep when one is due.
+
+        Args:
+            frame: Input image frame
+
+        Returns:
+            np.ndarray: Detection rows in frame pixel coordinates (see YuNetDetector.locate)
+        """
+        if self.input_size_controller is not None:
+            self.detector.target_size = self.input_size_controller.size
+        self.last_input_size = self.detector.target_size
+
+        detections = self._locate_low_resolution(frame)
+
+        # Without the tracker a sweep's faces would be gone on the next frame
+        now = time.monotonic()
+        self._swept = (self.tiled_detection and self.tracker is not None
+                       and now - self._last_sweep_time >= self.tile_sweep_interval)
+        if self._swept:
+            detections = self._sweep(frame, detections, now)
+
+        if self.input_size_controller is not None:
+            self.input_size_controller.observe(detections, max(frame.shape[:2]))
+
+        return detections
+
+    def _sweep(self, frame: np.ndarray, detections: np.ndarray, now: float) -> np.ndarray:
+        """Run a tiled full-resolution sweep and merge it with the regular detections."""
+        if self._tiled_detector is None:
+            self._tiled_detector = TiledFaceDetector(self._yunet_model_path, self.confidence_threshold)
+
+        start = time.perf_counter()
+        tiled = self._tiled_detector.detect(frame)
+        self._last_sweep_time = now
+        self.sweep_stats["sweeps"] += 1
+        self.sweep_stats["last_sweep_ms"] = (time.perf_counter() - start) * 1000.0
+        self.sweep_stats["last_sweep_faces"] = len(tiled)
+
+        # Large faces can be cut by tile boundaries - keep the low resolution result for those
+        return merge_detections([detections, tiled], self.confidence_threshold)
+
+    def _min_detectable_size(self, frame: np.ndarray) -> float:
+        """Width in frame pixels below which the regular (low resolution) pass misses faces."""
+        return self.MIN_DETECTABLE_FACE * max(frame.shape[:2]) / float(self.detector.target_size)
+
+    def _locate_low_resolution(self, frame: np.ndarray) -> np.ndarray:
+        """Run the face detector on the whole frame, or only around the known faces."""
+        if not self.roi_detection:
+            return self.detector.locate(frame)
+
+        if self.tracker is not None:
+            known_boxes = self.tracker.known_boxes()
+            # A first frame or a change away from the tracked faces can be anywhere
+            full_scan = self.tracker.trigger in (FaceTracker.TRIGGER_START, FaceTracker.TRIGGER_MOTION)
+        else:
+            known_boxes = self._last_result[1] if self._last_result is not None else []
+            full_scan = self._last_result is None
+
+        now = time.monotonic()
+        if full_scan or now - self._last_full_scan_time >= self.full_scan_interval:
+            self._last_full_scan_time = now
+            self.roi_stats["full_scans"] += 1
+            return self.detector.locate(frame)
+
+        regions = plan_regions(frame.shape, known_boxes)
+        self.roi_stats["roi_scans"] += 1
+        self.roi_stats["roi_area"] += sum(w * h for _, _, w, h in regions) / float(frame.shape[0] * frame.shape[1])
+        return self.detector.locate(frame, regions)
+
+    def _can_reuse_result(self, thumbnail: np.ndarray) -> bool:
+        """
+        Check whether the last result still applies to a frame.
+
+        Args:
+            thumbnail: Thumbnail of the new frame
+
+        Returns:
+            bool: True if the frame has not changed since the last analysed frame and the
+                forced re-detection interval has not elapsed
+        """
+        if self._last_result is None or self._last_thumbnail is None:
+            return False
+        if time.monotonic() - self._last_analysed_time >= self.motion_gate_max_interval:
+            return False
+        if thumbnail.shape != self._last_thumbnail.shape:
+            return False
+        return changed_fraction(thumbnail, self._last_thumbnail) <= self.motion_gate_threshold
+
+    def get_gate_stats(self) -> Dict[str, Any]:
+        """
+        Get motion gate statistics.
+
+        Returns:
+            Dict: Analysed and skipped frame counts and the fraction of frames skipped
+        """
+        with self._lock:
+            stats = self.gate_stats.copy()
+        total = stats["analysed_frames"] + stats["skipped_frames"]
+        stats["skip_ratio"] = stats["skipped_frames"] / total if total else 0.0
+        return stats
+
+    def reset_gate(self):
+        """Forget the cached result so the next frame is analysed, and reset the gate statistics."""
+        with self._lock:
+            self._last_result = None
+            self._last_thumbnail = None
+            for key in self.gate_stats:
+                self.gate_stats[key] = 0
+
+    def get_tracking_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get face tracking statistics.
+
+        Returns:
+            Dict: Tracker statistics (see FaceTracker.get_stats), or None if tracking is off
+        """
+        with self._lock:
+            return self.tracker.get_stats() if self.tracker is not None else None
+
+    def get_roi_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get ROI detection statistics.
+
+        Returns:
+            Dict: Full-frame and ROI scan counts and the mean fraction of the frame an ROI
+                scan searched, or None if ROI detection is off
+        """
+        with self._lock:
+            if not self.roi_detection:
+                return None
+            stats = self.roi_stats.copy()
+        roi_area = stats.pop("roi_area")
+        stats["mean_roi_area"] = roi_area / stats["roi_scans"] if stats["roi_scans"] else 0.0
+        return stats
+
+    def _cascade_threshold(self) -> Optional[int]:
+        """Alert threshold the gaze detector classifies against, or None to classify every face."""
+        return self.face_threshold if self.gaze_cascade else None
+
+    def get_startup_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get cold start statistics of the current detector.
+
+        Returns:
+            Dict: Detector load time and time to the first detection in milliseconds,
+                or None until the first detection after the detector was (re)created
+        """
+        with self._lock:
+            if self.time_to_first_detection_ms is None:
+                return None
+            return {
+                "detector_load_ms": self.detector_load_ms,
+                "time_to_first_detection_ms": self.time_to_first_detection_ms,
+            }
+
+    def get_cascade_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get gaze cascade statistics.
+
+        Returns:
+            Dict: Classified and skipped face counts and frames without any classification,
+                or None if the detector does not classify gaze or the cascade is off
+        """
+        with self._lock:
+            cascade_stats = getattr(self.detector, "cascade_stats", None)
+            if cascade_stats is None or not self.gaze_cascade:
+                return None
+            return cascade_stats.copy()
+
+    def get_head_pose_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get head pose pre-filter statistics.
+
+        Returns:
+            Dict: Faces marked as turned away without a gaze classification and faces passed
+                on to the gaze model, or None if the detector does not classify gaze or the
+                filter is off
+        """
+        with self._lock:
+            head_pose_stats = getattr(self.detector, "head_pose_stats", None)
+            if head_pose_stats is None or not self.head_pose_filter:
+                return None
+            return head_pose_stats.copy()
+
+    def get_gaze_budget_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get per-frame gaze budget statistics.
+
+        Returns:
+            Dict: Frames that ran out of budget, faces deferred to later frames, and deferred
+                faces that kept an earlier result or counted as looking without one, or None
+                if the detector does not classify gaze or no budget is set
+        """
+        with self._lock:
+            budget_stats = getattr(self.detector, "budget_stats", None)
+            if budget_stats is None or not (self.gaze_max_per_frame > 0 or self.gaze_time_budget_ms > 0):
+                return None
+            return budget_stats.copy()
+
+    def get_input_size_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the YuNet input size.
+
+        Returns:
+            Dict: Input size of the last detector run and whether it is adaptive (with the
+                bounds if so), or None before the first detector run
+        """
+        with self._lock:
+            if self.last_input_size is None:
+                return None
+            stats = {"input_size": self.last_input_size, "adaptive": self.input_size_controller is not None}
+            if self.input_size_controller is not None:
+                controller_stats = self.input_size_controller.get_stats()
+                stats["next_input_size"] = controller_stats.pop("input_size")
+                stats.update(controller_stats)
+            return stats
+
+    def get_tile_sweep_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get tiled sweep statistics.
+
+        Returns:
+            Dict: Number of sweeps, duration and faces found by the last sweep, or None if
+                tiled detection is off
+        """
+        with self._lock:
+            return self.sweep_stats.copy() if self.tiled_detection else None
+
+    def _close_tiled_detector(self):
+        if self._tiled_detector is not None:
+            self._tiled_detector.close()
+            self._tiled_detector = None
+
+    def get_gaze_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get per-track gaze cache statistics.
+
+        Returns:
+            Dict: Cache statistics (see GazeTrackCache.get_stats), or None if the detector
+                does not classify gaze or faces are not tracked
+        """
+        with self._lock:
+            eyesoff = getattr(self.detector, "eyesoff", None)
+            if eyesoff is None or self.tracker is None:
+                return None
+            return eyesoff.track_cache.get_stats()
+
+    def reset_tracking(self):
+        """Drop all tracks so the next frame runs a full detector pass, and reset the tracking statistics."""
+        with self._lock:
+            if self.tracker is not None:
+                self.tracker.reset()
+            self._last_full_scan_time = 0.0
+            self._last_sweep_time = 0.0
+            if self.input_size_controller is not None:
+                self.input_size_controller.reset()
+            for key in self.roi_stats:
+                self.roi_stats[key] = 0
+            for key in self.sweep_stats:
+                self.sweep_stats[key] = 0
+            eyesoff = getattr(self.detector, "eyesoff", None)
+            if eyesoff is not None:
+                # Start the new session without results from the previous one
+                eyesoff.track_cache.clear()
+
     def update_settings(self, settings: Dict[str, Any]) -> bool:
         """
         Update detector settings.
@@ -122,14 +568,104 @@ class FaceDetector:
                 self.confidence_threshold = settings['confidence_threshold']
                 recreate = True
 
+            # Session options are fixed once the ONNX Runtime session exists
+            ort_settings = {**self.ort_settings, **ort_settings_from_config(settings)}
+            if ort_settings != self.ort_settings:
+                self.ort_settings = ort_settings
+                recreate = recreate or self.detector_type.lower() == 'eyes_off_model'
+
             if 'gaze_threshold' in settings:
                 self.gaze_threshold = settings["gaze_threshold"]
                 if hasattr(self.detector, "gaze_threshold"):
                     # Only update if the detector is a gaze detector with this property
                     self.detector.gaze_threshold = self.gaze_threshold
 
+            if 'motion_gate' in settings:
+                self.motion_gate = settings['motion_gate']
+
+            if 'motion_gate_max_interval' in settings:
+                self.motion_gate_max_interval = settings['motion_gate_max_interval']
+
+            if 'gaze_cache' in settings or 'gaze_cache_max_age' in settings:
+                self.gaze_cache = settings.get('gaze_cache', self.gaze_cache)
+                self.gaze_cache_max_age = settings.get('gaze_cache_max_age', self.gaze_cache_max_age)
+                eyesoff = getattr(self.detector, "eyesoff", None)
+                if eyesoff is not None:
+                    eyesoff.gaze_cache = self.gaze_cache
+                    eyesoff.track_cache.max_age = self.gaze_cache_max_age
+
+            if 'face_threshold' in settings or 'gaze_cascade' in settings:
+                self.face_threshold = settings.get('face_threshold', self.face_threshold)
+                self.gaze_cascade = settings.get('gaze_cascade', self.gaze_cascade)
+                if hasattr(self.detector, "face_threshold"):
+                    self.detector.face_threshold = self._cascade_threshold()
+
+            if any(key in settings for key in ('head_pose_filter', 'head_pose_max_yaw', 'head_pose_max_pitch')):
+                self.head_pose_filter = settings.get('head_pose_filter', self.head_pose_filter)
+                self.head_pose_max_yaw = settings.get('head_pose_max_yaw', self.head_pose_max_yaw)
+                self.head_pose_max_pitch = settings.get('head_pose_max_pitch', self.head_pose_max_pitch)
+                if hasattr(self.detector, "head_pose_filter"):
+                    self.detector.head_pose_filter = self.head_pose_filter
+                    self.detector.max_yaw = float(self.head_pose_max_yaw)
+                    self.detector.max_pitch = float(self.head_pose_max_pitch)
+
+            if 'gaze_max_per_frame' in settings or 'gaze_time_budget_ms' in settings:
+                self.gaze_max_per_frame = settings.get('gaze_max_per_frame', self.gaze_max_per_frame)
+                self.gaze_time_budget_ms = settings.get('gaze_time_budget_ms', self.gaze_time_budget_ms)
+                if hasattr(self.detector, "max_classifications"):
+                    self.detector.max_classifications = int(self.gaze_max_per_frame)
+                    self.detector.time_budget_ms = float(self.gaze_time_budget_ms)
+
+            if 'input_size_min' in settings or 'input_size_max' in settings:
+                self.input_size_min = settings.get('input_size_min', self.input_size_min)
+                self.input_size_max = settings.get('input_size_max', self.input_size_max)
+                if self.input_size_controller is not None:
+                    self.input_size_controller.update_settings(self.input_size_min, self.input_size_max)
+
+            if 'adaptive_input_size' in settings and settings['adaptive_input_size'] != (self.input_size_controller is not None):
+                with self._lock:
+                    if settings['adaptive_input_size']:
+                        self.input_size_controller = AdaptiveInputSize(min_size=self.input_size_min,
+                                                                       max_size=self.input_size_max)
+                    else:
+                        self.input_size_controller = None
+                        if self.detector is not None and self._default_input_size is not None:
+                            self.detector.target_size = self._default_input_size
+
+            if 'tiled_detection' in settings:
+                self.tiled_detection = settings['tiled_detection']
+                if not self.tiled_detection:
+                    with self._lock:
+                        self._close_tiled_detector()
+
+            if 'tile_sweep_interval' in settings:
+                self.tile_sweep_interval = settings['tile_sweep_interval']
+
+            if 'roi_detection' in settings:
+                self.roi_detection = settings['roi_detection']
+
+            if 'full_scan_interval' in settings:
+                self.full_scan_interval = settings['full_scan_interval']
+
+            if 'detection_interval' in settings:
+                self.detection_interval = settings['detection_interval']
+                if self.tracker is not None:
+                    self.tracker.detect_interval = max(1, int(self.detection_interval))
+
+            if 'face_tracking' in settings and settings['face_tracking'] != (self.tracker is not None):
+                with self._lock:
+                    self.tracker = FaceTracker(detect_interval=self.detection_interval) if settings['face_tracking'] else None
+                    # A new tracker hands out track IDs from 1 again
+                    eyesoff = getattr(self.detector, "eyesoff", None)
+                    if eyesoff is not None:
+                        eyesoff.track_cache.clear()
+
             if recreate:
-                self._create_detector()
+                with self._lock:
+                    self._create_detector()
+                    self._last_result = None
+                    if self.tracker is not None:
+                        self.tracker.reset()
                 
             return True
             
@@ -141,12 +677,15 @@ class FaceDetector:
     def get_available_models() -> Dict[str, List[str]]:
         """
         Get a list of available detection models.
+
+        INT8 variants (see utils/quantize_models.py) are listed after their FP32 model once
+        they have been built.
         
         Returns:
             Dict: Dictionary of detector types and their available models
         """
         # return only the implemented models
-        return {
+        models = {
             "yunet": [
                 f"{resource_path('models/face_detection_yunet_2023mar.onnx')}"
             ],
@@ -162,4 +701,9 @@ class FaceDetector:
             #    "/path/to/model1.model",
             #    "/path/to/model2.model"
             # ]
-        }
\ No newline at end of file
+        }
+
+        # INT8 variants built and checked by utils/quantize_models.py
+        for paths in models.values():
+            paths.extend([quantized_model_path(path) for path in paths if os.path.exists(quantized_model_path(path))])
+        return models
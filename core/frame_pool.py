@@ -0,0 +1,147 @@
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+
+class FrameBuffer:
+    """
+    A preallocated frame owned by a FramePool.
+
+    Holders call retain() when they keep the buffer and release() when they are done;
+    the buffer returns to the pool once the last holder releases it. Ownership can be
+    handed on (e.g. through a queue or a Qt signal) without an extra retain/release.
+    """
+
+    def __init__(self, pool: Optional['FramePool'], array: np.ndarray):
+        """
+        Args:
+            pool: Pool the buffer returns to (None for an unpooled overflow buffer)
+            array: Backing image array
+        """
+        self.pool = pool
+        self.array = array
+        self._refs = 0
+
+    def retain(self) -> 'FrameBuffer':
+        """Add a holder. Returns self for chaining."""
+        if self.pool is not None:
+            self.pool._retain(self)
+        return self
+
+    def release(self):
+        """Drop a holder, returning the buffer to the pool when none are left."""
+        if self.pool is not None:
+            self.pool._release(self)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.array.shape
+
+
+class FramePool:
+    """
+    Pool of reusable full-frame buffers so the capture path does not allocate a new
+    image per frame. Counts every real allocation so the steady state can be verified
+    to be allocation-free.
+    """
+
+    def __init__(self, max_buffers: int = 8):
+        """
+        Initialize the pool.
+
+        Args:
+            max_buffers: Maximum number of pooled buffers; beyond this acquire() hands out
+                unpooled buffers (still counted as allocations)
+        """
+        self.max_buffers = max_buffers
+        self._lock = threading.Lock()
+        self._buffers: List[FrameBuffer] = []
+        self._free: List[FrameBuffer] = []
+
+        # Statistics
+        self.stats = {
+            "allocations": 0,
+            "acquisitions": 0,
+            "overflow": 0,
+        }
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> FrameBuffer:
+        """
+        Get a free buffer of the given shape, allocating one only if none is free.
+
+        Args:
+            shape: Array shape, e.g. (height, width, 3)
+            dtype: Array dtype
+
+        Returns:
+            FrameBuffer: Buffer with one reference held by the caller
+        """
+        with self._lock:
+            self.stats["acquisitions"] += 1
+
+            for i, buffer in enumerate(self._free):
+                if buffer.array.shape == tuple(shape) and buffer.array.dtype == dtype:
+                    del self._free[i]
+                    buffer._refs = 1
+                    return buffer
+
+            self.stats["allocations"] += 1
+
+            if len(self._buffers) >= self.max_buffers:
+                # Evict a free buffer of another shape (resolution change) before overflowing
+                if self._free:
+                    self._buffers.remove(self._free.pop(0))
+                else:
+                    self.stats["overflow"] += 1
+                    return FrameBuffer(None, np.empty(shape, dtype=dtype))
+
+            buffer = FrameBuffer(self, np.empty(shape, dtype=dtype))
+            buffer._refs = 1
+            self._buffers.append(buffer)
+            return buffer
+
+    def adopt(self, buffer: FrameBuffer, array: np.ndarray):
+        """
+        Replace a buffer's backing array, e.g. when a decoder had to allocate because
+        the frame size changed.
+
+        Args:
+            buffer: Buffer acquired from this pool
+            array: New backing array
+        """
+        with self._lock:
+            self.stats["allocations"] += 1
+            buffer.array = array
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the pool statistics.
+
+        Returns:
+            Dict: Allocation and acquisition counters plus pooled/in-use buffer counts
+        """
+        with self._lock:
+            stats = self.stats.copy()
+            stats["pooled"] = len(self._buffers)
+            stats["in_use"] = len(self._buffers) - len(self._free)
+        return stats
+
+    def clear(self):
+        """Forget all free buffers; buffers still held are dropped when released."""
+        with self._lock:
+            for buffer in self._free:
+                self._buffers.remove(buffer)
+            self._free = []
+
+    def _retain(self, buffer: FrameBuffer):
+        with self._lock:
+            buffer._refs += 1
+
+    def _release(self, buffer: FrameBuffer):
+        with self._lock:
+            if buffer._refs <= 0:
+                return
+            buffer._refs -= 1
+            if buffer._refs == 0 and buffer in self._buffers:
+                self._free.append(buffer)
@@ -0,0 +1,453 @@
+"""Frame sources that feed the capture pipeline - live cameras, recordings and generated frames."""
+
+import glob
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Tuple, Optional, List
+
+import cv2
+import numpy as np
+
+
+class FrameSource(ABC):
+    """
+    Abstract base class for frame sources.
+
+    The interface mirrors the subset of cv2.VideoCapture used by WebcamManager
+    (isOpened/grab/retrieve/read/set/get/release/getBackendName), so the rest of the
+    pipeline runs unchanged whichever source produces the frames.
+    """
+
+    # Whether the source is a physical camera whose properties can be negotiated
+    is_live = False
+
+    def __init__(self, fps: float = 30.0, realtime: bool = True):
+        """
+        Initialize the frame source.
+
+        Args:
+            fps: Frame rate used for pacing when the source has none of its own
+            realtime: If True, frames are delivered at fps; if False, as fast as possible
+        """
+        self.fps = float(fps)
+        self.realtime = realtime
+        self._next_frame_time = None
+        self._pending_frame = None
+
+    @abstractmethod
+    def open(self) -> bool:
+        """Open the source. Returns True on success."""
+        pass
+
+    @abstractmethod
+    def isOpened(self) -> bool:
+        """Check whether the source is open."""
+        pass
+
+    @abstractmethod
+    def _next_frame(self) -> Optional[np.ndarray]:
+        """Produce the next frame, or None at the end of the source."""
+        pass
+
+    @abstractmethod
+    def release(self):
+        """Close the source."""
+        pass
+
+    def grab(self) -> bool:
+        """Fetch the next frame, waiting for its due time in realtime mode."""
+        if not self.isOpened():
+            return False
+
+        self._pace()
+        self._pending_frame = self._next_frame()
+        return self._pending_frame is not None
+
+    def retrieve(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """Return the frame fetched by the last grab()."""
+        frame = self._pending_frame
+        self._pending_frame = None
+        if frame is None:
+            return False, None
+        if image is not None and image.shape == frame.shape:
+            np.copyto(image, frame)
+            return True, image
+        return True, frame
+
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """Grab and retrieve the next frame."""
+        if not self.grab():
+            return False, None
+        return self.retrieve(image)
+
+    def set(self, prop: int, value: float) -> bool:
+        """Set a capture property - recorded and generated sources accept none."""
+        return False
+
+    def get(self, prop: int) -> float:
+        """Get a capture property."""
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        return 0.0
+
+    def getBackendName(self) -> str:
+        """Name reported as the capture backend."""
+        return self.__class__.__name__
+
+    def _pace(self):
+        """Sleep until the next frame is due (realtime mode only)."""
+        if not self.realtime or self.fps <= 0:
+            return
+
+        now = time.monotonic()
+        if self._next_frame_time is None or now - self._next_frame_time > 1.0:
+            # First frame, or we fell far behind - restart the schedule
+            self._next_frame_time = now
+        elif self._next_frame_time > now:
+            time.sleep(self._next_frame_time - now)
+
+        self._next_frame_time += 1.0 / self.fps
+
+
+class CameraFrameSource(FrameSource):
+    """
+    Live camera source backed by cv2.VideoCapture.
+
+    With a decode scale above 1 the source asks the backend for the undecoded MJPEG
+    bitstream and decodes it straight at 1/2, 1/4 or 1/8 size (the JPEG decoder skips the
+    high-frequency DCT work), keeping the last bitstream so a full resolution frame can
+    still be decoded on demand. Backends that cannot deliver the bitstream fall back to
+    normal decoding.
+    """
+
+    is_live = True
+
+    # cv2.imdecode flags for each supported reduced decode scale
+    REDUCED_DECODE_FLAGS = {
+        2: cv2.IMREAD_REDUCED_COLOR_2,
+        4: cv2.IMREAD_REDUCED_COLOR_4,
+        8: cv2.IMREAD_REDUCED_COLOR_8,
+    }
+
+    def __init__(self, camera_id: int = 0):
+        """
+        Args:
+            camera_id: ID of the camera to open
+        """
+        super().__init__(realtime=False)  # The camera paces itself
+        self.camera_id = camera_id
+        self.cap = None
+        self.decode_scale = 1
+        self._last_encoded = None
+
+    def open(self) -> bool:
+        self.cap = cv2.VideoCapture(self.camera_id)
+        self.decode_scale = 1
+        self._last_encoded = None
+        return self.cap.isOpened()
+
+    def isOpened(self) -> bool:
+        return self.cap is not None and self.cap.isOpened()
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        success, frame = self.cap.read()
+        return frame if success else None
+
+    def set_decode_scale(self, scale: int) -> bool:
+        """
+        Switch between normal decoding and reduced-scale MJPEG decoding.
+
+        Args:
+            scale: 1 for normal decoding, or 2, 4 or 8 to decode frames at that fraction
+                of the stream resolution
+
+        Returns:
+            bool: True if the backend accepted raw MJPEG output (or scale is 1)
+        """
+        if not self.isOpened():
+            return False
+
+        if scale not in self.REDUCED_DECODE_FLAGS:
+            if self.decode_scale != 1:
+                self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+            self.decode_scale = 1
+            self._last_encoded = None
+            return True
+
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        if not self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 0):
+            self.decode_scale = 1
+            return False
+
+        self.decode_scale = scale
+        return True
+
+    def decode_full_frame(self) -> Optional[np.ndarray]:
+        """
+        Decode the most recent MJPEG frame at full resolution (reduced decode mode only).
+
+        Returns:
+            Full resolution BGR frame, or None if no bitstream is available
+        """
+        encoded = self._last_encoded
+        if encoded is None:
+            return None
+        return cv2.imdecode(encoded, cv2.IMREAD_COLOR)
+
+    def grab(self) -> bool:
+        return self.isOpened() and self.cap.grab()
+
+    def retrieve(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        if self.decode_scale == 1:
+            return self.cap.retrieve(image)
+
+        success, encoded = self.cap.retrieve()
+        if not success or encoded is None:
+            return False, None
+
+        if encoded.ndim == 3:
+            # The backend ignored CONVERT_RGB=0 and already decoded the frame - stop asking
+            print("Camera backend does not expose MJPEG frames, using full decode")
+            self.set_decode_scale(1)
+            if image is not None and image.shape == encoded.shape:
+                np.copyto(image, encoded)
+                return True, image
+            return True, encoded
+
+        self._last_encoded = encoded
+        frame = cv2.imdecode(encoded, self.REDUCED_DECODE_FLAGS[self.decode_scale])
+        if frame is None:
+            return False, None
+        if image is not None and image.shape == frame.shape:
+            np.copyto(image, frame)
+            return True, image
+        return True, frame
+
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self.isOpened():
+            return False, None
+        if self.decode_scale != 1:
+            return self.retrieve(image) if self.cap.grab() else (False, None)
+        return self.cap.read(image)
+
+    def set(self, prop: int, value: float) -> bool:
+        return self.cap.set(prop, value)
+
+    def get(self, prop: int) -> float:
+        return self.cap.get(prop)
+
+    def getBackendName(self) -> str:
+        return self.cap.getBackendName()
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+
+class VideoFileFrameSource(FrameSource):
+    """Frames decoded from a video file, optionally looped."""
+
+    def __init__(self, path: str, realtime: bool = True, loop: bool = True):
+        """
+        Args:
+            path: Path to the video file
+            realtime: Deliver frames at the file's frame rate instead of as fast as possible
+            loop: Restart from the beginning at the end of the file
+        """
+        super().__init__(realtime=realtime)
+        self.path = path
+        self.loop = loop
+        self.cap = None
+
+    def open(self) -> bool:
+        self.cap = cv2.VideoCapture(self.path)
+        if not self.cap.isOpened():
+            return False
+        file_fps = self.cap.get(cv2.CAP_PROP_FPS)
+        if file_fps and file_fps > 0:
+            self.fps = file_fps
+        return True
+
+    def isOpened(self) -> bool:
+        return self.cap is not None and self.cap.isOpened()
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        success, frame = self.cap.read()
+        if not success and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            success, frame = self.cap.read()
+        return frame if success else None
+
+    def get(self, prop: int) -> float:
+        if self.cap is not None and prop != cv2.CAP_PROP_FPS:
+            return self.cap.get(prop)
+        return super().get(prop)
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+
+class ImageDirectoryFrameSource(FrameSource):
+    """Frames read from the images in a directory, in file name order."""
+
+    IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+    def __init__(self, directory: str, fps: float = 30.0, realtime: bool = True, loop: bool = True):
+        """
+        Args:
+            directory: Directory containing the images
+            fps: Rate at which images are delivered in realtime mode
+            realtime: Deliver frames at fps instead of as fast as possible
+            loop: Restart from the first image after the last one
+        """
+        super().__init__(fps=fps, realtime=realtime)
+        self.directory = directory
+        self.loop = loop
+        self.paths: List[str] = []
+        self._index = 0
+        self._frame_size = (0, 0)
+
+    def open(self) -> bool:
+        self.paths = sorted(
+            path for path in glob.glob(os.path.join(os.path.expanduser(self.directory), '*'))
+            if path.lower().endswith(self.IMAGE_EXTENSIONS)
+        )
+        self._index = 0
+        return len(self.paths) > 0
+
+    def isOpened(self) -> bool:
+        return len(self.paths) > 0
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        # Skip unreadable files rather than ending the stream
+        for _ in range(len(self.paths)):
+            if self._index >= len(self.paths):
+                if not self.loop:
+                    return None
+                self._index = 0
+
+            frame = cv2.imread(self.paths[self._index])
+            self._index += 1
+            if frame is not None:
+                self._frame_size = (frame.shape[1], frame.shape[0])
+                return frame
+        return None
+
+    def get(self, prop: int) -> float:
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return self._frame_size[0]
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return self._frame_size[1]
+        return super().get(prop)
+
+    def release(self):
+        self.paths = []
+
+
+class SyntheticFrameSource(FrameSource):
+    """
+    In-memory generated frames - a noisy background with moving blobs.
+    Useful for measuring pipeline throughput on machines without a camera.
+    """
+
+    def __init__(self, width: int = 1280, height: int = 720, fps: float = 30.0,
+                 realtime: bool = True, num_objects: int = 2, seed: int = 0):
+        """
+        Args:
+            width: Frame width
+            height: Frame height
+            fps: Rate at which frames are delivered in realtime mode
+            realtime: Deliver frames at fps instead of as fast as possible
+            num_objects: Number of moving blobs drawn into each frame
+            seed: Random seed for the background noise and blob paths
+        """
+        super().__init__(fps=fps, realtime=realtime)
+        self.width = int(width)
+        self.height = int(height)
+        self.num_objects = num_objects
+        self.seed = seed
+        self._background = None
+        self._frame_index = 0
+        self._phases = None
+
+    def open(self) -> bool:
+        rng = np.random.default_rng(self.seed)
+        self._background = rng.integers(40, 80, size=(self.height, self.width, 3), dtype=np.uint8)
+        self._phases = rng.uniform(0, 2 * np.pi, size=(self.num_objects, 2))
+        self._frame_index = 0
+        return True
+
+    def isOpened(self) -> bool:
+        return self._background is not None
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        frame = self._background.copy()
+        t = self._frame_index / max(self.fps, 1.0)
+        radius = max(8, min(self.width, self.height) // 10)
+
+        for i, (phase_x, phase_y) in enumerate(self._phases):
+            cx = int((0.5 + 0.35 * np.sin(0.5 * t + phase_x)) * self.width)
+            cy = int((0.5 + 0.35 * np.sin(0.7 * t + phase_y)) * self.height)
+            cv2.circle(frame, (cx, cy), radius, (170, 190, 220), -1)
+
+        self._frame_index += 1
+        return frame
+
+    def set(self, prop: int, value: float) -> bool:
+        # Accept resolution changes so resolution negotiation behaves like a camera
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            self.width = int(value)
+        elif prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            self.height = int(value)
+        else:
+            return False
+        if self.isOpened():
+            self.open()
+        return True
+
+    def get(self, prop: int) -> float:
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return self.width
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return self.height
+        return super().get(prop)
+
+    def release(self):
+        self._background = None
+
+
+def create_frame_source(spec: str, realtime: bool = True) -> FrameSource:
+    """
+    Create a frame source from a command line style specification.
+
+    Args:
+        spec: One of 'camera:<id>', 'video:<path>', 'images:<directory>' or
+              'synthetic[:<width>x<height>]'
+        realtime: Deliver recorded/generated frames at their frame rate instead of as fast as possible
+
+    Returns:
+        FrameSource: The configured source (not yet opened)
+
+    Raises:
+        ValueError: If the specification is not recognised
+    """
+    kind, _, argument = spec.partition(':')
+    kind = kind.lower()
+
+    if kind == 'camera':
+        return CameraFrameSource(int(argument or 0))
+    if kind == 'video':
+        return VideoFileFrameSource(argument, realtime=realtime)
+    if kind == 'images':
+        return ImageDirectoryFrameSource(argument, realtime=realtime)
+    if kind == 'synthetic':
+        if argument:
+            width, height = (int(v) for v in argument.lower().split('x'))
+            return SyntheticFrameSource(width, height, realtime=realtime)
+        return SyntheticFrameSource(realtime=realtime)
+
+    raise ValueError(f"Unsupported frame source: {spec}")
@@ -0,0 +1,109 @@
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+
+class AdaptiveInputSize:
+    """
+    Chooses the YuNet input size (longer side, in pixels) from the faces seen recently.
+
+    YuNet's cost grows with the square of its input size, but the size only needs to
+    be large enough for the smallest face in view to stay detectable. The size shrinks
+    while every face is large (someone sitting close to the camera) and grows when
+    small faces were seen recently or nothing has been found for a while, so someone
+    further away is not missed.
+    """
+
+    def __init__(self, min_size: int = 224, max_size: int = 640, initial_size: int = 340,
+                 target_face_size: float = 32.0, small_face_size: float = 20.0,
+                 small_face_memory: float = 10.0, empty_grow_after: float = 3.0,
+                 grow_factor: float = 1.25, smoothing: float = 0.5):
+        """
+        Args:
+            min_size: Smallest input size
+            max_size: Largest input size
+            initial_size: Input size before anything has been observed
+            target_face_size: Width in input pixels the smallest face should have
+            small_face_size: Faces narrower than this in input pixels count as small
+            small_face_memory: Seconds after a small face during which the size does not shrink
+            empty_grow_after: Seconds without any face after which the size grows
+            grow_factor: Growth per observation while no face is found
+            smoothing: Fraction of the way towards the wanted size moved per observation
+        """
+        self.min_size = min_size
+        self.max_size = max_size
+        self.initial_size = initial_size
+        self.target_face_size = target_face_size
+        self.small_face_size = small_face_size
+        self.small_face_memory = small_face_memory
+        self.empty_grow_after = empty_grow_after
+        self.grow_factor = grow_factor
+        self.smoothing = smoothing
+
+        self.reset()
+
+    @property
+    def size(self) -> int:
+        """Current input size, a multiple of 16 within the bounds."""
+        size = int(round(self._size / 16.0)) * 16
+        return int(np.clip(size, self.min_size, self.max_size))
+
+    def observe(self, detections: np.ndarray, frame_size: int) -> int:
+        """
+        Update the input size from a detector run.
+
+        Args:
+            detections: YuNet rows in frame pixel coordinates, shape (N, 15)
+            frame_size: Longer side of the frame in pixels
+
+        Returns:
+            int: Input size for the next detector run
+        """
+        now = time.monotonic()
+
+        if len(detections):
+            self._last_face_time = now
+            smallest = max(1.0, float(np.min(detections[:, 2])))
+
+            if smallest * self.size / frame_size < self.small_face_size:
+                self._last_small_face_time = now
+
+            # Input size at which the smallest face is target_face_size wide
+            wanted = self.target_face_size * frame_size / smallest
+            if now - self._last_small_face_time < self.small_face_memory:
+                wanted = max(wanted, self._size)
+        elif now - self._last_face_time >= self.empty_grow_after:
+            wanted = self._size * self.grow_factor
+        else:
+            return self.size
+
+        self._size += (wanted - self._size) * self.smoothing
+        self._size = float(np.clip(self._size, self.min_size, self.max_size))
+        return self.size
+
+    def reset(self):
+        """Return to the initial size and forget the observed faces."""
+        self._size = float(self.initial_size)
+        now = time.monotonic()
+        self._last_face_time = now
+        self._last_small_face_time = -self.small_face_memory
+
+    def update_settings(self, min_size: int = None, max_size: int = None):
+        """Change the size bounds."""
+        if min_size is not None:
+            self.min_size = min_size
+        if max_size is not None:
+            self.max_size = max_size
+        self._size = float(np.clip(self._size, self.min_size, self.max_size))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict: Current input size and its bounds
+        """
+        return {
+            "input_size": self.size,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+        }
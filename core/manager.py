@@ -64,7 +64,8 @@ class DetectionManagerThread(QThread):
 			"alert_count": 0,
 			"last_detection_time": None,
 			"session_start_time": None,
-			"face_counts": {}  # History of face counts
+			"face_counts": {},  # History of face counts
+			"pipeline": {}  # Frame pipeline counters (submitted/processed/dropped frames, scheduler state)
 		}
 	
 	def _setup_logger(self):
@@ -244,6 +245,17 @@ class DetectionManagerThread(QThread):
 		self.current_face_count = face_count
 		self.mutex.unlock()
 	
+	def update_pipeline_stats(self, pipeline_stats: Dict[str, Any]):
+		"""
+		Update the frame pipeline statistics included in stats_updated.
+
+		Args:
+			pipeline_stats: Counters published by the detection worker
+		"""
+		self.mutex.lock()
+		self.stats["pipeline"] = dict(pipeline_stats)
+		self.mutex.unlock()
+
 	def update_settings(self, settings: Dict[str, Any]):
 		"""
 		Update detection manager settings.
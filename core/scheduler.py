@@ -0,0 +1,176 @@
+import threading
+import time
+from typing import Dict, Any
+
+import numpy as np
+
+from utils.motion import make_thumbnail, mean_difference
+
+
+class AdaptiveFrameScheduler:
+	"""
+	Decides how often frames are processed.
+
+	In active mode frames are processed at the full rate. Once the scene has been stable -
+	the face count unchanged and at most face_threshold, and no motion - for idle_after
+	seconds, the scheduler drops to idle_fps. A change in the face count or motion above
+	motion_threshold switches straight back to active mode.
+	"""
+
+	MODE_ACTIVE = "active"
+	MODE_IDLE = "idle"
+
+	def __init__(self, active_fps: float = 33.0, idle_fps: float = 2.0, idle_after: float = 10.0,
+				 face_threshold: int = 1, motion_threshold: float = 6.0, enabled: bool = False):
+		"""
+		Initialize the scheduler.
+
+		Args:
+			active_fps: Processing rate while the scene is changing
+			idle_fps: Processing rate while the scene is stable
+			idle_after: Seconds the scene must be stable before switching to idle
+			face_threshold: Face counts above this always keep the scheduler active
+			motion_threshold: Mean absolute thumbnail difference (0-255) counted as motion
+			enabled: If False the scheduler always stays active
+		"""
+		self.active_fps = active_fps
+		self.idle_fps = idle_fps
+		self.idle_after = idle_after
+		self.face_threshold = face_threshold
+		self.motion_threshold = motion_threshold
+		self.enabled = enabled
+
+		self._lock = threading.Lock()
+		self._mode = self.MODE_ACTIVE
+		self._last_face_count = None
+		self._stable_since = None
+		self._last_observation = None
+		self._effective_fps = 0.0
+		self._last_thumbnail = None
+		self._last_motion = 0.0
+		self._mode_switches = 0
+
+	@property
+	def mode(self) -> str:
+		"""Current mode, MODE_ACTIVE or MODE_IDLE."""
+		with self._lock:
+			return self._mode
+
+	@property
+	def interval_ms(self) -> int:
+		"""Frame processing interval for the current mode in milliseconds."""
+		with self._lock:
+			fps = self.idle_fps if self._mode == self.MODE_IDLE else self.active_fps
+		return max(1, int(1000.0 / max(fps, 0.1)))
+
+	def measure_motion(self, frame: np.ndarray) -> float:
+		"""
+		Compare a small grayscale thumbnail of the frame with the previous one.
+
+		Args:
+			frame: BGR frame
+
+		Returns:
+			float: Mean absolute pixel difference (0 for the first frame)
+		"""
+		thumbnail = make_thumbnail(frame)
+
+		with self._lock:
+			previous = self._last_thumbnail
+			self._last_thumbnail = thumbnail
+
+		if previous is None:
+			return 0.0
+		return mean_difference(thumbnail, previous)
+
+	def observe(self, face_count: int, motion: float = 0.0) -> str:
+		"""
+		Record the result of a processed frame and update the mode.
+
+		Args:
+			face_count: Number of faces (or people looking) in the frame
+			motion: Motion score of the frame from measure_motion
+
+		Returns:
+			str: The mode after this observation
+		"""
+		now = time.monotonic()
+
+		with self._lock:
+			# Effective processing rate, smoothed over the last few frames
+			if self._last_observation is not None:
+				elapsed = now - self._last_observation
+				if elapsed > 0:
+					instant_fps = 1.0 / elapsed
+					self._effective_fps = (instant_fps if self._effective_fps == 0.0
+										   else 0.8 * self._effective_fps + 0.2 * instant_fps)
+			self._last_observation = now
+			self._last_motion = motion
+
+			changed = (face_count != self._last_face_count
+					   or face_count > self.face_threshold
+					   or motion > self.motion_threshold)
+			self._last_face_count = face_count
+
+			if changed or not self.enabled:
+				self._stable_since = now
+				new_mode = self.MODE_ACTIVE
+			else:
+				if self._stable_since is None:
+					self._stable_since = now
+				new_mode = self.MODE_IDLE if now - self._stable_since >= self.idle_after else self._mode
+
+			if new_mode != self._mode:
+				self._mode = new_mode
+				self._mode_switches += 1
+
+			return self._mode
+
+	def update_settings(self, settings: Dict[str, Any]):
+		"""
+		Update scheduler settings.
+
+		Args:
+			settings: Settings dict - uses adaptive_frame_rate, idle_fps, idle_after_seconds
+				and face_threshold if present
+		"""
+		with self._lock:
+			if 'adaptive_frame_rate' in settings:
+				self.enabled = bool(settings['adaptive_frame_rate'])
+				if not self.enabled:
+					self._mode = self.MODE_ACTIVE
+			if 'idle_fps' in settings:
+				self.idle_fps = float(settings['idle_fps'])
+			if 'idle_after_seconds' in settings:
+				self.idle_after = float(settings['idle_after_seconds'])
+			if 'face_threshold' in settings:
+				self.face_threshold = settings['face_threshold']
+
+	def reset(self):
+		"""Return to active mode and forget the scene history, e.g. when monitoring restarts."""
+		with self._lock:
+			self._mode = self.MODE_ACTIVE
+			self._last_face_count = None
+			self._stable_since = None
+			self._last_observation = None
+			self._effective_fps = 0.0
+			self._last_thumbnail = None
+			self._last_motion = 0.0
+			self._mode_switches = 0
+
+	def get_stats(self) -> Dict[str, Any]:
+		"""
+		Get the scheduler state.
+
+		Returns:
+			Dict: Mode, target and effective frame rate, last motion score and mode switch count
+		"""
+		with self._lock:
+			target_fps = self.idle_fps if self._mode == self.MODE_IDLE else self.active_fps
+			return {
+				"mode": self._mode,
+				"target_fps": target_fps,
+				"effective_fps": self._effective_fps,
+				"motion": self._last_motion,
+				"mode_switches": self._mode_switches,
+			}
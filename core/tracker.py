@@ -0,0 +1,415 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from utils.motion import make_thumbnail
+
+
+def iou_matrix(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    Pairwise intersection over union of two sets of [x, y, w, h] boxes.
+
+    Args:
+        boxes_a: Array of shape (N, 4)
+        boxes_b: Array of shape (M, 4)
+
+    Returns:
+        np.ndarray: IoU matrix of shape (N, M)
+    """
+    a = boxes_a[:, None, :]
+    b = boxes_b[None, :, :]
+    inter_w = np.clip(np.minimum(a[..., 0] + a[..., 2], b[..., 0] + b[..., 2]) - np.maximum(a[..., 0], b[..., 0]), 0, None)
+    inter_h = np.clip(np.minimum(a[..., 1] + a[..., 3], b[..., 1] + b[..., 3]) - np.maximum(a[..., 1], b[..., 1]), 0, None)
+    intersection = inter_w * inter_h
+    union = a[..., 2] * a[..., 3] + b[..., 2] * b[..., 3] - intersection
+    return intersection / np.maximum(union, 1e-6)
+
+
+class Track:
+    """
+    A face followed across frames.
+
+    The face is stored as a YuNet detection row in frame pixel coordinates -
+    [x, y, w, h, 5 landmark (x, y) pairs, score] - so tracked faces can be handled
+    exactly like fresh detections.
+    """
+
+    def __init__(self, track_id: int, detection: np.ndarray):
+        """
+        Args:
+            track_id: Identifier that stays with the face while it is tracked
+            detection: YuNet detection row in frame pixel coordinates
+        """
+        self.track_id = track_id
+        self.detection = np.array(detection, dtype=np.float32)
+        self.hits = 1  # Detector runs that found this face
+        self.misses = 0  # Consecutive detector runs that did not find it
+        self.lost = False  # Optical flow could not follow it since the last detector run
+        self.points: Optional[np.ndarray] = None  # Flow points on the small frame, shape (K, 1, 2)
+
+    @property
+    def bbox(self) -> Tuple[int, int, int, int]:
+        """Bounding box as integer (x, y, w, h)."""
+        x, y, w, h = self.detection[:4]
+        return int(x), int(y), int(w), int(h)
+
+    @property
+    def visible(self) -> bool:
+        """Whether the face was found by the last detector run."""
+        return self.misses == 0
+
+
+class FaceTracker:
+    """
+    Keeps stable IDs for faces and moves their boxes between detector runs.
+
+    On frames without a detector run each face's box and landmarks are moved with
+    sparse Lucas-Kanade optical flow on a small grayscale copy of the frame, which
+    costs a fraction of a YuNet pass. The detector runs every detect_interval frames,
+    when a track cannot be followed, and when something changes outside the tracked
+    faces (e.g. a new person walking in). Its detections are associated with the
+    existing tracks by IoU, falling back to centroid distance for fast movement.
+
+    Faces narrower than min_detectable_size (found by a search the regular detector run
+    cannot match, e.g. a tiled full-resolution sweep) are held: the regular detector
+    run neither drops them when it misses them nor is triggered when optical flow
+    cannot follow them. Only a full_search update can drop them.
+    """
+
+    # Why begin_frame() asked for a detector run (see trigger)
+    TRIGGER_START = "start"  # No tracking state yet
+    TRIGGER_INTERVAL = "interval"  # detect_interval frames since the last run
+    TRIGGER_LOST = "lost"  # A visible face could not be followed
+    TRIGGER_MOTION = "motion"  # Something changed outside the tracked faces
+
+    def __init__(self, detect_interval: int = 5, iou_threshold: float = 0.3, max_misses: int = 1,
+                 flow_width: int = 160, motion_threshold: float = 0.01, min_points: int = 4):
+        """
+        Args:
+            detect_interval: Run the detector at least every this many frames
+            iou_threshold: Minimum IoU to associate a detection with a track
+            max_misses: Detector runs a track survives without being found, so a single
+                missed detection does not change a face's ID
+            flow_width: Width of the grayscale frame used for optical flow
+            motion_threshold: Fraction of changed thumbnail pixels outside the tracked faces
+                that triggers a detector run
+            min_points: Fewest followed flow points for a track to count as tracked
+        """
+        self.detect_interval = max(1, int(detect_interval))
+        self.iou_threshold = iou_threshold
+        self.max_misses = max_misses
+        self.flow_width = flow_width
+        self.motion_threshold = motion_threshold
+        self.min_points = min_points
+
+        self.tracks: List[Track] = []
+        self._next_id = 1
+        self._frames_since_detection = 0
+        self._small: Optional[np.ndarray] = None  # Small grayscale copy of the current frame
+        self._previous_small: Optional[np.ndarray] = None
+        self._flow_scale = 1.0  # Small frame pixels per frame pixel
+        self._reference_thumbnail: Optional[np.ndarray] = None  # Thumbnail at the last detector run
+        self.trigger: Optional[str] = None  # Reason for the current frame's detector run, if any
+        # Width in frame pixels below which the regular detector run cannot find a face
+        self.min_detectable_size = 0.0
+
+        self.stats = {
+            "detector_frames": 0,
+            "tracked_frames": 0,
+            "tracks_created": 0,
+        }
+
+    # ---- Per-frame API ----
+
+    def begin_frame(self, frame: np.ndarray) -> bool:
+        """
+        Move the tracks onto a new frame and decide whether the detector has to run.
+
+        Args:
+            frame: BGR frame
+
+        Returns:
+            bool: True if the detector should run on this frame (followed by update()),
+                False if the tracked boxes can be used as they are
+        """
+        h, w = frame.shape[:2]
+        self._flow_scale = min(1.0, self.flow_width / float(w))
+        small_size = (max(1, int(round(w * self._flow_scale))), max(1, int(round(h * self._flow_scale))))
+        small = cv2.resize(frame, small_size, interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+        self._previous_small, self._small = self._small, small
+        self._frames_since_detection += 1
+
+        if self._previous_small is None or self._previous_small.shape != small.shape:
+            # First frame or resolution change - start over
+            self.tracks = []
+            self._reference_thumbnail = None
+            return self._detector_needed()
+
+        self._propagate()
+
+        if self._detector_needed():
+            return True
+
+        self.stats["tracked_frames"] += 1
+        return False
+
+    def update(self, detections: np.ndarray, full_search: bool = False):
+        """
+        Associate the detector's results for the current frame with the tracks.
+
+        Args:
+            detections: YuNet detection rows in frame pixel coordinates, shape (N, 15)
+            full_search: The detections come from a search that finds faces of any size, so
+                held faces it misses count as missed too
+        """
+        detections = np.asarray(detections, dtype=np.float32).reshape(-1, 15)
+        matched_tracks, matched_detections = self._associate(detections)
+
+        for track_index, detection_index in zip(matched_tracks, matched_detections):
+            track = self.tracks[track_index]
+            track.detection = detections[detection_index].copy()
+            track.hits += 1
+            track.misses = 0
+            track.lost = False
+
+        kept = []
+        for index, track in enumerate(self.tracks):
+            if index not in matched_tracks and (full_search or self._detectable(track)):
+                track.misses += 1
+                if track.misses > self.max_misses:
+                    continue
+            kept.append(track)
+
+        for index in range(len(detections)):
+            if index not in matched_detections:
+                kept.append(Track(self._next_id, detections[index]))
+                self._next_id += 1
+                self.stats["tracks_created"] += 1
+
+        self.tracks = kept
+        for track in self.tracks:
+            self._seed_points(track)
+
+        self._frames_since_detection = 0
+        self._reference_thumbnail = make_thumbnail(self._small)
+        self.stats["detector_frames"] += 1
+
+    def detections(self) -> np.ndarray:
+        """
+        Get the visible faces of the current frame.
+
+        Returns:
+            np.ndarray: YuNet detection rows in frame pixel coordinates, shape (N, 15)
+        """
+        rows = [track.detection for track in self.tracks if track.visible]
+        return np.array(rows, dtype=np.float32) if rows else np.empty((0, 15), dtype=np.float32)
+
+    def known_boxes(self) -> List[Tuple[int, int, int, int]]:
+        """Boxes of all tracks, including faces the last detector run missed."""
+        return [track.bbox for track in self.tracks]
+
+    @property
+    def track_ids(self) -> List[int]:
+        """IDs of the visible faces, in the order of detections()."""
+        return [track.track_id for track in self.tracks if track.visible]
+
+    def reset(self):
+        """Drop all tracks, so the next frame runs the detector, and reset the statistics."""
+        self.tracks = []
+        self._small = None
+        self._previous_small = None
+        self._reference_thumbnail = None
+        self._frames_since_detection = 0
+        for key in self.stats:
+            self.stats[key] = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get tracking statistics.
+
+        Returns:
+            Dict: Visible tracks, frames with and without a detector run, and the fraction
+                of frames that ran the detector
+        """
+        stats = self.stats.copy()
+        total = stats["detector_frames"] + stats["tracked_frames"]
+        stats["tracks"] = sum(1 for track in self.tracks if track.visible)
+        stats["detector_ratio"] = stats["detector_frames"] / total if total else 0.0
+        return stats
+
+    # ---- Internal helpers ----
+
+    def _detector_needed(self) -> bool:
+        """Whether the tracked boxes can no longer be trusted for the current frame, sets trigger."""
+        if self._reference_thumbnail is None:
+            self.trigger = self.TRIGGER_START
+        elif self._frames_since_detection >= self.detect_interval:
+            self.trigger = self.TRIGGER_INTERVAL
+        elif any(track.lost for track in self.tracks if track.visible and self._detectable(track)):
+            self.trigger = self.TRIGGER_LOST
+        elif self._untracked_motion() > self.motion_threshold:
+            self.trigger = self.TRIGGER_MOTION
+        else:
+            self.trigger = None
+        return self.trigger is not None
+
+    def _detectable(self, track: Track) -> bool:
+        """Whether a regular detector run can find the track's face."""
+        return track.detection[2] >= self.min_detectable_size
+
+    def _untracked_motion(self) -> float:
+        """Fraction of thumbnail pixels outside the tracked faces that changed since the last detector run."""
+        thumbnail = make_thumbnail(self._small)
+        if thumbnail.shape != self._reference_thumbnail.shape:
+            return 1.0
+
+        changed = cv2.absdiff(thumbnail, self._reference_thumbnail) > 12
+
+        # Movement of the tracked faces themselves is handled by the flow
+        thumb_h, thumb_w = thumbnail.shape[:2]
+        small_h, small_w = self._small.shape[:2]
+        scale_x = thumb_w / float(small_w) * self._flow_scale
+        scale_y = thumb_h / float(small_h) * self._flow_scale
+        for track in self.tracks:
+            x, y, w, h = track.detection[:4]
+            # Pad by half a box so the previous position is masked as well
+            x0 = max(0, int((x - w / 2) * scale_x))
+            y0 = max(0, int((y - h / 2) * scale_y))
+            x1 = int((x + w * 1.5) * scale_x) + 1
+            y1 = int((y + h * 1.5) * scale_y) + 1
+            changed[y0:y1, x0:x1] = False
+
+        return float(np.count_nonzero(changed)) / changed.size
+
+    def _propagate(self):
+        """Move every track's box and landmarks with the optical flow of its points."""
+        tracks = [track for track in self.tracks if track.points is not None and len(track.points)]
+        for track in self.tracks:
+            if track.points is None or not len(track.points):
+                track.lost = True
+        if not tracks:
+            return
+
+        # One flow call for the points of all tracks
+        old_points = np.concatenate([track.points for track in tracks])
+        new_points, status, _ = cv2.calcOpticalFlowPyrLK(
+            self._previous_small, self._small, old_points, None, winSize=(15, 15), maxLevel=2)
+        status = status.reshape(-1).astype(bool)
+
+        small_h, small_w = self._small.shape[:2]
+        start = 0
+        for track in tracks:
+            end = start + len(track.points)
+            ok = status[start:end]
+            old = old_points[start:end][ok].reshape(-1, 2)
+            new = new_points[start:end][ok].reshape(-1, 2)
+            start = end
+
+            if len(new) < self.min_points:
+                track.lost = True
+                track.points = None
+                continue
+
+            # Median translation and scale change, robust to a few badly tracked points
+            shift = np.median(new - old, axis=0)
+            old_spread = np.linalg.norm(old - np.median(old, axis=0), axis=1)
+            new_spread = np.linalg.norm(new - np.median(new, axis=0), axis=1)
+            valid = old_spread > 1e-3
+            scale = float(np.median(new_spread[valid] / old_spread[valid])) if np.any(valid) else 1.0
+            scale = float(np.clip(scale, 0.8, 1.25))
+
+            self._apply_motion(track, shift / self._flow_scale, scale)
+            track.points = new.reshape(-1, 1, 2).astype(np.float32)
+
+            # A face that left the frame cannot be followed any further
+            x, y, w, h = track.detection[:4] * self._flow_scale
+            if x + w < 0 or y + h < 0 or x > small_w or y > small_h:
+                track.lost = True
+
+    @staticmethod
+    def _apply_motion(track: Track, shift: np.ndarray, scale: float):
+        """Translate and scale a track's box and landmarks about the box centre."""
+        detection = track.detection
+        x, y, w, h = detection[:4]
+        cx, cy = x + w / 2.0, y + h / 2.0
+        new_cx, new_cy = cx + shift[0], cy + shift[1]
+
+        landmarks = detection[4:14].reshape(5, 2)
+        landmarks[:, 0] = (landmarks[:, 0] - cx) * scale + new_cx
+        landmarks[:, 1] = (landmarks[:, 1] - cy) * scale + new_cy
+
+        new_w, new_h = w * scale, h * scale
+        detection[0] = new_cx - new_w / 2.0
+        detection[1] = new_cy - new_h / 2.0
+        detection[2] = new_w
+        detection[3] = new_h
+
+    def _seed_points(self, track: Track):
+        """Pick the points optical flow follows for a track, inside its box on the small frame."""
+        small_h, small_w = self._small.shape[:2]
+        x, y, w, h = track.detection[:4] * self._flow_scale
+        # Inner part of the box - the edges are mostly background
+        x0 = int(max(0, x + w * 0.15))
+        y0 = int(max(0, y + h * 0.15))
+        x1 = int(min(small_w, x + w * 0.85))
+        y1 = int(min(small_h, y + h * 0.85))
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            track.points = None
+            return
+
+        mask = np.zeros_like(self._small)
+        mask[y0:y1, x0:x1] = 255
+        points = cv2.goodFeaturesToTrack(self._small, maxCorners=20, qualityLevel=0.01, minDistance=2, mask=mask)
+
+        if points is None or len(points) < self.min_points:
+            # Small or smooth faces have few corners - follow a grid instead
+            grid_x, grid_y = np.meshgrid(np.linspace(x0, x1 - 1, 4), np.linspace(y0, y1 - 1, 4))
+            points = np.stack([grid_x.ravel(), grid_y.ravel()], axis=1).reshape(-1, 1, 2)
+
+        track.points = points.astype(np.float32)
+
+    def _associate(self, detections: np.ndarray) -> Tuple[List[int], List[int]]:
+        """
+        Greedily match detections to tracks, by IoU first and then by centroid distance.
+
+        Returns:
+            Tuple of (track indices, detection indices) of the matched pairs
+        """
+        matched_tracks: List[int] = []
+        matched_detections: List[int] = []
+        if not self.tracks or not len(detections):
+            return matched_tracks, matched_detections
+
+        track_boxes = np.array([track.detection[:4] for track in self.tracks], dtype=np.float32)
+        detection_boxes = detections[:, :4]
+
+        # Pass 1: overlap
+        ious = iou_matrix(track_boxes, detection_boxes)
+        for flat_index in np.argsort(-ious, axis=None):
+            track_index, detection_index = np.unravel_index(flat_index, ious.shape)
+            if ious[track_index, detection_index] < self.iou_threshold:
+                break
+            if track_index in matched_tracks or detection_index in matched_detections:
+                continue
+            matched_tracks.append(int(track_index))
+            matched_detections.append(int(detection_index))
+
+        # Pass 2: centroid distance, for faces that moved further than the flow followed
+        track_centres = track_boxes[:, :2] + track_boxes[:, 2:] / 2.0
+        detection_centres = detection_boxes[:, :2] + detection_boxes[:, 2:] / 2.0
+        distances = np.linalg.norm(track_centres[:, None, :] - detection_centres[None, :, :], axis=2)
+        for flat_index in np.argsort(distances, axis=None):
+            track_index, detection_index = (int(i) for i in np.unravel_index(flat_index, distances.shape))
+            if track_index in matched_tracks or detection_index in matched_detections:
+                continue
+            # Within one box size of the track
+            if distances[track_index, detection_index] > max(track_boxes[track_index, 2:]):
+                continue
+            matched_tracks.append(track_index)
+            matched_detections.append(detection_index)
+
+        return matched_tracks, matched_detections
@@ -4,9 +4,15 @@ import cv2
 import platform
 import subprocess
 import json
+import threading
+import time
 import numpy as np
 from PyQt5.QtCore import QObject, pyqtSignal
 
+from core.frame_pool import FramePool, FrameBuffer
+from core.frame_source import FrameSource, CameraFrameSource
+from utils.camera_cache import CameraCapabilityCache
+
 
 class WebcamManager(QObject):
     """
@@ -18,12 +24,33 @@ class WebcamManager(QObject):
     # Signal emitted when an error occurs
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, camera_id: int = 0):
+    # Capture modes
+    CAPTURE_MODE_FULL = "full"            # Stream at the highest available resolution
+    CAPTURE_MODE_DETECTION = "detection"  # Stream at a detection-sized resolution, full resolution on demand
+
+    def __init__(self, camera_id: int = 0, threaded_capture: bool = False,
+                 capture_mode: str = CAPTURE_MODE_FULL, detection_min_side: int = 640,
+                 capability_cache: Optional[CameraCapabilityCache] = None,
+                 frame_source: Optional[FrameSource] = None, pooled_buffers: bool = False,
+                 reduced_decode: bool = False):
         """
         Initialize the webcam manager.
         
         Args:
             camera_id: ID of the camera to use
+            threaded_capture: If True, a background thread keeps grabbing frames into a
+                latest-frame slot so read_frame never blocks on the camera
+            capture_mode: 'full' to stream at the highest resolution, 'detection' to stream at
+                the smallest resolution whose longer side is at least detection_min_side
+            detection_min_side: Minimum longer side (pixels) of the detection stream
+            capability_cache: Optional on-disk cache of probed camera capabilities
+            frame_source: Optional source to read frames from instead of camera camera_id
+                (video file, image directory, synthetic frames)
+            pooled_buffers: In threaded capture mode, decode frames into reusable buffers from
+                a FramePool instead of allocating a new image per frame (see read_frame_buffer)
+            reduced_decode: In detection capture mode, stream the camera's full resolution as
+                MJPEG and decode it directly at 1/2, 1/4 or 1/8 scale instead of negotiating a
+                lower resolution; full resolution frames are then decoded from the same stream
         """
         super().__init__()
         self.camera_id = camera_id
@@ -32,78 +59,518 @@ class WebcamManager(QObject):
         self.cap = None
         self.is_running = False
         self.available_resolutions = []
+        self.capability_cache = capability_cache
+        self.frame_source = frame_source
+
+        # Resolution of the steady-state stream and the highest resolution the camera supports
+        self.capture_mode = capture_mode
+        self.detection_min_side = detection_min_side
+        self.stream_resolution = None
+        self.full_resolution = None
+
+        # Reduced-scale MJPEG decoding - decode_scale is the active scale (1 = normal decoding)
+        self.reduced_decode = reduced_decode
+        self.decode_scale = 1
+        self._reduced_decode_unsupported = False
+
+        # Serialises access to the capture device between the capture thread and on-demand
+        # full resolution grabs; _hold_capture asks the capture thread to yield the device
+        self._cap_lock = threading.Lock()
+        self._hold_capture = threading.Event()
+
+        # Threaded capture state - a single "latest frame" slot, older frames are overwritten
+        self.threaded_capture = threaded_capture
+        self._capture_thread = None
+        self._frame_condition = threading.Condition()
+        self._latest_frame = None
+        self._latest_seq = 0
+        self._latest_timestamp = 0.0
+        self._last_read_seq = 0
+
+        # Pooled capture buffers - the slot holds a reference to the newest buffer
+        self.frame_pool = FramePool() if pooled_buffers and threaded_capture else None
+        self._latest_buffer = None
+        self._pool_shape = None
+
+        # Minimum seconds between decoded frames in threaded mode - frames in between are
+        # grabbed (so the driver buffer stays fresh) but not decoded
+        self.capture_interval = 0.0
     
     def start(self) -> bool:
         """
-        Start the webcam capture at highest available resolution.
+        Start the webcam capture at the resolution selected by the capture mode.
         
         Returns:
             bool: True if started successfully, False otherwise
         """
         try:
-            self.cap = cv2.VideoCapture(self.camera_id)
-            if not self.cap.isOpened():
-                self.error_occurred.emit(f"Cannot open camera with ID {self.camera_id}")
+            self.cap = self.frame_source if self.frame_source is not None else CameraFrameSource(self.camera_id)
+            if not self.cap.open():
+                if self.cap.is_live:
+                    self.error_occurred.emit(f"Cannot open camera with ID {self.cap.camera_id}")
+                else:
+                    self.error_occurred.emit(f"Cannot open frame source {self.cap.getBackendName()}")
+                self.cap = None
                 return False
-            
-            # Detect available resolutions
-            self._detect_available_resolutions()
-            
-            # Use the highest available resolution
-            if self.available_resolutions:
-                # Get the highest resolution (last in sorted list)
-                best_width, best_height = self.available_resolutions[-1]
-                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, best_width)
-                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, best_height)
-                
-                # Verify actual resolution set
-                self.frame_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                self.frame_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                
-                print(f"Camera initialized at highest resolution: {self.frame_width}x{self.frame_height}")
+
+            self.decode_scale = 1
+            self._reduced_decode_unsupported = False
+
+            # Reuse previously probed capabilities - probing renegotiates the stream each time
+            cache_key = self._get_capability_cache_key()
+            cached = self.capability_cache.get(cache_key) if cache_key is not None else None
+            native_resolution = device_name = None
+            if cache_key is not None:
+                # Before any renegotiation - the size the device opens at helps identify it
+                native_resolution = (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                                     int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+                if min(native_resolution) <= 0:
+                    native_resolution = None  # Not reported before the first frame
+                device_name = self._get_cached_device_name()
+            if cached and not CameraCapabilityCache.is_same_device(cached, native_resolution, device_name):
+                print("Cached camera capabilities belong to another device, probing again")
+                self.capability_cache.invalidate(cache_key)
+                cached = None
+
+            if cached:
+                self.available_resolutions = [tuple(r) for r in cached["resolutions"]]
+                print(f"Using cached camera capabilities: {self.available_resolutions}")
+            elif self.cap.is_live:
+                # Detect available resolutions
+                self._detect_available_resolutions()
             else:
-                # Fallback to current resolution if detection failed
-                self.frame_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                self.frame_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                print(f"Using default camera resolution: {self.frame_width}x{self.frame_height}")
+                # Recorded and generated sources have a fixed resolution
+                self.available_resolutions = []
+
+            self._apply_stream_resolution()
+
+            # A cached resolution the camera no longer accepts means the device changed
+            if cached and self.available_resolutions and self.stream_resolution != self._select_stream_resolution():
+                print("Cached camera capabilities are stale, probing again")
+                self.capability_cache.invalidate(cache_key)
+                cached = None
+                self._detect_available_resolutions()
+                self._apply_stream_resolution()
             
             # Optimize camera settings for better quality
-            self.optimize_camera_settings()
+            accepted_properties = {}
+            if self.cap.is_live:
+                accepted_properties = self.optimize_camera_settings(
+                    cached.get("properties") if cached else None,
+                    cached.get("fps") if cached else None
+                )
+
+            if cache_key is not None and not cached and self.available_resolutions:
+                self.capability_cache.put(cache_key, self.available_resolutions,
+                                          self.cap.get(cv2.CAP_PROP_FPS), accepted_properties,
+                                          native_resolution, device_name)
+
+            # After the camera settings - changing the codec can reset the raw output flag
+            self._apply_reduced_decode()
             
             self.is_running = True
+
+            if self.threaded_capture:
+                self._start_capture_thread()
+
             return True
             
         except Exception as e:
             self.error_occurred.emit(f"Error starting webcam: {e}")
             return False
-    
+
+    def _apply_stream_resolution(self):
+        """Set the stream resolution chosen by the capture mode and record what the camera accepted."""
+        if self.available_resolutions:
+            # Highest resolution is the last in the sorted list
+            self.full_resolution = self.available_resolutions[-1]
+            stream_width, stream_height = self._select_stream_resolution()
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, stream_width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, stream_height)
+
+            # Verify actual resolution set
+            self.frame_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            self.frame_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+            print(f"Camera initialized at {self.frame_width}x{self.frame_height} "
+                  f"({self.capture_mode} mode, full resolution {self.full_resolution[0]}x{self.full_resolution[1]})")
+        else:
+            # Fallback to current resolution if detection failed
+            self.frame_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            self.frame_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            self.full_resolution = (self.frame_width, self.frame_height)
+            print(f"Using default camera resolution: {self.frame_width}x{self.frame_height}")
+
+        self.stream_resolution = (self.frame_width, self.frame_height)
+
+    def _reduced_decode_available(self) -> bool:
+        """Whether reduced-scale MJPEG decoding should be used for the open camera."""
+        return (self.reduced_decode
+                and self.capture_mode == self.CAPTURE_MODE_DETECTION
+                and isinstance(self.cap, CameraFrameSource)
+                and not self._reduced_decode_unsupported
+                and bool(self.available_resolutions)
+                and self._select_decode_scale() > 1)
+
+    def _select_decode_scale(self) -> int:
+        """
+        Select the largest decode scale that keeps the detection frame's longer side at
+        least detection_min_side.
+
+        Returns:
+            int: 8, 4, 2, or 1 if the full resolution is too small to reduce
+        """
+        full_width, full_height = self.available_resolutions[-1]
+        for scale in (8, 4, 2):
+            if max(full_width, full_height) // scale >= self.detection_min_side:
+                return scale
+        return 1
+
+    def _apply_reduced_decode(self):
+        """
+        Switch the camera to reduced-scale MJPEG decoding if requested, verifying it with a
+        test frame. Falls back to a detection-sized stream if the backend cannot deliver MJPEG.
+        """
+        self.decode_scale = 1
+        if not self._reduced_decode_available():
+            return
+
+        scale = self._select_decode_scale()
+        if self.cap.set_decode_scale(scale):
+            success, frame = self.cap.read()
+            if success and frame is not None and self.cap.decode_scale == scale:
+                self.decode_scale = scale
+                self.frame_height, self.frame_width = frame.shape[:2]
+                print(f"Decoding MJPEG at 1/{scale} scale: {self.frame_width}x{self.frame_height} "
+                      f"from {self.stream_resolution[0]}x{self.stream_resolution[1]}")
+                return
+            self.cap.set_decode_scale(1)
+
+        print("Camera does not deliver MJPEG frames, streaming at detection resolution instead")
+        self._reduced_decode_unsupported = True
+        self._apply_stream_resolution()
+
+    def _get_capability_cache_key(self) -> Optional[str]:
+        """
+        Build the capability cache key for the open camera.
+
+        Returns:
+            Cache key, or None if no cache is configured or the camera was injected as a
+            frame source (its index need not be camera_id)
+        """
+        if not self.capability_cache or not self.cap.is_live or self.frame_source is not None:
+            return None
+
+        # Not the device name - looking it up (system_profiler on macOS) can take seconds,
+        # the entry records it when the camera enumerator already knows it
+        return CameraCapabilityCache.make_key(self.cap.getBackendName(), self.camera_id)
+
+    def _get_cached_device_name(self) -> Optional[str]:
+        """
+        Get the name of the current camera from the camera enumerator's cached list.
+
+        Does not enumerate - returns None if the list is empty or only has a generic name.
+
+        Returns:
+            Device name, or None if unknown
+        """
+        from core.camera_enumerator import get_camera_enumerator
+        for camera_info in get_camera_enumerator().get_cameras(refresh_if_stale=False):
+            if camera_info['id'] == self.camera_id and camera_info['name'] != f"Camera {self.camera_id}":
+                return camera_info['name']
+        return None
+
+    def invalidate_capabilities(self):
+        """Forget the cached capabilities of the current camera so the next start probes it again."""
+        if self.capability_cache and self.cap and self.cap.isOpened():
+            cache_key = self._get_capability_cache_key()
+            if cache_key is not None:
+                self.capability_cache.invalidate(cache_key)
+
     def stop(self):
         """Stop the webcam capture."""
         self.is_running = False
-        if self.cap and self.cap.isOpened():
-            self.cap.release()
-            self.cap = None
+
+        # Wake any reader waiting on the slot and let the capture thread finish before releasing
+        with self._frame_condition:
+            self._frame_condition.notify_all()
+        if self._capture_thread is not None:
+            self._capture_thread.join(timeout=2.0)
+            self._capture_thread = None
+
+        # A snapshot may still be reading at full resolution on another thread
+        with self._cap_lock:
+            if self.cap and self.cap.isOpened():
+                self.cap.release()
+                self.cap = None
+
+        self._set_latest_buffer(None)
+        with self._frame_condition:
+            self._latest_frame = None
     
     def read_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
         """
-        Read a frame from the webcam at full resolution.
+        Read a frame from the webcam at the stream resolution.
+
+        In threaded capture mode this never blocks: it returns the newest frame from the
+        latest-frame slot, or (False, None) if no new frame arrived since the last call.
         
         Returns:
             Tuple containing:
                 - Success flag
                 - Frame (if successful) or None (if failed)
         """
-        if not self.is_running or not self.cap or not self.cap.isOpened():
-            return False, None
-            
-        success, frame = self.cap.read()
-        if not success:
-            return False, None
+        if self.threaded_capture:
+            success, frame, seq, _ = self.read_latest(self._last_read_seq)
+            if not success:
+                return False, None
+            self._last_read_seq = seq
+        else:
+            if not self.is_running or not self.cap or not self.cap.isOpened():
+                return False, None
+
+            with self._cap_lock:
+                success, frame = self.cap.read()
+            if not success:
+                return False, None
         
-        # Always return full resolution frame - let display layer handle scaling
+        # Return the stream resolution frame - let display layer handle scaling
         self.frame_ready.emit(frame)
         
         return True, frame
+
+    def read_latest(self, after_seq: int = 0, timeout: Optional[float] = None) -> Tuple[bool, Optional[np.ndarray], int, float]:
+        """
+        Get the newest frame from the latest-frame slot (threaded capture mode only).
+
+        Args:
+            after_seq: Only return a frame whose sequence number is greater than this
+            timeout: Seconds to wait for a newer frame (None returns immediately)
+
+        Returns:
+            Tuple containing:
+                - Success flag
+                - Frame (if successful) or None
+                - Sequence number of the frame (monotonically increasing per start())
+                - Capture timestamp from time.monotonic()
+        """
+        with self._frame_condition:
+            if timeout is not None and self._latest_seq <= after_seq and self.is_running:
+                self._frame_condition.wait_for(
+                    lambda: self._latest_seq > after_seq or not self.is_running, timeout)
+
+            if self._latest_frame is None or self._latest_seq <= after_seq:
+                return False, None, self._latest_seq, self._latest_timestamp
+
+            frame = self._latest_frame
+            if self._latest_buffer is not None:
+                # Pooled buffers are recycled once released - callers of this API get their own copy
+                frame = frame.copy()
+            return True, frame, self._latest_seq, self._latest_timestamp
+
+    def read_frame_buffer(self, timeout: Optional[float] = None) -> Optional[FrameBuffer]:
+        """
+        Get the newest unseen frame as a pooled buffer without copying it (pooled threaded
+        capture only). Like read_frame this emits frame_ready.
+
+        The caller owns one reference to the returned buffer and must release() it (or hand
+        it on to something that does) when done; until then the buffer is not reused.
+
+        Args:
+            timeout: Seconds to wait for a new frame (None returns immediately)
+
+        Returns:
+            FrameBuffer, or None if no new frame arrived since the last call
+        """
+        with self._frame_condition:
+            if timeout is not None and self._latest_seq <= self._last_read_seq and self.is_running:
+                self._frame_condition.wait_for(
+                    lambda: self._latest_seq > self._last_read_seq or not self.is_running, timeout)
+
+            buffer = self._latest_buffer
+            if buffer is None or self._latest_seq <= self._last_read_seq:
+                return None
+            buffer.retain()
+            self._last_read_seq = self._latest_seq
+
+        self.frame_ready.emit(buffer.array)
+        return buffer
+
+    def capture_full_resolution_frame(self) -> Optional[np.ndarray]:
+        """
+        Capture a single frame at the camera's highest resolution.
+
+        In detection capture mode the stream is switched to full resolution for one frame
+        and then back, which pauses the stream briefly - use for snapshots, not per frame,
+        and call it off the GUI thread.
+
+        Returns:
+            Full resolution frame, or None if no frame could be captured
+        """
+        if not self.is_running or not self.cap or not self.cap.isOpened():
+            return None
+
+        if self.decode_scale > 1 and self.cap.decode_scale == 1:
+            # The frame source fell back to full decoding at runtime (see CameraFrameSource.retrieve)
+            self.decode_scale = 1
+            self._reduced_decode_unsupported = True
+
+        if self.decode_scale > 1:
+            # The stream is already full resolution MJPEG - decode the newest frame fully
+            return self.cap.decode_full_frame()
+
+        if self.full_resolution is None or self.full_resolution == self.stream_resolution:
+            # Already streaming at full resolution - the newest frame will do
+            if self.threaded_capture:
+                success, frame, _, _ = self.read_latest()
+                if not success:
+                    return None
+                return frame if self._latest_buffer is not None else frame.copy()
+            with self._cap_lock:
+                success, frame = self.cap.read()
+            return frame if success else None
+
+        self._hold_capture.set()
+        try:
+            with self._cap_lock:
+                if self.cap is None:
+                    return None  # Stopped while waiting for the lock
+                full_width, full_height = self.full_resolution
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, full_width)
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, full_height)
+
+                # The first frames after renegotiating can still have the old size
+                frame = None
+                for _ in range(5):
+                    success, candidate = self.cap.read()
+                    if success and candidate is not None and candidate.shape[1] == full_width:
+                        frame = candidate
+                        break
+
+                stream_width, stream_height = self.stream_resolution
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, stream_width)
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, stream_height)
+        finally:
+            self._hold_capture.clear()
+
+        return frame
+
+    def _select_stream_resolution(self) -> Tuple[int, int]:
+        """
+        Select the steady-state stream resolution for the current capture mode.
+
+        Returns:
+            Tuple of (width, height)
+        """
+        if self.capture_mode == self.CAPTURE_MODE_DETECTION and not self._reduced_decode_available():
+            # Smallest resolution that still leaves the detector enough pixels
+            for width, height in self.available_resolutions:
+                if max(width, height) >= self.detection_min_side:
+                    return width, height
+
+        return self.available_resolutions[-1]
+
+    def _start_capture_thread(self):
+        """Start the background thread that fills the latest-frame slot."""
+        self._set_latest_buffer(None)
+        with self._frame_condition:
+            self._latest_frame = None
+            self._latest_seq = 0
+            self._latest_timestamp = 0.0
+        self._last_read_seq = 0
+        self._pool_shape = (self.frame_height, self.frame_width, 3)
+
+        self._capture_thread = threading.Thread(target=self._capture_loop, name="EyesOffCapture", daemon=True)
+        self._capture_thread.start()
+
+    def _capture_loop(self):
+        """Keep grabbing frames so the driver buffer never holds stale frames."""
+        cap = self.cap
+        consecutive_failures = 0
+        last_decode = 0.0
+
+        while self.is_running and cap is not None:
+            # Yield the device while a full resolution frame is being captured
+            if self._hold_capture.is_set():
+                time.sleep(0.005)
+                continue
+
+            if self.capture_interval > 0 and time.monotonic() - last_decode < self.capture_interval:
+                # Nobody needs a frame yet - keep the driver queue drained without decoding
+                with self._cap_lock:
+                    grabbed = cap.grab()
+                if not grabbed:
+                    time.sleep(0.01)
+                continue
+
+            buffer = self.frame_pool.acquire(self._pool_shape) if self.frame_pool is not None else None
+
+            with self._cap_lock:
+                # grab() blocks until the driver delivers the next frame, retrieve() decodes it
+                # (into the pooled buffer when it has the right size)
+                grabbed = cap.grab()
+                last_decode = time.monotonic()
+                if not grabbed:
+                    success, frame = False, None
+                elif buffer is not None:
+                    success, frame = cap.retrieve(buffer.array)
+                else:
+                    success, frame = cap.retrieve()
+
+            if buffer is not None and (not success or frame is None):
+                buffer.release()
+
+            if not grabbed:
+                consecutive_failures += 1
+                if consecutive_failures == 30:
+                    self.error_occurred.emit(f"Camera {self.camera_id} stopped delivering frames")
+                time.sleep(0.01)
+                continue
+
+            if not success or frame is None:
+                continue
+            consecutive_failures = 0
+
+            if buffer is not None:
+                if frame is not buffer.array:
+                    # The frame size changed and the decoder allocated - adopt its array and
+                    # size further buffers to match
+                    self.frame_pool.adopt(buffer, frame)
+                    self._pool_shape = frame.shape
+                self._set_latest_buffer(buffer)
+                continue
+
+            with self._frame_condition:
+                self._latest_frame = frame
+                self._latest_seq += 1
+                self._latest_timestamp = time.monotonic()
+                self._frame_condition.notify_all()
+
+    def _set_latest_buffer(self, buffer: Optional[FrameBuffer]):
+        """
+        Publish a pooled buffer in the latest-frame slot, taking over the caller's reference
+        and releasing the slot's reference to the previous buffer.
+
+        Args:
+            buffer: Newly captured buffer, or None to empty the slot
+        """
+        with self._frame_condition:
+            previous = self._latest_buffer
+            self._latest_buffer = buffer
+            if buffer is not None:
+                self._latest_frame = buffer.array
+                self._latest_seq += 1
+                self._latest_timestamp = time.monotonic()
+                self._frame_condition.notify_all()
+
+        if previous is not None:
+            previous.release()
+
+    @property
+    def latest_frame_info(self) -> Tuple[int, float]:
+        """Sequence number and capture timestamp of the newest frame in the slot."""
+        with self._frame_condition:
+            return self._latest_seq, self._latest_timestamp
     
     def set_camera(self, camera_id: int) -> bool:
         """
@@ -121,6 +588,10 @@ class WebcamManager(QObject):
         if was_running:
             self.stop()
         
+        # A different camera replaces any recorded or generated frame source
+        if camera_id != self.camera_id:
+            self.frame_source = None
+
         # Update camera ID
         self.camera_id = camera_id
         
@@ -243,23 +714,17 @@ class WebcamManager(QObject):
         """
 		Get display name for a specific camera.
 
+		Uses the shared camera enumerator's cached device list instead of re-probing
+		every camera index, so this never blocks on camera I/O.
+
 		Args:
 			camera_id: Camera index
 
 		Returns:
 			str: Display name for the camera
 		"""
-        cameras_with_names = WebcamManager.get_device_list(return_names=True)
-
-        for camera_info in cameras_with_names:
-            if camera_info['id'] == camera_id:
-                name = camera_info['name']
-                resolution = camera_info.get('resolution', '')
-                if resolution and resolution != 'Unknown':
-                    return f"{name} ({resolution})"
-                return name
-
-        return f"Camera {camera_id}"
+        from core.camera_enumerator import get_camera_enumerator
+        return get_camera_enumerator().get_display_name(camera_id)
     
     def _detect_available_resolutions(self):
         """Detect resolutions supported by the current camera."""
@@ -301,45 +766,61 @@ class WebcamManager(QObject):
         print(f"Available resolutions: {self.available_resolutions}")
     
     
-    def optimize_camera_settings(self):
-        """Optimize camera settings for better quality - FaceTime style."""
+    def optimize_camera_settings(self, accepted_properties: Optional[Dict[str, bool]] = None,
+                                 fps: Optional[float] = None) -> Dict[str, bool]:
+        """
+        Optimize camera settings for better quality - FaceTime style.
+
+        Args:
+            accepted_properties: Cached result of a previous call - properties the camera
+                rejected are skipped instead of being set again
+            fps: Cached frame rate to set directly instead of probing 60 then 30 fps
+
+        Returns:
+            Dict mapping property name to whether the camera accepted it
+        """
         if not self.cap or not self.cap.isOpened():
-            return
-        
-        try:
-            # Try to set camera properties for better quality
-            # Note: Not all cameras support all properties
-            
-            # Set higher FPS if supported (60 fps for smooth video if available)
-            self.cap.set(cv2.CAP_PROP_FPS, 60)
-            actual_fps = self.cap.get(cv2.CAP_PROP_FPS)
-            if actual_fps < 60:
-                self.cap.set(cv2.CAP_PROP_FPS, 30)
-            
+            return {}
+
+        # Try to set camera properties for better quality
+        # Note: Not all cameras support all properties
+        camera_properties = [
             # Enable auto-exposure for better lighting adaptation
-            self.cap.set(cv2.CAP_PROP_AUTO_EXPOSURE, 3)  # 3 = auto mode
-            
+            ("auto_exposure", cv2.CAP_PROP_AUTO_EXPOSURE, 3),  # 3 = auto mode
             # Set buffer size to 1 for minimal latency (real-time feel)
-            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-            
-            # Disable auto white balance and set it manually for consistency
-            self.cap.set(cv2.CAP_PROP_AUTO_WB, 1)  # Enable auto white balance
-            
+            ("buffer_size", cv2.CAP_PROP_BUFFERSIZE, 1),
+            ("auto_wb", cv2.CAP_PROP_AUTO_WB, 1),  # Enable auto white balance
             # Try to improve image quality settings
             # These may not work on all cameras but won't cause errors
-            self.cap.set(cv2.CAP_PROP_BRIGHTNESS, 0.5)  # Default brightness
-            self.cap.set(cv2.CAP_PROP_CONTRAST, 0.5)    # Default contrast
-            self.cap.set(cv2.CAP_PROP_SATURATION, 0.65) # Slightly enhanced saturation
-            self.cap.set(cv2.CAP_PROP_SHARPNESS, 0.7)   # Slight sharpness boost
-            self.cap.set(cv2.CAP_PROP_GAIN, 0.5)        # Moderate gain
-            
+            ("brightness", cv2.CAP_PROP_BRIGHTNESS, 0.5),  # Default brightness
+            ("contrast", cv2.CAP_PROP_CONTRAST, 0.5),      # Default contrast
+            ("saturation", cv2.CAP_PROP_SATURATION, 0.65), # Slightly enhanced saturation
+            ("sharpness", cv2.CAP_PROP_SHARPNESS, 0.7),    # Slight sharpness boost
+            ("gain", cv2.CAP_PROP_GAIN, 0.5),              # Moderate gain
             # Try to set codec to MJPEG for better quality (if supported)
-            fourcc = cv2.VideoWriter_fourcc(*'MJPG')
-            self.cap.set(cv2.CAP_PROP_FOURCC, fourcc)
-            
+            ("fourcc", cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG')),
             # Set auto-focus if available
-            self.cap.set(cv2.CAP_PROP_AUTOFOCUS, 1)
-            
+            ("autofocus", cv2.CAP_PROP_AUTOFOCUS, 1),
+        ]
+
+        accepted = {}
+        try:
+            if fps:
+                self.cap.set(cv2.CAP_PROP_FPS, fps)
+            else:
+                # Set higher FPS if supported (60 fps for smooth video if available)
+                self.cap.set(cv2.CAP_PROP_FPS, 60)
+                actual_fps = self.cap.get(cv2.CAP_PROP_FPS)
+                if actual_fps < 60:
+                    self.cap.set(cv2.CAP_PROP_FPS, 30)
+
+            for name, prop, value in camera_properties:
+                if accepted_properties is not None and not accepted_properties.get(name, False):
+                    continue
+                accepted[name] = bool(self.cap.set(prop, value))
+
             print("Camera settings optimized for FaceTime-like quality")
         except Exception as e:
             print(f"Note: Some camera optimizations may not be supported: {e}")
+
+        return accepted
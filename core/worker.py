@@ -0,0 +1,248 @@
+import logging
+import queue
+import time
+from typing import Dict, Any, Union, Optional
+
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal, QThread, QMutex
+
+from core.detector import FaceDetector
+from core.frame_pool import FrameBuffer
+from core.scheduler import AdaptiveFrameScheduler
+
+
+class DetectionWorkerSignals(QObject):
+	"""Signals for the detection worker thread."""
+	# Signal emitted with the face count that should drive alerts
+	face_count_ready = pyqtSignal(int)
+	# Signal emitted with detection results for display: face count, bounding boxes, the
+	# annotated frame (np.ndarray, or a FrameBuffer whose reference passes to the receiver)
+	# and the number of people looking
+	detection_ready = pyqtSignal(int, list, object, int)
+	# Signal emitted when pipeline statistics are updated
+	stats_updated = pyqtSignal(dict)
+	# Signal emitted when an error occurs
+	error_occurred = pyqtSignal(str)
+
+
+class DetectionWorker(QThread):
+	"""
+	Thread that runs FaceDetector.detect off the GUI thread.
+	Frames are handed over through a single-slot queue: when the worker is busy the
+	pending frame is replaced by the newer one and counted as dropped, so detection
+	always works on the freshest frame and never builds a backlog.
+
+	Pooled FrameBuffers are annotated in place and handed on through detection_ready
+	without copying; a buffer dropped from the slot is released here.
+	"""
+
+	def __init__(self, face_detector: FaceDetector, scheduler: Optional[AdaptiveFrameScheduler] = None):
+		"""
+		Initialize the detection worker.
+
+		Args:
+			face_detector: Detector used to process submitted frames
+			scheduler: Optional frame rate scheduler fed with each frame's face count and motion
+		"""
+		super().__init__()
+		self.face_detector = face_detector
+		self.scheduler = scheduler
+		self.signals = DetectionWorkerSignals()
+		self.mutex = QMutex()
+		self.is_running = False
+		self.logger = self._setup_logger()
+
+		# Bounded hand-over slot between the producer (GUI/capture) and this thread
+		self._frames = queue.Queue(maxsize=1)
+
+		# Statistics
+		self.stats = {
+			"submitted_frames": 0,
+			"processed_frames": 0,
+			"dropped_frames": 0,
+			"last_detection_ms": 0.0,
+		}
+
+	def _setup_logger(self):
+		"""Set up logging for the detection worker thread."""
+		logger = logging.getLogger("EyesOff_Detection_Worker")
+		if not logger.handlers:
+			logger.setLevel(logging.INFO)
+			handler = logging.StreamHandler()
+			formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+			handler.setFormatter(formatter)
+			logger.addHandler(handler)
+		return logger
+
+	def submit(self, frame: Union[np.ndarray, FrameBuffer]) -> bool:
+		"""
+		Hand a frame to the worker without blocking.
+
+		Args:
+			frame: Frame to run detection on; for a FrameBuffer the caller's reference
+				passes to the worker
+
+		Returns:
+			bool: False if an older pending frame had to be dropped to make room
+		"""
+		dropped = False
+		self.mutex.lock()
+		self.stats["submitted_frames"] += 1
+		try:
+			self._frames.put_nowait(frame)
+		except queue.Full:
+			# Worker is busy - discard the stale pending frame in favour of this one
+			try:
+				self._release(self._frames.get_nowait())
+				self.stats["dropped_frames"] += 1
+				dropped = True
+			except queue.Empty:
+				# The worker took the pending frame in the meantime - nothing was dropped
+				pass
+			self._frames.put_nowait(frame)
+		self.mutex.unlock()
+		return not dropped
+
+	def run(self):
+		"""Run the detection loop."""
+		self.mutex.lock()
+		self.is_running = True
+		self.mutex.unlock()
+
+		self.logger.info("Detection worker started")
+
+		while self.is_running:
+			try:
+				frame = self._frames.get(timeout=0.1)
+			except queue.Empty:
+				continue
+
+			if frame is None:
+				# Stop sentinel - a leftover one from a previous session is ignored
+				if not self.is_running:
+					break
+				continue
+
+			buffer = frame if isinstance(frame, FrameBuffer) else None
+			try:
+				# Measure motion before the frame is annotated
+				motion = 0.0
+				if self.scheduler is not None:
+					motion = self.scheduler.measure_motion(buffer.array if buffer is not None else frame)
+
+				start = time.perf_counter()
+				if buffer is not None:
+					# We own the buffer, so annotate it directly instead of copying the frame
+					image = buffer.array
+					num_faces, bboxes, annotated, num_looking = self.face_detector.detect(image, in_place=True)
+				else:
+					num_faces, bboxes, annotated, num_looking = self.face_detector.detect(frame)
+				elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+				if buffer is not None and annotated is buffer.array:
+					# The buffer reference passes to the display
+					self.signals.detection_ready.emit(num_faces, bboxes, buffer, num_looking)
+					buffer = None
+				else:
+					self.signals.detection_ready.emit(num_faces, bboxes, annotated, num_looking)
+
+				# EyesOff model alerts on people looking, other models on total faces
+				if self.face_detector.detector_type.lower() == 'eyes_off_model':
+					alert_count = num_looking
+				else:
+					alert_count = num_faces
+				self.signals.face_count_ready.emit(alert_count)
+
+				if self.scheduler is not None:
+					self.scheduler.observe(alert_count, motion)
+
+				self.mutex.lock()
+				self.stats["processed_frames"] += 1
+				self.stats["last_detection_ms"] = elapsed_ms
+				stats = self.stats.copy()
+				self.mutex.unlock()
+
+				if isinstance(frame, FrameBuffer) and frame.pool is not None:
+					stats["frame_pool"] = frame.pool.get_stats()
+				if self.scheduler is not None:
+					stats["scheduler"] = self.scheduler.get_stats()
+				stats["motion_gate"] = self.face_detector.get_gate_stats()
+				tracking_stats = self.face_detector.get_tracking_stats()
+				if tracking_stats is not None:
+					stats["tracking"] = tracking_stats
+				roi_stats = self.face_detector.get_roi_stats()
+				if roi_stats is not None:
+					stats["roi_detection"] = roi_stats
+				input_size_stats = self.face_detector.get_input_size_stats()
+				if input_size_stats is not None:
+					stats["detector_input"] = input_size_stats
+				sweep_stats = self.face_detector.get_tile_sweep_stats()
+				if sweep_stats is not None:
+					stats["tile_sweep"] = sweep_stats
+				budget_stats = self.face_detector.get_gaze_budget_stats()
+				if budget_stats is not None:
+					stats["gaze_budget"] = budget_stats
+				head_pose_stats = self.face_detector.get_head_pose_stats()
+				if head_pose_stats is not None:
+					stats["head_pose"] = head_pose_stats
+				cascade_stats = self.face_detector.get_cascade_stats()
+				if cascade_stats is not None:
+					stats["gaze_cascade"] = cascade_stats
+				gaze_cache_stats = self.face_detector.get_gaze_cache_stats()
+				if gaze_cache_stats is not None:
+					stats["gaze_cache"] = gaze_cache_stats
+				startup_stats = self.face_detector.get_startup_stats()
+				if startup_stats is not None:
+					stats["startup"] = startup_stats
+
+				self.signals.stats_updated.emit(stats)
+
+			except Exception as e:
+				self.logger.error(f"Error in detection worker: {e}")
+				self.signals.error_occurred.emit(f"Detection worker error: {e}")
+
+			finally:
+				self._release(buffer)
+
+		self.logger.info("Detection worker stopped")
+
+	def get_stats(self) -> Dict[str, Any]:
+		"""
+		Get a snapshot of the worker statistics.
+
+		Returns:
+			Dict: Submitted, processed and dropped frame counts
+		"""
+		self.mutex.lock()
+		stats = self.stats.copy()
+		self.mutex.unlock()
+		return stats
+
+	def reset_stats(self):
+		"""Reset the frame counters, e.g. at the start of a monitoring session."""
+		self.mutex.lock()
+		for key in self.stats:
+			self.stats[key] = 0.0 if key == "last_detection_ms" else 0
+		self.mutex.unlock()
+
+	def stop(self):
+		"""Stop the worker and discard any pending frame."""
+		self.mutex.lock()
+		self.is_running = False
+		self.mutex.unlock()
+
+		# Clear the slot and wake the loop
+		try:
+			self._release(self._frames.get_nowait())
+		except queue.Empty:
+			pass
+		try:
+			self._frames.put_nowait(None)
+		except queue.Full:
+			pass
+
+	@staticmethod
+	def _release(frame):
+		"""Release a pooled frame the worker owns (plain arrays need no release)."""
+		if isinstance(frame, FrameBuffer):
+			frame.release()
@@ -1,41 +1,14 @@
-from typing import Tuple, List
+import time
+from typing import Tuple, List, Optional
 
 import cv2 as cv
 import numpy as np
 
+from utils.face_regions import detect_faces, detect_faces_in_regions
+from utils.head_pose import frontal_mask
 from utils.yunet import YuNet
 from utils.eyesoff_model import EyesOffModel
 
-def _preprocess_for_classifier(
-    face_bgr: np.ndarray,
-    size: int = 224,
-    mean=(0.485, 0.456, 0.406),
-    std=(0.229, 0.224, 0.225),
-) -> np.ndarray:
-    """
-    Preprocess BGR face image into a normalized CHW float32 tensor
-    suitable for the EyesOff ONNX model.
-    """
-    # Resize
-    img = cv.resize(face_bgr, (size, size), interpolation=cv.INTER_LINEAR)
-    # BGR -> RGB
-    img = cv.cvtColor(img, cv.COLOR_BGR2RGB)
-    # To float32 0..1
-    img = img.astype(np.float32) / 255.0
-    # HWC -> CHW
-    img = np.transpose(img, (2, 0, 1))
-    # Normalize
-    mean_arr = np.asarray(mean, dtype=np.float32)[:, None, None]
-    std_arr = np.asarray(std, dtype=np.float32)[:, None, None]
-    img = (img - mean_arr) / std_arr
-    # Add batch dim
-    img = np.expand_dims(img, axis=0).astype(np.float32)
-    return img
-
-
-def _sigmoid(x: np.ndarray) -> np.ndarray:
-    return 1.0 / (1.0 + np.exp(-x))
-
 
 class EyesOffDetector:
     """
@@ -43,6 +16,9 @@ class EyesOffDetector:
     and EyesOffModel (ONNX) for gaze classification.
     """
 
+    # Seconds without a classification that weigh as much as a face's size or centrality
+    STALENESS_SCALE = 0.5
+
     def __init__(
         self,
         eyesoff_model_path: str,
@@ -56,6 +32,16 @@ class EyesOffDetector:
         input_size: int = 224,
         bbox_scale: float = 1.6,
         smoothing_window: int = 1,
+        gaze_cache: bool = True,
+        gaze_cache_max_age: float = 1.0,
+        face_threshold: Optional[int] = None,
+        head_pose_filter: bool = False,
+        max_yaw: float = 45.0,
+        max_pitch: float = 40.0,
+        max_classifications: int = 0,
+        time_budget_ms: float = 0.0,
+        ort_settings: Optional[dict] = None,
+        model_cache=None,
     ) -> None:
         """
         Args:
@@ -70,11 +56,60 @@ class EyesOffDetector:
             input_size: EyesOff ONNX model input size (e.g., 224).
             bbox_scale: Factor to enlarge face box for cropping.
             smoothing_window: Smoothing window for EyesOffModel.
+            gaze_cache: Reuse gaze results of unchanged tracked faces.
+            gaze_cache_max_age: Seconds after which a tracked face is re-classified anyway.
+            face_threshold: Alert threshold of the detection manager (alerts when more than
+                this many people look). When set, gaze is only classified while the result can
+                still change whether an alert fires (see _classify).
+            head_pose_filter: Mark faces turned away from the camera (estimated from the YuNet
+                landmarks) as not looking without running the gaze model.
+            max_yaw: Largest head yaw in degrees that still goes to the gaze model.
+            max_pitch: Largest head pitch in degrees that still goes to the gaze model.
+            max_classifications: Most gaze classifications per frame (0 = no limit).
+            time_budget_ms: Most milliseconds of gaze classification per frame (0 = no limit).
+            ort_settings: ONNX Runtime session settings for the EyesOff model
+                (see utils.eyesoff_model.make_session_options).
+            model_cache: utils.model_cache.OptimizedModelCache for the EyesOff model, or None.
         """
         self.confidence_threshold = float(yunet_confidence_threshold)
         self.eyesoff_threshold = float(eyesoff_threshold)
         self.target_size = int(target_size)
+        self.nms_threshold = float(yunet_nms_threshold)
+        # Longer side of the regions searched by locate(frame, regions)
+        self.region_size = 192
         self.face_bbox_scale = float(bbox_scale)
+        self.face_threshold = face_threshold
+        self.head_pose_filter = head_pose_filter
+        self.max_yaw = float(max_yaw)
+        self.max_pitch = float(max_pitch)
+        self.max_classifications = int(max_classifications)
+        self.time_budget_ms = float(time_budget_ms)
+        # Running average of the classification time per face, for the time budget
+        self._face_ms: Optional[float] = None
+        # Without track IDs the budget serves faces in turn from this offset in the priority order
+        self._untracked_offset = 0
+
+        # Faces the head pose pre-filter marked as not looking, sparing a classification each
+        self.head_pose_stats = {
+            "filtered_faces": 0,
+            "frontal_faces": 0,
+        }
+
+        # Faces classified and faces left unclassified by the alert policy
+        self.cascade_stats = {
+            "classified_faces": 0,
+            "skipped_faces": 0,
+            "skipped_frames": 0,
+        }
+
+        # Frames that ran out of budget, faces left for later frames, and how many of those
+        # kept an earlier result or, without one, counted as looking
+        self.budget_stats = {
+            "over_budget_frames": 0,
+            "deferred_faces": 0,
+            "carried_forward": 0,
+            "assumed_looking": 0,
+        }
 
         # YuNet backend/target
         backend_id = cv.dnn.DNN_BACKEND_OPENCV
@@ -98,8 +133,15 @@ class EyesOffDetector:
             decision_threshold=eyesoff_threshold,
             use_gpu=use_gpu,
             smoothing_window=smoothing_window,
+            gaze_cache=gaze_cache,
+            gaze_cache_max_age=gaze_cache_max_age,
+            ort_settings=ort_settings,
+            model_cache=model_cache,
         )
 
+        # Boxes and gaze results of the last detect() call, redrawn by annotate_last()
+        self._last_visualization = ([], [], [])
+
     # ---- Internal helpers ----
 
     @staticmethod
@@ -136,8 +178,9 @@ class EyesOffDetector:
         self,
         image: np.ndarray,
         bboxes: List[Tuple[int, int, int, int]],
-        gaze_probs: List[float],
-        gaze_states: List[bool],
+        gaze_probs: List[Optional[float]],
+        gaze_states: List[Optional[bool]],
+        in_place: bool = False,
     ) -> np.ndarray:
         """
         Draw bounding boxes and gaze labels on the image.
@@ -145,24 +188,34 @@ class EyesOffDetector:
         Args:
             image: Input BGR image.
             bboxes: List of [x, y, w, h] in original resolution.
-            gaze_probs: List of probabilities for "looking".
-            gaze_states: List of bools (True = looking).
+            gaze_probs: List of probabilities for "looking" (None = not classified, turned
+                away when the state is False, or deferred by the budget when it is True).
+            gaze_states: List of bools (True = looking, None = not classified).
+            in_place: Draw onto image itself instead of a copy.
 
         Returns:
             Annotated image.
         """
-        annotated_image = image.copy()
+        annotated_image = image if in_place else image.copy()
 
         for (x, y, w, h), prob, is_looking in zip(bboxes, gaze_probs, gaze_states):
             # Bounding box
             start_point = (x, y)
             end_point = (x + w, y + h)
-            color = (0, 200, 0) if is_looking else (0, 0, 255)  # green / red
+            if is_looking is None:
+                color = (160, 160, 160)  # grey - gaze not needed for the alert decision
+            else:
+                color = (0, 200, 0) if is_looking else (0, 0, 255)  # green / red
             cv.rectangle(annotated_image, start_point, end_point, color, 2)
 
             # Label
-            label = "LOOKING" if is_looking else "NOT LOOKING"
-            text = f"{label}: {prob:.2f}"
+            if is_looking is None:
+                text = "FACE"
+            elif prob is None:
+                text = "LOOKING: PENDING" if is_looking else "NOT LOOKING: TURNED AWAY"
+            else:
+                label = "LOOKING" if is_looking else "NOT LOOKING"
+                text = f"{label}: {prob:.2f}"
             # Text position slightly above the box
             text_org = (x, max(0, y - 10))
             cv.putText(
@@ -183,12 +236,14 @@ class EyesOffDetector:
     def detect(
         self,
         frame: np.ndarray,
+        in_place: bool = False,
     ) -> Tuple[int, List[Tuple[int, int, int, int]], np.ndarray, int]:
         """
         Detect faces and run EyesOff gaze inference on each.
 
         Args:
             frame: Input BGR image.
+            in_place: Draw the annotations directly onto frame (after all crops are taken).
 
         Returns:
             Tuple containing:
@@ -197,61 +252,296 @@ class EyesOffDetector:
                 - annotated_frame (np.ndarray): image with boxes + gaze labels
                 - num_looking (int): number of people looking at the camera
         """
-        h, w = frame.shape[:2]
+        return self.process_detections(frame, self.locate(frame), in_place)
+
+    def locate(
+        self,
+        frame: np.ndarray,
+        regions: Optional[List[Tuple[int, int, int, int]]] = None,
+    ) -> np.ndarray:
+        """
+        Run YuNet on the frame without gaze inference.
+
+        Args:
+            frame: Input BGR image.
+            regions: Only search these (x, y, w, h) regions, each at up to region_size
+                pixels (see utils.face_regions).
 
+        Returns:
+            YuNet rows above the confidence threshold in original coordinates -
+            [x, y, w, h, l0x, l0y, ..., l4x, l4y, score], shape (N, 15).
+        """
         # Resize with aspect ratio preserved (like YuNetDetector)
-        scale_factor = self.target_size / max(h, w)
-        new_w = int(w * scale_factor)
-        new_h = int(h * scale_factor)
-        resized = cv.resize(frame, (new_w, new_h))
+        scale_factor = self.target_size / max(frame.shape[:2])
 
-        # YuNet expects current input size
-        self.detector.setInputSize([new_w, new_h])
-        detections = self.detector.infer(resized)  # shape: [N, 15] or [0, 5]/[0, 15]
+        if regions is not None:
+            return detect_faces_in_regions(self.detector, frame, regions, scale_factor, self.region_size,
+                                           self.confidence_threshold, self.nms_threshold)
+        return detect_faces(self.detector, frame, scale_factor, self.confidence_threshold)
+
+    def process_detections(
+        self,
+        frame: np.ndarray,
+        detections: np.ndarray,
+        in_place: bool = False,
+        track_ids: Optional[List[int]] = None,
+    ) -> Tuple[int, List[Tuple[int, int, int, int]], np.ndarray, int]:
+        """
+        Run EyesOff gaze inference on faces found by locate() or moved there by the tracker.
+
+        Args:
+            frame: Input BGR image.
+            detections: YuNet rows in original coordinates, see locate().
+            in_place: Draw the annotations directly onto frame (after all crops are taken).
+            track_ids: Tracker ID per row - enables per-face gaze caching and smoothing.
+
+        Returns:
+            Same as detect().
+        """
+        h, w = frame.shape[:2]
 
         bboxes: List[Tuple[int, int, int, int]] = []
-        gaze_probs: List[float] = []
-        gaze_states: List[bool] = []
+        face_crops: List[np.ndarray] = []
+        crop_track_ids: List[int] = []
+        crop_rows: List[int] = []
+
+        for index, det in enumerate(detections):
+            x, y, bw, bh = (int(v) for v in det[:4])
+
+            # Clamp to image
+            x = max(0, min(x, w - 1))
+            y = max(0, min(y, h - 1))
+            bw = max(1, min(bw, w - x))
+            bh = max(1, min(bh, h - y))
+
+            bbox = np.array([x, y, bw, bh], dtype=np.int32)
+
+            # Enlarge bbox for cropping if desired
+            enlarged_bbox = self._enlarge_bbox(bbox, frame.shape, scale=self.face_bbox_scale)
+            face_crop = self._crop(frame, enlarged_bbox)
+
+            if face_crop.size == 0:
+                continue
+
+            bboxes.append((x, y, bw, bh))
+            face_crops.append(face_crop)
+            crop_rows.append(index)
+            if track_ids is not None:
+                crop_track_ids.append(track_ids[index])
+
+        if track_ids is not None:
+            self.eyesoff.track_cache.prune(track_ids)
+
+        if self.head_pose_filter and crop_rows:
+            frontal = frontal_mask(detections[crop_rows], self.max_yaw, self.max_pitch)
+        else:
+            frontal = np.ones(len(face_crops), dtype=bool)
+
+        # Faces turned away cannot be looking - only frontal ones go to the gaze model
+        candidates = np.flatnonzero(frontal).tolist()
+        self.head_pose_stats["filtered_faces"] += len(face_crops) - len(candidates)
+        self.head_pose_stats["frontal_faces"] += len(candidates)
+
+        predictions: List[Tuple[Optional[float], Optional[bool]]] = [(None, False)] * len(face_crops)
+        candidate_predictions = self._classify(
+            [face_crops[i] for i in candidates],
+            [bboxes[i] for i in candidates],
+            [crop_track_ids[i] for i in candidates] if track_ids is not None else None,
+            frame.shape,
+        )
+        for i, prediction in zip(candidates, candidate_predictions):
+            predictions[i] = prediction
+        gaze_probs: List[Optional[float]] = [prob for prob, _ in predictions]
+        gaze_states: List[Optional[bool]] = [is_looking for _, is_looking in predictions]
+
+        self._last_visualization = (bboxes, gaze_probs, gaze_states)
+        annotated_frame = self._visualize(frame, bboxes, gaze_probs, gaze_states, in_place)
+        num_faces = len(bboxes)
+        num_looking = sum(1 for is_looking in gaze_states if is_looking)  # Count how many are looking
 
-        if detections.shape[0] > 0:
-            inverse_scale = 1.0 / scale_factor
+        return num_faces, bboxes, annotated_frame, num_looking
 
-            for det in detections:
-                # YuNet output format: [x, y, w, h, score, l0x, l0y, ..., l4x, l4y]
-                score = float(det[4])
+    def _priority_order(
+        self,
+        bboxes: List[Tuple[int, int, int, int]],
+        track_ids: Optional[List[int]],
+        frame_shape: Tuple[int, ...],
+    ) -> List[int]:
+        """
+        Order faces by how urgently they need a gaze classification.
 
-                if score < self.confidence_threshold:
-                    continue
+        Faces never classified come first. The rest are ranked by size (closer people
+        can read the screen more easily), centrality and staleness - the time since the
+        face was last classified - so under a budget every face is served in turn.
+        Untracked faces have no known staleness: their ranking is rotated past the faces
+        classified on earlier frames instead.
 
-                # Scale bbox back to original coordinates
-                x = int(det[0] * inverse_scale)
-                y = int(det[1] * inverse_scale)
-                bw = int(det[2] * inverse_scale)
-                bh = int(det[3] * inverse_scale)
+        Returns:
+            Face indices, most urgent first.
+        """
+        if not bboxes:
+            return []
 
-                # Clamp to image
-                x = max(0, min(x, w - 1))
-                y = max(0, min(y, h - 1))
-                bw = max(1, min(bw, w - x))
-                bh = max(1, min(bh, h - y))
+        boxes = np.asarray(bboxes, dtype=np.float32)
+        frame_h, frame_w = frame_shape[:2]
 
-                bbox = np.array([x, y, bw, bh], dtype=np.int32)
+        size = np.sqrt(boxes[:, 2] * boxes[:, 3])
+        size /= max(float(size.max()), 1.0)
 
-                # Enlarge bbox for cropping if desired
-                enlarged_bbox = self._enlarge_bbox(bbox, frame.shape, scale=self.face_bbox_scale)
-                face_crop = self._crop(frame, enlarged_bbox)
+        centre = boxes[:, :2] + boxes[:, 2:] / 2.0
+        offset = np.linalg.norm((centre - (frame_w / 2.0, frame_h / 2.0)) / (frame_w / 2.0, frame_h / 2.0), axis=1)
+        centrality = 1.0 - np.clip(offset / np.sqrt(2.0), 0.0, 1.0)
 
-                if face_crop.size == 0:
-                    continue
+        if track_ids is None:
+            order = sorted(range(len(bboxes)), key=lambda i: size[i] + centrality[i], reverse=True)
+            offset = self._untracked_offset % len(order)
+            return order[offset:] + order[:offset]
 
-                prob, is_looking = self.eyesoff.predict(face_crop)
+        ages = np.array([self.eyesoff.track_cache.age(track_id) for track_id in track_ids])
+        never_classified = np.isinf(ages)
+        staleness = np.where(never_classified, 0.0, ages) / self.STALENESS_SCALE
 
-                bboxes.append((x, y, bw, bh))
-                gaze_probs.append(prob)
-                gaze_states.append(is_looking)
+        score = size + centrality + staleness
+        return sorted(range(len(bboxes)), key=lambda i: (never_classified[i], score[i]), reverse=True)
 
-        annotated_frame = self._visualize(frame, bboxes, gaze_probs, gaze_states)
-        num_faces = len(bboxes)
-        num_looking = sum(gaze_states)  # Count how many are looking
+    def _budget_left(self, classified: int, start: float, num_faces: int) -> Optional[int]:
+        """
+        Number of faces that can still be classified this frame, or None without a budget.
 
-        return num_faces, bboxes, annotated_frame, num_looking
\ No newline at end of file
+        The time budget is converted into faces with the measured classification time per
+        face; at least one face per frame is always classified, so every face gets a turn.
+        """
+        limits = []
+        if self.max_classifications > 0:
+            limits.append(self.max_classifications - classified)
+        if self.time_budget_ms > 0:
+            if self._face_ms is None:
+                affordable = 1  # Unknown cost - measure it on a single face
+            else:
+                remaining_ms = self.time_budget_ms - (time.perf_counter() - start) * 1000.0
+                affordable = int(remaining_ms // max(self._face_ms, 1e-3))
+            limits.append(affordable if classified else max(1, affordable))
+        if not limits:
+            return None
+        return int(np.clip(min(limits), 0, num_faces))
+
+    def _classify(
+        self,
+        face_crops: List[np.ndarray],
+        bboxes: List[Tuple[int, int, int, int]],
+        track_ids: Optional[List[int]],
+        frame_shape: Tuple[int, ...],
+    ) -> List[Tuple[Optional[float], Optional[bool]]]:
+        """
+        Classify gaze for as few faces as the alert decision and the frame budget allow.
+
+        Faces are classified most urgent first (see _priority_order). Without a
+        face_threshold every face is classified. With one:
+        - with at most face_threshold faces nobody is classified - even if all of them
+          looked, no alert could fire;
+        - otherwise classification stops as soon as too few faces remain to reach the
+          alert. Once the alert is reached, the remaining faces are still classified, so
+          the looking count stays exact and a rise in viewers can re-alert.
+
+        With max_classifications or time_budget_ms set, classification also stops once the
+        frame's budget is spent. The remaining tracked faces keep their last result and
+        are classified on later frames as they become the most stale; untracked faces are
+        classified on later frames in turn. Left-over faces without an earlier result count
+        as looking until they are classified, so the budget never hides a new viewer.
+
+        Args:
+            face_crops: Face crops.
+            bboxes: Box per crop.
+            track_ids: Tracker ID per crop, or None.
+            frame_shape: Shape of the frame the crops were taken from.
+
+        Returns:
+            (prob, is_looking) per crop, (None, None) for faces that were not classified and
+            (None, True) for faces deferred by the budget before their first classification.
+        """
+        num_faces = len(face_crops)
+        predictions: List[Tuple[Optional[float], Optional[bool]]] = [(None, None)] * num_faces
+        cascade = self.face_threshold is not None
+        alert_count = self.face_threshold + 1 if cascade else 0
+
+        if cascade and num_faces < alert_count:
+            self.cascade_stats["skipped_faces"] += num_faces
+            self.cascade_stats["skipped_frames"] += 1
+            return predictions
+
+        start = time.perf_counter()
+        pending = self._priority_order(bboxes, track_ids, frame_shape)
+        num_looking = 0
+        classified = 0
+        over_budget = False
+
+        while pending:
+            # Stop once the alert can no longer be reached
+            if cascade and num_looking + len(pending) < alert_count:
+                break
+            limit = self._budget_left(classified, start, num_faces)
+            if limit == 0:
+                over_budget = True
+                break
+
+            # Until the alert is reached, each batch holds just enough faces to reach it
+            batch = pending[:alert_count - num_looking] if cascade and num_looking < alert_count else pending
+            batch_start = time.perf_counter()
+            if track_ids is None:
+                results = self.eyesoff.predict_batch([face_crops[i] for i in batch], limit=limit)
+            else:
+                results = self.eyesoff.predict_batch([face_crops[i] for i in batch], [track_ids[i] for i in batch],
+                                                     [bboxes[i] for i in batch], limit=limit)
+
+            fresh = self.eyesoff.last_classified
+            if fresh:
+                face_ms = (time.perf_counter() - batch_start) * 1000.0 / fresh
+                self._face_ms = face_ms if self._face_ms is None else 0.8 * self._face_ms + 0.2 * face_ms
+            classified += fresh
+
+            done = set()
+            for i, prediction in zip(batch, results):
+                if prediction is not None:
+                    predictions[i] = prediction
+                    num_looking += int(prediction[1])
+                    done.add(i)
+            pending = [i for i in pending if i not in done]
+            if len(done) < len(batch):
+                over_budget = True
+                break
+
+        self.cascade_stats["classified_faces"] += num_faces - len(pending)
+
+        if not over_budget:
+            self.cascade_stats["skipped_faces"] += len(pending)
+            return predictions
+
+        # Faces left over by the budget keep their last result until their turn comes. Faces
+        # without one count as looking, so a newcomer can raise the alert before their turn
+        self.budget_stats["over_budget_frames"] += 1
+        self.budget_stats["deferred_faces"] += len(pending)
+        if track_ids is None:
+            self._untracked_offset += classified
+        for i in pending:
+            prob = self.eyesoff.track_cache.last(track_ids[i]) if track_ids is not None else None
+            if prob is not None:
+                predictions[i] = (prob, prob >= self.eyesoff.decision_threshold)
+                self.budget_stats["carried_forward"] += 1
+            else:
+                predictions[i] = (None, True)
+                self.budget_stats["assumed_looking"] += 1
+        return predictions
+
+    def annotate_last(self, frame: np.ndarray, in_place: bool = False) -> np.ndarray:
+        """
+        Draw the result of the last detect() call onto another frame of the same size.
+
+        Args:
+            frame: Frame to annotate.
+            in_place: Draw directly onto frame instead of a copy.
+
+        Returns:
+            Annotated image.
+        """
+        bboxes, gaze_probs, gaze_states = self._last_visualization
+        return self._visualize(frame, bboxes, gaze_probs, gaze_states, in_place)
\ No newline at end of file
@@ -10,14 +10,18 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
 							 QSystemTrayIcon, QStyle, QApplication, QProgressDialog)
 
 from core.detector import FaceDetector
+from core.frame_source import FrameSource
 from core.manager import DetectionManagerThread
+from core.scheduler import AdaptiveFrameScheduler
 from core.webcam import WebcamManager
+from core.worker import DetectionWorker
 from gui.alert import AlertDialog
 from gui.help.walkthrough import WalkthroughDialog
 from gui.preferences_window import PreferencesWindow
 from gui.webcam_view import WebcamView
 from gui.help.walkthrough import WalkthroughDialog
 from utils.config import ConfigManager
+from utils.eyesoff_model import ORT_CONFIG_KEYS, ort_settings_from_config
 from utils.platform import get_platform_manager
 
 
@@ -27,10 +31,18 @@ class MainWindow(QMainWindow):
     Integrates all UI components and connects them to the core functionality.
     """
 
-    def __init__(self):
-        """Initialize the main window."""
+    def __init__(self, frame_source: Optional[FrameSource] = None):
+        """
+        Initialize the main window.
+
+        Args:
+            frame_source: Optional source used instead of the configured camera
+        """
         super().__init__()
 
+        # Non-camera frame source (video file, image directory, synthetic)
+        self.frame_source = frame_source
+
         # Get platform manager (singleton)
         self.platform_manager = get_platform_manager()
 
@@ -41,9 +53,11 @@ class MainWindow(QMainWindow):
         self.webcam_manager = None
         self.face_detector = None
         self.detection_thread = None
+        self.detection_worker = None
 
-        # Frame processing timer
+        # Frame processing timer and the scheduler that sets its rate
         self.frame_timer = None
+        self.frame_scheduler = None
 
         # UI components
         self.webcam_view = None
@@ -240,24 +254,55 @@ class MainWindow(QMainWindow):
         try:
             # Create webcam manager - simplified, no resolution parameters
             self.webcam_manager = WebcamManager(
-                camera_id=self.config_manager.get("camera_id", 0)
+                camera_id=self.config_manager.get("camera_id", 0),
+                threaded_capture=self.config_manager.get("threaded_capture", True),
+                capture_mode=self.config_manager.get("capture_mode", WebcamManager.CAPTURE_MODE_DETECTION),
+                capability_cache=self.config_manager.get_camera_capability_cache(),
+                frame_source=self.frame_source,
+                pooled_buffers=self.config_manager.get("pooled_frame_buffers", True),
+                reduced_decode=self.config_manager.get("mjpeg_reduced_decode", False)
             )
 
             # Connect signals
             self.webcam_manager.frame_ready.connect(self.webcam_view.update_frame)
             self.webcam_manager.error_occurred.connect(self._handle_error)
 
+            # Snapshots switch the camera to full resolution for a single frame
+            self.webcam_view.full_resolution_provider = self.webcam_manager.capture_full_resolution_frame
+
             # Create face detector
             self.face_detector = FaceDetector(
                 detector_type=self.config_manager.get("detector_type", "yunet"),
                 model_path=self.config_manager.get("model_path", ""),
                 confidence_threshold=self.config_manager.get("confidence_threshold", 0.5),
                 #gaze_model_path=self.config_manager.get("gaze_model_path", ""), TODO: use gaze model path and pass it to the FaceDetector
-                gaze_threshold=self.config_manager.get("gaze_threshold", 0.3)
+                gaze_threshold=self.config_manager.get("gaze_threshold", 0.3),
+                motion_gate=self.config_manager.get("motion_gate", self.config_manager.default_config["motion_gate"]),
+                motion_gate_max_interval=self.config_manager.get("motion_gate_max_interval", 1.0),
+                face_tracking=self.config_manager.get("face_tracking", self.config_manager.default_config["face_tracking"]),
+                detection_interval=self.config_manager.get("detection_interval", 5),
+                gaze_cache=self.config_manager.get("gaze_cache", True),
+                gaze_cache_max_age=self.config_manager.get("gaze_cache_max_age", 1.0),
+                roi_detection=self.config_manager.get("roi_detection", self.config_manager.default_config["roi_detection"]),
+                full_scan_interval=self.config_manager.get("full_scan_interval", 1.0),
+                tiled_detection=self.config_manager.get("tiled_detection", False),
+                tile_sweep_interval=self.config_manager.get("tile_sweep_interval", 5.0),
+                adaptive_input_size=self.config_manager.get("adaptive_input_size", self.config_manager.default_config["adaptive_input_size"]),
+                input_size_min=self.config_manager.get("input_size_min", 224),
+                input_size_max=self.config_manager.get("input_size_max", 640),
+                face_threshold=self.config_manager.get("face_threshold", 1),
+                gaze_cascade=self.config_manager.get("gaze_cascade", self.config_manager.default_config["gaze_cascade"]),
+                head_pose_filter=self.config_manager.get("head_pose_filter", self.config_manager.default_config["head_pose_filter"]),
+                head_pose_max_yaw=self.config_manager.get("head_pose_max_yaw", 45.0),
+                head_pose_max_pitch=self.config_manager.get("head_pose_max_pitch", 40.0),
+                gaze_max_per_frame=self.config_manager.get("gaze_max_per_frame", self.config_manager.default_config["gaze_max_per_frame"]),
+                gaze_time_budget_ms=self.config_manager.get("gaze_time_budget_ms", 0.0),
+                ort_settings=ort_settings_from_config(self.config_manager.get_all()),
+                model_cache_dir=(self.platform_manager.file_system.get_model_cache_directory()
+                                 if self.config_manager.get("ort_model_cache", True) else None)
             )
 
-            # Connect signals
-            self.face_detector.signals.detection_ready.connect(self.webcam_view.update_detection)
+            # Connect signals - detection results reach the view through the detection worker
             self.face_detector.signals.error_occurred.connect(self._handle_error)
 
             # Create detection manager thread
@@ -272,6 +317,26 @@ class MainWindow(QMainWindow):
             # Connect a signal to take a screenshot of screen when we show alert
             self.detection_thread.signals.show_alert.connect(self._capture_webcam_on_alert)
 
+            # Create frame rate scheduler - drops to an idle rate while the scene is stable
+            self.frame_scheduler = AdaptiveFrameScheduler(
+                idle_fps=self.config_manager.get("idle_fps", 2.0),
+                idle_after=self.config_manager.get("idle_after_seconds", 10.0),
+                face_threshold=self.config_manager.get("face_threshold", 1),
+                enabled=self.config_manager.get("adaptive_frame_rate", self.config_manager.default_config["adaptive_frame_rate"])
+            )
+
+            # Create detection worker - runs the detector off the GUI thread
+            self.detection_worker = DetectionWorker(self.face_detector, self.frame_scheduler)
+
+            # Connect signals - update_face_count and update_pipeline_stats are mutex protected,
+            # so deliver them directly from the worker thread rather than via the GUI event loop
+            self.detection_worker.signals.face_count_ready.connect(
+                self.detection_thread.update_face_count, Qt.DirectConnection)
+            self.detection_worker.signals.stats_updated.connect(
+                self.detection_thread.update_pipeline_stats, Qt.DirectConnection)
+            self.detection_worker.signals.detection_ready.connect(self.webcam_view.update_detection)
+            self.detection_worker.signals.error_occurred.connect(self._handle_error)
+
             # Create frame processing timer
             self.frame_timer = QTimer(self)
             self.frame_timer.timeout.connect(self._process_frame)
@@ -319,9 +384,16 @@ class MainWindow(QMainWindow):
             # Start detection thread
             self.detection_thread.start()  # .start() is an inherited method from the QThread class, it calls the run function in a Qthread
 
-            # Start frame processing timer
+            # Start detection worker
+            self.detection_worker.reset_stats()
+            self.detection_worker.start()
+
+            # Start frame processing timer at the full rate (~33 fps), the scheduler adjusts it
             # TODO: increase this? https://chatgpt.com/share/681f55ed-8ab4-800d-99f4-800a6a2c6abd
-            self.frame_timer.start(30)  # Process frames every 30ms (~33 fps)
+            self.frame_scheduler.reset()
+            self.face_detector.reset_gate()
+            self.face_detector.reset_tracking()
+            self.frame_timer.start(self.frame_scheduler.interval_ms)
 
             # Update state and UI
             self.is_monitoring = True
@@ -357,6 +429,13 @@ class MainWindow(QMainWindow):
             # Stop frame timer
             if self.frame_timer and self.frame_timer.isActive():
                 self.frame_timer.stop()
+            if self.webcam_manager:
+                self.webcam_manager.capture_interval = 0.0
+
+            # Stop detection worker before the manager so no late face counts arrive
+            if self.detection_worker and self.detection_worker.isRunning():
+                self.detection_worker.stop()
+                self.detection_worker.wait()
 
             # Stop detection thread
             if self.detection_thread and self.detection_thread.isRunning():
@@ -396,22 +475,29 @@ class MainWindow(QMainWindow):
     def _process_frame(self):
         """Process a webcam frame."""
         try:
-            # Read frame from webcam
-            success, frame = self.webcam_manager.read_frame()
-            if not success or frame is None:
-                return
-
-            # Detect faces
-            num_faces, bboxes, _, num_looking = self.face_detector.detect(frame)
-
-            # Update detection manager - use num_looking for EyesOff model, num_faces for others
-            detector_type = self.face_detector.detector_type.lower()
-            if detector_type == 'eyes_off_model':
-                # For EyesOff model, use number of people looking
-                self.detection_thread.update_face_count(num_looking)
+            # Follow the scheduler's rate - in idle mode the capture thread also skips decoding
+            # the frames between two timer ticks
+            interval_ms = self.frame_scheduler.interval_ms
+            if self.frame_timer.interval() != interval_ms:
+                self.frame_timer.setInterval(interval_ms)
+                idle = self.frame_scheduler.mode == AdaptiveFrameScheduler.MODE_IDLE
+                # Decode slightly before the next tick so a fresh frame is waiting
+                self.webcam_manager.capture_interval = max(0.0, interval_ms / 1000.0 - 0.05) if idle else 0.0
+
+            # Read frame from webcam - in threaded capture mode this returns immediately
+            # with the freshest frame, or nothing if the camera has not delivered a new one
+            if self.webcam_manager.frame_pool is not None:
+                # Pooled capture - pass the buffer on without copying, the worker takes our reference
+                frame = self.webcam_manager.read_frame_buffer()
+                if frame is None:
+                    return
             else:
-                # For other models, use total number of faces
-                self.detection_thread.update_face_count(num_faces)
+                success, frame = self.webcam_manager.read_frame()
+                if not success or frame is None:
+                    return
+
+            # Hand the frame to the detection worker - dropped if it is still busy with the last one
+            self.detection_worker.submit(frame)
 
         except Exception as e:
             self._handle_error(f"Error processing frame: {e}")
@@ -426,14 +512,34 @@ class MainWindow(QMainWindow):
         try:
             # Update webcam settings
             if self.webcam_manager:
+                # Capture mode takes effect when the camera is (re)started below
+                capture_mode_changed = False
+                if 'capture_mode' in settings and settings['capture_mode'] != self.webcam_manager.capture_mode:
+                    self.webcam_manager.capture_mode = settings['capture_mode']
+                    capture_mode_changed = True
+                if 'mjpeg_reduced_decode' in settings and settings['mjpeg_reduced_decode'] != self.webcam_manager.reduced_decode:
+                    self.webcam_manager.reduced_decode = settings['mjpeg_reduced_decode']
+                    capture_mode_changed = True
+
                 # Check if camera changed
                 if 'camera_id' in settings:
                     self.webcam_manager.set_camera(settings['camera_id'])
+                elif capture_mode_changed:
+                    self.webcam_manager.set_camera(self.webcam_manager.camera_id)
 
             # Update detector settings
             if self.face_detector:
                 detector_settings = {k: v for k, v in settings.items()
-                                   if k in ('detector_type', 'model_path', 'confidence_threshold')}
+                                   if k in ('detector_type', 'model_path', 'confidence_threshold',
+                                            'motion_gate', 'motion_gate_max_interval',
+                                            'face_tracking', 'detection_interval',
+                                            'gaze_cache', 'gaze_cache_max_age',
+                                            'roi_detection', 'full_scan_interval',
+                                            'tiled_detection', 'tile_sweep_interval',
+                                            'adaptive_input_size', 'input_size_min', 'input_size_max',
+                                            'face_threshold', 'gaze_cascade', 'head_pose_filter',
+                                            'head_pose_max_yaw', 'head_pose_max_pitch',
+                                            'gaze_max_per_frame', 'gaze_time_budget_ms', *ORT_CONFIG_KEYS)}
                 if detector_settings:
                     self.face_detector.update_settings(detector_settings)
 
@@ -441,6 +547,10 @@ class MainWindow(QMainWindow):
             if self.detection_thread:
                 self.detection_thread.update_settings(settings)
 
+            # Update frame rate scheduler settings
+            if self.frame_scheduler:
+                self.frame_scheduler.update_settings(settings)
+
             # Update webcam view settings
             if self.webcam_view:
                 # Update face threshold
@@ -612,8 +722,11 @@ class MainWindow(QMainWindow):
     def _capture_webcam_on_alert(self):
         """
         Take a capture of the webcam when we show the alert for user review later
+
+        Uses the current stream frame - switching the camera to full resolution would
+        pause capture and detection right when the alert fires
         """
-        self.webcam_view.on_snapshot_clicked()
+        self.webcam_view.save_snapshot(full_resolution=False)
 
     def _on_show_alert(self):
         """Handle signal to show the alert dialog."""
@@ -746,6 +859,21 @@ class MainWindow(QMainWindow):
         if 'alert_count' in stats:
             status_parts.append(f"Alerts: {stats['alert_count']}")
 
+        # Frames dropped because detection could not keep up
+        dropped_frames = stats.get('pipeline', {}).get('dropped_frames')
+        if dropped_frames:
+            status_parts.append(f"Dropped frames: {dropped_frames}")
+
+        # Frame rate scheduler state
+        scheduler_stats = stats.get('pipeline', {}).get('scheduler')
+        if scheduler_stats:
+            status_parts.append(f"{scheduler_stats['mode'].capitalize()}: {scheduler_stats['effective_fps']:.1f} fps")
+
+        # YuNet input size of the last detector run
+        input_stats = stats.get('pipeline', {}).get('detector_input')
+        if input_stats:
+            status_parts.append(f"Detection size: {input_stats['input_size']}px")
+
         # Session time
         if stats.get('session_start_time'):
             elapsed_time = time.time() - stats['session_start_time']
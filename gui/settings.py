@@ -8,6 +8,7 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
                              QPushButton, QSlider, QLineEdit, QFileDialog, QGroupBox,
                              QFormLayout, QColorDialog, QGridLayout, QRadioButton, QMessageBox)
 
+from core.camera_enumerator import get_camera_enumerator
 from core.detector import FaceDetector
 from core.webcam import WebcamManager
 from utils.config import ConfigManager
@@ -97,7 +98,11 @@ class SettingsPanel(QWidget):
         self.config_manager = config_manager
         self.platform_manager = get_platform_manager()
         self.available_models = FaceDetector.get_available_models()
-        self.available_cameras = WebcamManager.get_device_list()
+
+        # Cached camera list - refreshed in the background, the combo is repopulated when it arrives
+        self.camera_enumerator = get_camera_enumerator()
+        self.available_cameras = self.camera_enumerator.get_cameras()
+        self.camera_enumerator.cameras_updated.connect(self._on_cameras_updated)
 
         # Define mapping between user-friendly names and internal model types
         self.MODEL_TYPE_MAPPING = {
@@ -354,12 +359,28 @@ class SettingsPanel(QWidget):
         
         # Camera device combo box
         self.camera_combo = QComboBox()
-        # Get available cameras
-        for cam_idx in self.available_cameras:
-            # self.camera_combo.addItems([f"Camera {cam_idx}"])
-            display_name = WebcamManager.get_camera_display_name(cam_idx)
-            self.camera_combo.addItem(display_name, cam_idx)
+        self._populate_camera_combo(self.config_manager.get("camera_id", 0))
         camera_layout.addRow("Camera Device:", self.camera_combo)
+
+        # Low resolution detection stream
+        self.low_res_capture_check = QCheckBox()
+        self.low_res_capture_check.setToolTip(
+            "Stream at a detection-sized resolution and only switch to full resolution for snapshots")
+        camera_layout.addRow("Low Resolution Stream:", self.low_res_capture_check)
+
+        # Reduced-scale MJPEG decoding for the low resolution stream
+        self.reduced_decode_check = QCheckBox()
+        self.reduced_decode_check.setToolTip(
+            "Decode the camera's full resolution MJPEG stream at reduced scale instead of lowering the "
+            "camera resolution. Saves CPU on high resolution webcams; not all cameras support it")
+        camera_layout.addRow("Reduced-Scale Decoding:", self.reduced_decode_check)
+
+        # Forget cached camera capabilities, e.g. after swapping a camera
+        self.redetect_camera_button = QPushButton("Re-detect")
+        self.redetect_camera_button.setToolTip(
+            "Forget the stored resolutions and settings of all cameras, they are probed again on the next start")
+        self.redetect_camera_button.clicked.connect(self._on_redetect_camera_clicked)
+        camera_layout.addRow("Camera Capabilities:", self.redetect_camera_button)
         
         camera_group.setLayout(camera_layout)
         
@@ -370,6 +391,40 @@ class SettingsPanel(QWidget):
         tab.setLayout(layout)
         return tab
     
+    def _populate_camera_combo(self, selected_camera_id: int):
+        """
+        Fill the camera combo from the cached camera list.
+
+        Args:
+            selected_camera_id: Camera ID to keep selected
+        """
+        self.camera_combo.blockSignals(True)
+        self.camera_combo.clear()
+
+        for camera_info in self.available_cameras:
+            self.camera_combo.addItem(self.camera_enumerator.get_display_name(camera_info['id']), camera_info['id'])
+
+        # Keep the configured camera selectable while enumeration is still running
+        if self.camera_combo.findData(selected_camera_id) < 0:
+            self.camera_combo.addItem(f"Camera {selected_camera_id}", selected_camera_id)
+
+        self.camera_combo.setCurrentIndex(self.camera_combo.findData(selected_camera_id))
+        self.camera_combo.blockSignals(False)
+
+    @pyqtSlot(list)
+    def _on_cameras_updated(self, cameras: list):
+        """
+        Handle a finished background camera enumeration.
+
+        Args:
+            cameras: List of camera info dicts
+        """
+        self.available_cameras = cameras
+        selected_camera_id = self.camera_combo.currentData()
+        if selected_camera_id is None:
+            selected_camera_id = self.config_manager.get("camera_id", 0)
+        self._populate_camera_combo(selected_camera_id)
+
     def _create_app_tab(self) -> QWidget:
         """
         Create the application settings tab.
@@ -430,6 +485,30 @@ class SettingsPanel(QWidget):
 
         # Model selection combo box
         self.model_path_combo = QComboBox()
+        self.model_path_combo.setToolTip(
+            "Model file to use - '_int8' models are faster quantized versions built with utils/quantize_models.py")
+        advanced_detection_layout.addRow("Model File:", self.model_path_combo)
+
+        # Adaptive YuNet input size
+        self.adaptive_input_size_check = QCheckBox()
+        self.adaptive_input_size_check.setToolTip(
+            "Search at a lower resolution while everyone is close to the camera and at a higher "
+            "resolution after smaller (more distant) faces were seen")
+        advanced_detection_layout.addRow("Adaptive Detection Size:", self.adaptive_input_size_check)
+
+        # Tiled full-resolution sweeps
+        self.tiled_detection_check = QCheckBox()
+        self.tiled_detection_check.setToolTip(
+            "Regularly search the camera image at full resolution to find people standing further away "
+            "(uses noticeably more CPU during each search, needs face tracking)")
+        advanced_detection_layout.addRow("Detect Distant Faces:", self.tiled_detection_check)
+
+        self.tile_sweep_interval_spin = QDoubleSpinBox()
+        self.tile_sweep_interval_spin.setRange(1.0, 60.0)
+        self.tile_sweep_interval_spin.setSingleStep(1.0)
+        self.tile_sweep_interval_spin.setDecimals(0)
+        self.tile_sweep_interval_spin.setToolTip("Seconds between full-resolution searches")
+        advanced_detection_layout.addRow("Distant Face Search Every (s):", self.tile_sweep_interval_spin)
 
         advanced_detection_group.setLayout(advanced_detection_layout)
 
@@ -477,6 +556,143 @@ class SettingsPanel(QWidget):
 
         threshold_group.setLayout(threshold_layout)
 
+        # Power group - adaptive frame rate
+        power_group = QGroupBox("Power")
+        power_layout = QFormLayout()
+
+        self.adaptive_frame_rate_check = QCheckBox()
+        self.adaptive_frame_rate_check.setToolTip(
+            "Process fewer frames while the scene is stable to save CPU and battery")
+        power_layout.addRow("Adaptive Frame Rate:", self.adaptive_frame_rate_check)
+
+        self.idle_fps_spin = QDoubleSpinBox()
+        self.idle_fps_spin.setRange(0.5, 15.0)
+        self.idle_fps_spin.setSingleStep(0.5)
+        self.idle_fps_spin.setDecimals(1)
+        self.idle_fps_spin.setToolTip("Frames processed per second while the scene is stable")
+        power_layout.addRow("Idle Frame Rate (fps):", self.idle_fps_spin)
+
+        self.idle_after_spin = QDoubleSpinBox()
+        self.idle_after_spin.setRange(1.0, 300.0)
+        self.idle_after_spin.setSingleStep(1.0)
+        self.idle_after_spin.setDecimals(0)
+        self.idle_after_spin.setToolTip("Seconds without changes before switching to the idle frame rate")
+        power_layout.addRow("Idle After (s):", self.idle_after_spin)
+
+        self.motion_gate_check = QCheckBox()
+        self.motion_gate_check.setToolTip(
+            "Reuse the previous detection while nothing in the frame changes "
+            "(detection still runs at least once a second)")
+        power_layout.addRow("Skip Unchanged Frames:", self.motion_gate_check)
+
+        self.face_tracking_check = QCheckBox()
+        self.face_tracking_check.setToolTip(
+            "Follow faces between detector runs instead of detecting them in every frame "
+            "(detection still runs when a face is lost or someone new moves into view)")
+        power_layout.addRow("Track Faces Between Detections:", self.face_tracking_check)
+        # Distant faces found by a sweep are only kept by the tracker
+        self.face_tracking_check.toggled.connect(self.tiled_detection_check.setEnabled)
+
+        self.detection_interval_spin = QSpinBox()
+        self.detection_interval_spin.setRange(1, 30)
+        self.detection_interval_spin.setToolTip("Frames between detector runs while tracking faces")
+        power_layout.addRow("Detect Every (frames):", self.detection_interval_spin)
+
+        self.roi_detection_check = QCheckBox()
+        self.roi_detection_check.setToolTip(
+            "Between full-frame scans, only search around known faces and along the frame edges "
+            "(the whole frame is still scanned at least once a second)")
+        power_layout.addRow("Search Near Known Faces:", self.roi_detection_check)
+
+        self.gaze_cascade_check = QCheckBox()
+        self.gaze_cascade_check.setToolTip(
+            "Only check where people are looking when enough faces are in view to trigger the alert")
+        power_layout.addRow("Check Gaze Only When Needed:", self.gaze_cascade_check)
+
+        self.head_pose_filter_check = QCheckBox()
+        self.head_pose_filter_check.setToolTip(
+            "Count people whose head is turned away from the camera as not looking, "
+            "without checking their gaze")
+        power_layout.addRow("Skip Faces Turned Away:", self.head_pose_filter_check)
+
+        self.head_pose_max_yaw_spin = QDoubleSpinBox()
+        self.head_pose_max_yaw_spin.setRange(10.0, 90.0)
+        self.head_pose_max_yaw_spin.setSingleStep(5.0)
+        self.head_pose_max_yaw_spin.setDecimals(0)
+        self.head_pose_max_yaw_spin.setToolTip("Faces turned further left or right than this are skipped")
+        power_layout.addRow("Max Head Turn (°):", self.head_pose_max_yaw_spin)
+
+        self.head_pose_max_pitch_spin = QDoubleSpinBox()
+        self.head_pose_max_pitch_spin.setRange(10.0, 90.0)
+        self.head_pose_max_pitch_spin.setSingleStep(5.0)
+        self.head_pose_max_pitch_spin.setDecimals(0)
+        self.head_pose_max_pitch_spin.setToolTip("Faces tilted further up or down than this are skipped")
+        power_layout.addRow("Max Head Tilt (°):", self.head_pose_max_pitch_spin)
+
+        self.gaze_max_per_frame_spin = QSpinBox()
+        self.gaze_max_per_frame_spin.setRange(0, 50)
+        self.gaze_max_per_frame_spin.setSpecialValueText("No limit")
+        self.gaze_max_per_frame_spin.setToolTip(
+            "With more people in view, gaze is checked for this many per frame and the others "
+            "keep their last result until their turn - people not checked yet count as looking")
+        power_layout.addRow("Max Gaze Checks per Frame:", self.gaze_max_per_frame_spin)
+
+        self.gaze_time_budget_spin = QDoubleSpinBox()
+        self.gaze_time_budget_spin.setRange(0.0, 500.0)
+        self.gaze_time_budget_spin.setSingleStep(5.0)
+        self.gaze_time_budget_spin.setDecimals(0)
+        self.gaze_time_budget_spin.setSpecialValueText("No limit")
+        self.gaze_time_budget_spin.setToolTip("Most time spent checking gaze per frame")
+        power_layout.addRow("Gaze Time Budget (ms):", self.gaze_time_budget_spin)
+
+        self.gaze_cache_check = QCheckBox()
+        self.gaze_cache_check.setToolTip(
+            "Reuse the gaze result of a tracked face while it does not change "
+            "(each face is still re-checked at least once a second)")
+        power_layout.addRow("Reuse Gaze Results:", self.gaze_cache_check)
+
+        power_group.setLayout(power_layout)
+
+        # ONNX Runtime session of the gaze model - applied by reloading the model
+        runtime_group = QGroupBox("Gaze Model Runtime")
+        runtime_layout = QFormLayout()
+
+        self.ort_intra_op_threads_spin = QSpinBox()
+        self.ort_intra_op_threads_spin.setRange(0, 32)
+        self.ort_intra_op_threads_spin.setSpecialValueText("All cores")
+        self.ort_intra_op_threads_spin.setToolTip(
+            "CPU threads the gaze model may use - fewer leaves more for your other apps")
+        runtime_layout.addRow("Threads:", self.ort_intra_op_threads_spin)
+
+        self.ort_inter_op_threads_spin = QSpinBox()
+        self.ort_inter_op_threads_spin.setRange(0, 32)
+        self.ort_inter_op_threads_spin.setSpecialValueText("All cores")
+        self.ort_inter_op_threads_spin.setToolTip("Threads running model layers side by side (parallel mode only)")
+        runtime_layout.addRow("Parallel Threads:", self.ort_inter_op_threads_spin)
+
+        self.ort_graph_optimization_combo = QComboBox()
+        for label, value in (("None", "disabled"), ("Basic", "basic"), ("Extended", "extended"), ("All", "all")):
+            self.ort_graph_optimization_combo.addItem(label, value)
+        self.ort_graph_optimization_combo.setToolTip("How much the model is optimised when it is loaded")
+        runtime_layout.addRow("Graph Optimisation:", self.ort_graph_optimization_combo)
+
+        self.ort_execution_mode_combo = QComboBox()
+        for label, value in (("Sequential", "sequential"), ("Parallel", "parallel")):
+            self.ort_execution_mode_combo.addItem(label, value)
+        self.ort_execution_mode_combo.setToolTip("Run independent model layers one after another or side by side")
+        runtime_layout.addRow("Execution Mode:", self.ort_execution_mode_combo)
+
+        self.ort_memory_arena_check = QCheckBox()
+        self.ort_memory_arena_check.setToolTip("Keep memory between runs instead of allocating it for every frame")
+        runtime_layout.addRow("Reuse Memory:", self.ort_memory_arena_check)
+
+        self.ort_thread_spinning_check = QCheckBox()
+        self.ort_thread_spinning_check.setToolTip(
+            "Keep model threads busy-waiting between frames - slightly faster, but uses CPU while idle")
+        runtime_layout.addRow("Busy-Wait Threads:", self.ort_thread_spinning_check)
+
+        runtime_group.setLayout(runtime_layout)
+
         # Privacy group
         privacy_group = QGroupBox("Privacy")
         privacy_layout = QFormLayout()
@@ -492,6 +708,8 @@ class SettingsPanel(QWidget):
         # Add all groups to tab layout
         layout.addWidget(advanced_detection_group)
         layout.addWidget(threshold_group)
+        layout.addWidget(power_group)
+        layout.addWidget(runtime_group)
         layout.addWidget(privacy_group)
         layout.addStretch(1)
 
@@ -513,13 +731,40 @@ class SettingsPanel(QWidget):
             self._on_model_type_changed(friendly_name)  # Populate model path combo
 
             model_path = self.config_manager.get("model_path", "")
-            index = self.model_path_combo.findText(model_path)
+            index = self.model_path_combo.findData(model_path)
             if index >= 0:
                 self.model_path_combo.setCurrentIndex(index)
 
             self.face_threshold_spin.setValue(self.config_manager.get("face_threshold", 1))
             self.debounce_spin.setValue(self.config_manager.get("debounce_time", 1.0))
             self.detection_delay_spin.setValue(self.config_manager.get("detection_delay", 0.2))
+
+            self.adaptive_frame_rate_check.setChecked(self.config_manager.get("adaptive_frame_rate", self.config_manager.default_config["adaptive_frame_rate"]))
+            self.idle_fps_spin.setValue(self.config_manager.get("idle_fps", 2.0))
+            self.idle_after_spin.setValue(self.config_manager.get("idle_after_seconds", 10.0))
+            self.motion_gate_check.setChecked(self.config_manager.get("motion_gate", self.config_manager.default_config["motion_gate"]))
+            self.face_tracking_check.setChecked(self.config_manager.get("face_tracking", self.config_manager.default_config["face_tracking"]))
+            self.detection_interval_spin.setValue(self.config_manager.get("detection_interval", 5))
+            self.roi_detection_check.setChecked(self.config_manager.get("roi_detection", self.config_manager.default_config["roi_detection"]))
+            self.adaptive_input_size_check.setChecked(self.config_manager.get("adaptive_input_size", self.config_manager.default_config["adaptive_input_size"]))
+            self.tiled_detection_check.setChecked(self.config_manager.get("tiled_detection", False))
+            self.tiled_detection_check.setEnabled(self.face_tracking_check.isChecked())
+            self.tile_sweep_interval_spin.setValue(self.config_manager.get("tile_sweep_interval", 5.0))
+            self.gaze_cascade_check.setChecked(self.config_manager.get("gaze_cascade", self.config_manager.default_config["gaze_cascade"]))
+            self.ort_intra_op_threads_spin.setValue(self.config_manager.get("ort_intra_op_threads", 2))
+            self.ort_inter_op_threads_spin.setValue(self.config_manager.get("ort_inter_op_threads", 1))
+            self.ort_graph_optimization_combo.setCurrentIndex(max(0, self.ort_graph_optimization_combo.findData(
+                self.config_manager.get("ort_graph_optimization", "all"))))
+            self.ort_execution_mode_combo.setCurrentIndex(max(0, self.ort_execution_mode_combo.findData(
+                self.config_manager.get("ort_execution_mode", "sequential"))))
+            self.ort_memory_arena_check.setChecked(self.config_manager.get("ort_memory_arena", True))
+            self.ort_thread_spinning_check.setChecked(self.config_manager.get("ort_thread_spinning", False))
+            self.gaze_max_per_frame_spin.setValue(self.config_manager.get("gaze_max_per_frame", self.config_manager.default_config["gaze_max_per_frame"]))
+            self.gaze_time_budget_spin.setValue(self.config_manager.get("gaze_time_budget_ms", 0.0))
+            self.head_pose_filter_check.setChecked(self.config_manager.get("head_pose_filter", self.config_manager.default_config["head_pose_filter"]))
+            self.head_pose_max_yaw_spin.setValue(self.config_manager.get("head_pose_max_yaw", 45.0))
+            self.head_pose_max_pitch_spin.setValue(self.config_manager.get("head_pose_max_pitch", 40.0))
+            self.gaze_cache_check.setChecked(self.config_manager.get("gaze_cache", True))
             # Load gaze threshold
             gaze_threshold = self.config_manager.get("gaze_threshold", 0.6)
             self.alert_sensitivity_slider.setValue(self._threshold_to_slider(gaze_threshold))
@@ -568,10 +813,11 @@ class SettingsPanel(QWidget):
 
             # Camera tab
             camera_id = self.config_manager.get("camera_id", 0)
-            try:
-                self.camera_combo.setCurrentIndex(camera_id)
-            except:
-                self.camera_combo.setCurrentIndex(0)
+            self._populate_camera_combo(camera_id)
+
+            self.low_res_capture_check.setChecked(
+                self.config_manager.get("capture_mode", WebcamManager.CAPTURE_MODE_DETECTION) == WebcamManager.CAPTURE_MODE_DETECTION)
+            self.reduced_decode_check.setChecked(self.config_manager.get("mjpeg_reduced_decode", False))
 
             # Add setting for getting the snapshot path
             self.path_edit.setText(self.config_manager.get("snapshot_path", ""))
@@ -598,8 +844,15 @@ class SettingsPanel(QWidget):
         self.model_path_combo.clear()
         
         if model_type in self.available_models and self.available_models[model_type]:
-            self.model_path_combo.addItems(self.available_models[model_type])
+            for model_path in self.available_models[model_type]:
+                self.model_path_combo.addItem(os.path.basename(model_path), model_path)
     
+    def _on_redetect_camera_clicked(self):
+        """Handle camera capability re-detect button click."""
+        self.config_manager.get_camera_capability_cache().invalidate()
+        QMessageBox.information(self, "Camera Capabilities",
+                                "Camera capabilities will be detected again the next time monitoring starts.")
+
     def _on_alert_sound_toggled(self, checked: bool):
         """
         Handle alert sound checkbox toggle.
@@ -768,13 +1021,36 @@ class SettingsPanel(QWidget):
         # TODO: reorder these based on new tab setup
         # Detection tab
         settings["detector_type"] = self.MODEL_TYPE_MAPPING.get(self.model_type_combo.currentText(), "yunet")
-        settings["model_path"] = self.model_path_combo.currentText()
+        settings["model_path"] = self.model_path_combo.currentData() or ""
         # Confidence threshold is a measure of how confident we are something is a face - it is now linked to the gaze_threshold.
         settings["confidence_threshold"] = self._gaze_to_face_threshold(gaze_threshold_value)
         settings["gaze_threshold"] = gaze_threshold_value
         settings["face_threshold"] = self.face_threshold_spin.value()
         settings["debounce_time"] = self.debounce_spin.value()
         settings["detection_delay"] = self.detection_delay_spin.value()
+        settings["adaptive_frame_rate"] = self.adaptive_frame_rate_check.isChecked()
+        settings["idle_fps"] = self.idle_fps_spin.value()
+        settings["idle_after_seconds"] = self.idle_after_spin.value()
+        settings["motion_gate"] = self.motion_gate_check.isChecked()
+        settings["face_tracking"] = self.face_tracking_check.isChecked()
+        settings["detection_interval"] = self.detection_interval_spin.value()
+        settings["roi_detection"] = self.roi_detection_check.isChecked()
+        settings["adaptive_input_size"] = self.adaptive_input_size_check.isChecked()
+        settings["tiled_detection"] = self.tiled_detection_check.isChecked()
+        settings["tile_sweep_interval"] = self.tile_sweep_interval_spin.value()
+        settings["gaze_cascade"] = self.gaze_cascade_check.isChecked()
+        settings["ort_intra_op_threads"] = self.ort_intra_op_threads_spin.value()
+        settings["ort_inter_op_threads"] = self.ort_inter_op_threads_spin.value()
+        settings["ort_graph_optimization"] = self.ort_graph_optimization_combo.currentData()
+        settings["ort_execution_mode"] = self.ort_execution_mode_combo.currentData()
+        settings["ort_memory_arena"] = self.ort_memory_arena_check.isChecked()
+        settings["ort_thread_spinning"] = self.ort_thread_spinning_check.isChecked()
+        settings["gaze_max_per_frame"] = self.gaze_max_per_frame_spin.value()
+        settings["gaze_time_budget_ms"] = self.gaze_time_budget_spin.value()
+        settings["head_pose_filter"] = self.head_pose_filter_check.isChecked()
+        settings["head_pose_max_yaw"] = self.head_pose_max_yaw_spin.value()
+        settings["head_pose_max_pitch"] = self.head_pose_max_pitch_spin.value()
+        settings["gaze_cache"] = self.gaze_cache_check.isChecked()
 
         # Alert tab
         settings["alert_on"] = self.screen_alert_radio.isChecked()
@@ -800,7 +1076,11 @@ class SettingsPanel(QWidget):
         settings["alert_sound_file"] = self.alert_sound_edit.text()
 
         # Camera tab
-        settings["camera_id"] = self.camera_combo.currentIndex()
+        camera_id = self.camera_combo.currentData()
+        settings["camera_id"] = camera_id if camera_id is not None else self.camera_combo.currentIndex()
+        settings["capture_mode"] = (WebcamManager.CAPTURE_MODE_DETECTION if self.low_res_capture_check.isChecked()
+                                    else WebcamManager.CAPTURE_MODE_FULL)
+        settings["mjpeg_reduced_decode"] = self.reduced_decode_check.isChecked()
 
         # App tab
         settings["snapshot_path"] = self.path_edit.text()
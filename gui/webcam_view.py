@@ -1,6 +1,7 @@
 import os
+import threading
 import time
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional, Union
 
 import cv2
 import numpy as np
@@ -8,6 +9,7 @@ from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QPixmap
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton, QSizePolicy
 
+from core.frame_pool import FrameBuffer
 from utils.display import cv_to_pixmap, apply_pixelation
 from gui.webcam_info_panel import WebcamInfoPanel
 
@@ -28,6 +30,8 @@ class WebcamView(QWidget):
         self.last_frame = None
         self.current_frame = None
         self.detection_result = None
+        # Pooled buffer backing detection_result, held until the next detection replaces it
+        self._detection_buffer = None
         self.num_faces = 0
         self.num_looking = 0
         self.bboxes = []
@@ -42,6 +46,11 @@ class WebcamView(QWidget):
 
         # Dir to save snapshots
         self.dir_to_save = None
+
+        # Optional callable returning a full resolution frame for snapshots, used when the
+        # displayed stream runs at a reduced detection resolution
+        self.full_resolution_provider = None
+        self._snapshot_thread = None
         
         # Create info panel widget
         self.info_panel = WebcamInfoPanel(self)
@@ -93,27 +102,41 @@ class WebcamView(QWidget):
         Args:
             frame: New frame to display
         """
+        # Only the frame's presence and size are used (the annotated detection frame is what
+        # gets displayed), so keep a reference instead of copying every frame
         self.last_frame = self.current_frame
-        self.current_frame = frame.copy()
+        self.current_frame = frame
 
         if self.detection_result is not None:
             self._update_display()
 
-    @pyqtSlot(int, list, np.ndarray, int)
-    def update_detection(self, num_faces: int, bboxes: List[Tuple[int, int, int, int]], annotated_frame: np.ndarray, num_looking: int):
+    @pyqtSlot(int, list, object, int)
+    def update_detection(self, num_faces: int, bboxes: List[Tuple[int, int, int, int]],
+                         annotated_frame: Union[np.ndarray, FrameBuffer], num_looking: int):
         """
         Update detection results.
 
         Args:
             num_faces: Number of faces detected
             bboxes: Bounding boxes of detected faces
-            annotated_frame: Frame with detection annotations
+            annotated_frame: Frame with detection annotations - a new array owned by the view,
+                or a pooled FrameBuffer whose reference passes to the view
         """
+        previous_buffer = self._detection_buffer
+        if isinstance(annotated_frame, FrameBuffer):
+            self._detection_buffer = annotated_frame
+            annotated_frame = annotated_frame.array
+        else:
+            self._detection_buffer = None
+
         self.num_faces = num_faces
         self.bboxes = bboxes
-        self.detection_result = annotated_frame.copy()
+        self.detection_result = annotated_frame
         self.num_looking = num_looking
 
+        if previous_buffer is not None:
+            previous_buffer.release()
+
         # Update display if we have a current frame
         if self.current_frame is not None:
             self._update_display()
@@ -151,8 +174,9 @@ class WebcamView(QWidget):
         if self.current_frame is None:
             return
 
-        # Start with the annotated frame from detection (includes bounding boxes)
-        display_frame = self.detection_result.copy()
+        # Start with the annotated frame from detection (includes bounding boxes) - it is only
+        # read here: pixelation works on its own copy and cv_to_pixmap converts into a new image
+        display_frame = self.detection_result
 
         # Apply privacy mode if enabled
         if self.privacy_mode and self.bboxes:
@@ -208,6 +232,17 @@ class WebcamView(QWidget):
     # TODO - Make this behaviour activate by default but add an option to turn it off
     def on_snapshot_clicked(self):
         """Handle snapshot button click."""
+        self.save_snapshot(full_resolution=True)
+
+    def save_snapshot(self, full_resolution: bool = False):
+        """
+        Save the current detection result as a snapshot.
+
+        Args:
+            full_resolution: Prefer a full resolution frame with the detections scaled onto
+                it. Switching the camera to full resolution takes a moment, so the frame is
+                captured and saved on a background thread
+        """
         if self.current_frame is not None:
             # Get timestamp for filename
             timestamp = time.strftime("%Y%m%d-%H%M%S")
@@ -220,12 +255,64 @@ class WebcamView(QWidget):
 
             path_to_save = os.path.expanduser(os.path.join(self.dir_to_save, filename))
 
-            # Save current display frame
-            if self.detection_result is not None:
-                cv2.imwrite(path_to_save, self.detection_result)
+            if full_resolution and self.full_resolution_provider is not None:
+                if self._snapshot_thread is not None and self._snapshot_thread.is_alive():
+                    return  # A full resolution snapshot is still being taken
+                # The detection result is a pooled buffer - keep a copy as the fallback
+                fallback = None if self.detection_result is None else self.detection_result.copy()
+                self._snapshot_thread = threading.Thread(
+                    target=self._save_full_resolution_snapshot,
+                    args=(path_to_save, fallback, list(self.bboxes), self.current_frame.shape[:2]),
+                    name="EyesOffSnapshot", daemon=True)
+                self._snapshot_thread.start()
+                return
+
+            self._write_snapshot(path_to_save, self.detection_result)
+
+    def _save_full_resolution_snapshot(self, path_to_save: str, fallback: Optional[np.ndarray],
+                                       bboxes: List[Tuple[int, int, int, int]], stream_shape: Tuple[int, int]):
+        """Capture a full resolution snapshot and save it, or the fallback if none is available."""
+        snapshot = self._get_full_resolution_snapshot(bboxes, stream_shape)
+        self._write_snapshot(path_to_save, snapshot if snapshot is not None else fallback)
+
+    def _write_snapshot(self, path_to_save: str, snapshot: Optional[np.ndarray]):
+        """Write a snapshot image to disk."""
+        if snapshot is not None:
+            cv2.imwrite(path_to_save, snapshot)
+
+            # TODO - Add a notification to tell the user the snapshot was saved
+            print(f"Snapshot saved as {os.path.basename(path_to_save)}")
+
+    def _get_full_resolution_snapshot(self, bboxes: List[Tuple[int, int, int, int]],
+                                      stream_shape: Tuple[int, int]) -> Optional[np.ndarray]:
+        """
+        Get a full resolution frame with the given bounding boxes drawn on it.
+
+        Args:
+            bboxes: Bounding boxes in the stream's coordinates
+            stream_shape: (height, width) of the stream the boxes belong to
+
+        Returns:
+            Annotated full resolution frame, or None if no provider is set or it is
+            no larger than the stream
+        """
+        if self.full_resolution_provider is None:
+            return None
+
+        full_frame = self.full_resolution_provider()
+        if full_frame is None or full_frame.shape[1] <= stream_shape[1]:
+            return None
+
+        # Bounding boxes are in the stream's coordinates
+        scale_x = full_frame.shape[1] / stream_shape[1]
+        scale_y = full_frame.shape[0] / stream_shape[0]
+        thickness = max(2, int(2 * scale_x))
+        for (x, y, w, h) in bboxes:
+            start_point = (int(x * scale_x), int(y * scale_y))
+            end_point = (int((x + w) * scale_x), int((y + h) * scale_y))
+            cv2.rectangle(full_frame, start_point, end_point, (0, 0, 255), thickness)
 
-                # TODO - Add a notification to tell the user the snapshot was saved
-                print(f"Snapshot saved as {filename}")
+        return full_frame
 
     def set_monitoring_state(self, is_monitoring: bool):
         """
@@ -252,6 +339,9 @@ class WebcamView(QWidget):
         self.alert_active = False
         self.current_frame = None
         self.detection_result = None
+        if self._detection_buffer is not None:
+            self._detection_buffer.release()
+            self._detection_buffer = None
         self.num_faces = 0
         self.bboxes = []
 
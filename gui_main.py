@@ -7,6 +7,7 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QApplication, QDialog
 
+from core.frame_source import create_frame_source
 from gui.main_window import MainWindow
 
 
@@ -20,6 +21,10 @@ def parse_arguments():
                         help="Path to custom configuration file")
     parser.add_argument("--reset", action="store_true",
                         help="Reset all settings to defaults")
+    parser.add_argument("--source", type=str,
+                        help="Read frames from 'video:<path>', 'images:<dir>' or 'synthetic[:<w>x<h>]' instead of the camera")
+    parser.add_argument("--fast", action="store_true",
+                        help="Deliver --source frames as fast as possible instead of in real time")
     
     return parser.parse_args()
 
@@ -45,8 +50,11 @@ def main():
     # Disable the ? button in dialogs on Windows
     app.setAttribute(Qt.AA_DisableWindowContextHelpButton)
     
+    # Optional non-camera frame source
+    frame_source = create_frame_source(args.source, realtime=not args.fast) if args.source else None
+
     # Create the main window
-    window = MainWindow()
+    window = MainWindow(frame_source=frame_source)
     
     # Handle startup options
     if args.reset:
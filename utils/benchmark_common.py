@@ -0,0 +1,125 @@
+"""
+Helpers shared by the benchmark scripts: synthetic face crops, timing and allocation
+measurements and the common command-line options.
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+
+DEFAULT_MODEL = 'models/best_classification_model_pretrain_finetune_VCD_and_customv2_b.onnx'
+
+
+def random_face_crops(num_faces: int, crop_size: int, seed: int = 0) -> List[np.ndarray]:
+    """
+    Make reproducible random BGR images standing in for face crops.
+
+    Args:
+        num_faces: Number of crops
+        crop_size: Side length of each crop
+        seed: Random seed
+
+    Returns:
+        List of uint8 images of shape (crop_size, crop_size, 3)
+    """
+    rng = np.random.default_rng(seed)
+    return [rng.integers(0, 255, size=(crop_size, crop_size, 3), dtype=np.uint8) for _ in range(num_faces)]
+
+
+def time_calls(fn: Callable[[], Any], repeats: int, warmup: int = 3) -> Dict[str, float]:
+    """
+    Time repeated calls of fn after a few untimed warm-up calls.
+
+    Args:
+        fn: Function to time
+        repeats: Timed calls
+        warmup: Untimed calls first - the first runs allocate buffers and pick kernels
+
+    Returns:
+        Dict with the median and 95th percentile wall time and the mean CPU time per call,
+        all in milliseconds
+    """
+    for _ in range(warmup):
+        fn()
+
+    timings = []
+    cpu_start = time.process_time()
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    cpu_ms = (time.process_time() - cpu_start) * 1000.0 / max(1, repeats)
+
+    return {
+        "median_ms": float(np.median(timings)),
+        "p95_ms": float(np.percentile(timings, 95)),
+        "cpu_ms": cpu_ms,
+    }
+
+
+def measure_allocations(fn: Callable[[], Any]) -> Dict[str, float]:
+    """
+    Measure the Python-side memory use of one call of fn.
+
+    numpy reports its array allocations to tracemalloc; native allocations of other
+    libraries (e.g. ONNX Runtime's arena) are not included.
+
+    Args:
+        fn: Function to measure
+
+    Returns:
+        Dict with the number of memory blocks the call left allocated and its peak
+        temporary memory in bytes
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    return {
+        "allocations": sum(max(0, stat.count_diff) for stat in after.compare_to(before, "lineno")),
+        "peak_bytes": max(0, peak - baseline),
+    }
+
+
+def measure_per_face(fn: Callable[[], Any], repeats: int, num_faces: int, warmup: int = 3) -> Dict[str, float]:
+    """
+    Median time, allocations and peak temporary memory per face of fn() on a batch of faces.
+
+    Args:
+        fn: Function processing the whole batch
+        repeats: Timed calls
+        num_faces: Faces in the batch
+        warmup: Untimed calls first
+
+    Returns:
+        Dict with ms_per_face, allocations_per_face and peak_kb_per_face
+    """
+    timing = time_calls(fn, repeats, warmup)
+    memory = measure_allocations(fn)
+    return {
+        "ms_per_face": timing["median_ms"] / num_faces,
+        "allocations_per_face": memory["allocations"] / num_faces,
+        "peak_kb_per_face": memory["peak_bytes"] / 1024.0 / num_faces,
+    }
+
+
+def add_crop_arguments(parser: argparse.ArgumentParser, repeats: int, repeats_help: str = "Timed runs per method"):
+    """
+    Add the --repeats and --crop-size options shared by the gaze benchmarks.
+
+    Args:
+        parser: Parser to add the options to
+        repeats: Default number of timed runs
+        repeats_help: Help text of --repeats
+    """
+    parser.add_argument("--repeats", type=int, default=repeats, help=repeats_help)
+    parser.add_argument("--crop-size", type=int, default=160, help="Side length of the face crops")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Measure gaze classifier latency as the number of faces per frame grows, comparing one
+inference per face (EyesOffModel.predict) with one batched inference (predict_batch):
+
+    python -m utils.benchmark_gaze --max-faces 20 --repeats 50
+"""
+
+import argparse
+from typing import Dict, Any, List
+
+from utils.benchmark_common import DEFAULT_MODEL, add_crop_arguments, random_face_crops, time_calls
+from utils.eyesoff_model import EyesOffModel
+from utils.resource_path import resource_path
+
+
+def run_benchmark(model_path: str, max_faces: int, repeats: int, crop_size: int) -> List[Dict[str, Any]]:
+    """
+    Time per-face and batched gaze inference for 1..max_faces faces.
+
+    Args:
+        model_path: Path to the EyesOff ONNX model
+        max_faces: Largest number of faces per frame to test
+        repeats: Timed runs per face count (after one warm-up run)
+        crop_size: Side length of the synthetic face crops
+
+    Returns:
+        List of dicts with the face count and median latency of each method
+    """
+    model = EyesOffModel(model_path=model_path)
+    crops = random_face_crops(max_faces, crop_size)
+
+    results = []
+    for num_faces in range(1, max_faces + 1):
+        faces = crops[:num_faces]
+
+        def per_face():
+            for face in faces:
+                model.predict(face)
+
+        def batched():
+            model.predict_batch(faces)
+
+        # One warm-up run - the first run at a new batch size allocates
+        per_face_ms = time_calls(per_face, repeats, warmup=1)["median_ms"]
+        batched_ms = time_calls(batched, repeats, warmup=1)["median_ms"]
+        results.append({
+            "faces": num_faces,
+            "per_face_ms": per_face_ms,
+            "batched_ms": batched_ms,
+            "speedup": per_face_ms / batched_ms if batched_ms > 0 else 0.0,
+        })
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched gaze inference")
+    parser.add_argument("--model", default=resource_path(DEFAULT_MODEL), help="Path to the EyesOff ONNX model")
+    parser.add_argument("--max-faces", type=int, default=20, help="Largest number of faces per frame")
+    add_crop_arguments(parser, repeats=20, repeats_help="Timed runs per face count")
+
+    args = parser.parse_args()
+
+    results = run_benchmark(args.model, args.max_faces, args.repeats, args.crop_size)
+
+    print(f"{'faces':>5} {'per-face ms':>12} {'batched ms':>11} {'speedup':>8}")
+    for row in results:
+        print(f"{row['faces']:>5} {row['per_face_ms']:>12.2f} {row['batched_ms']:>11.2f} {row['speedup']:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark ONNX Runtime session settings for the gaze model on this machine.
+
+Every combination of the given thread counts, graph optimization levels, execution
+modes, memory arena and thread spinning settings is timed on a batch of synthetic face
+crops. Besides the latency, the CPU time per run is reported - divided by the wall time
+it shows how many cores a setting keeps busy, which matters for a background app:
+
+    python -m utils.benchmark_ort --threads 1,2,4,0 --faces 4
+
+The chosen values go into the ort_* settings (Settings > Advanced > Gaze Model Runtime).
+"""
+
+import argparse
+import itertools
+import os
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+import onnxruntime as ort
+
+from utils.benchmark_common import DEFAULT_MODEL, add_crop_arguments, random_face_crops, time_calls
+from utils.eyesoff_model import (ClassifierPreprocessor, EXECUTION_MODES, GRAPH_OPTIMIZATION_LEVELS,
+                                 folded_model_path, make_session_options)
+from utils.resource_path import resource_path
+
+
+def _make_input(session: ort.InferenceSession, num_faces: int, crop_size: int) -> np.ndarray:
+    """Preprocessed synthetic face crops in the layout the session's model expects."""
+    model_input = session.get_inputs()[0]
+    uint8_input = model_input.type == "tensor(uint8)"
+    size = model_input.shape[1] if uint8_input else model_input.shape[2]
+
+    crops = random_face_crops(num_faces, crop_size)
+    return ClassifierPreprocessor(size=size, uint8_output=uint8_input)(crops).copy()
+
+
+def time_session(session: ort.InferenceSession, batch: np.ndarray, repeats: int) -> Dict[str, float]:
+    """
+    Time a session on a batch, one run per face for fixed-batch models.
+
+    Returns:
+        Dict with the median wall time and mean CPU time per run in milliseconds
+    """
+    input_name = session.get_inputs()[0].name
+    batch_dim = session.get_inputs()[0].shape[0]
+    batches = [batch[i:i + 1] for i in range(len(batch))] if batch_dim == 1 else [batch]
+
+    def run():
+        for x in batches:
+            session.run(None, {input_name: x})
+
+    timing = time_calls(run, repeats)
+    return {"wall_ms": timing["median_ms"], "cpu_ms": timing["cpu_ms"]}
+
+
+def run_benchmark(model_path: str, threads: List[int], optimizations: List[str], modes: List[str],
+                  arenas: List[bool], spinning: List[bool], num_faces: int, repeats: int,
+                  crop_size: int) -> List[Dict[str, Any]]:
+    """
+    Time every combination of session settings.
+
+    Args:
+        model_path: Path to the gaze ONNX model (the folded variant is used if present)
+        threads: Intra-op thread counts to try (0 = one per core); inter-op threads are the
+            same count in parallel mode and 1 otherwise
+        optimizations: Graph optimization levels to try
+        modes: Execution modes to try
+        arenas: Memory arena settings to try
+        spinning: Thread spinning settings to try
+        num_faces: Faces per batch
+        repeats: Timed runs per combination
+        crop_size: Side length of the synthetic face crops
+
+    Returns:
+        List of dicts with the settings, load time, latency and CPU time of each combination
+    """
+    if os.path.exists(folded_model_path(model_path)):
+        model_path = folded_model_path(model_path)
+
+    results = []
+    batch = None
+    for intra, optimization, mode, arena, spin in itertools.product(threads, optimizations, modes, arenas, spinning):
+        settings = {
+            "intra_op_threads": intra,
+            "inter_op_threads": intra if mode == "parallel" else 1,
+            "graph_optimization": optimization,
+            "execution_mode": mode,
+            "memory_arena": arena,
+            "thread_spinning": spin,
+        }
+
+        start = time.perf_counter()
+        session = ort.InferenceSession(model_path, sess_options=make_session_options(**settings),
+                                       providers=["CPUExecutionProvider"])
+        load_ms = (time.perf_counter() - start) * 1000.0
+
+        if batch is None:
+            batch = _make_input(session, num_faces, crop_size)
+
+        timing = time_session(session, batch, repeats)
+        results.append({
+            **settings,
+            "load_ms": load_ms,
+            **timing,
+            "cores": timing["cpu_ms"] / timing["wall_ms"] if timing["wall_ms"] > 0 else 0.0,
+        })
+
+    return results
+
+
+def _int_list(text: str) -> List[int]:
+    return [int(value) for value in text.split(",") if value]
+
+
+def _str_list(choices):
+    def parse(text: str) -> List[str]:
+        values = [value for value in text.split(",") if value]
+        for value in values:
+            if value not in choices:
+                raise argparse.ArgumentTypeError(f"{value!r} is not one of {', '.join(choices)}")
+        return values
+    return parse
+
+
+def _bool_list(text: str) -> List[bool]:
+    return [value.strip().lower() in ("1", "true", "on", "yes") for value in text.split(",") if value]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ONNX Runtime session settings for the gaze model")
+    parser.add_argument("--model", default=resource_path(DEFAULT_MODEL), help="Path to the gaze ONNX model")
+    parser.add_argument("--threads", type=_int_list, default=[1, 2, 4, 0],
+                        help="Comma-separated intra-op thread counts (0 = one per core)")
+    parser.add_argument("--optimizations", type=_str_list(list(GRAPH_OPTIMIZATION_LEVELS)), default=["basic", "all"],
+                        help="Comma-separated graph optimization levels")
+    parser.add_argument("--modes", type=_str_list(list(EXECUTION_MODES)), default=["sequential", "parallel"],
+                        help="Comma-separated execution modes")
+    parser.add_argument("--arena", type=_bool_list, default=[True], help="Memory arena settings, e.g. on,off")
+    parser.add_argument("--spinning", type=_bool_list, default=[False, True], help="Thread spinning settings, e.g. off,on")
+    parser.add_argument("--faces", type=int, default=2, help="Faces per batch")
+    add_crop_arguments(parser, repeats=30, repeats_help="Timed runs per combination")
+
+    args = parser.parse_args()
+
+    results = run_benchmark(args.model, args.threads, args.optimizations, args.modes, args.arena,
+                            args.spinning, args.faces, args.repeats, args.crop_size)
+
+    print(f"{'threads':>7} {'optimization':>12} {'mode':>10} {'arena':>5} {'spin':>4} "
+          f"{'load ms':>8} {'wall ms':>8} {'cpu ms':>8} {'cores':>5}")
+    for row in sorted(results, key=lambda row: row["wall_ms"]):
+        threads = row["intra_op_threads"] or "all"
+        print(f"{threads:>7} {row['graph_optimization']:>12} {row['execution_mode']:>10} "
+              f"{'on' if row['memory_arena'] else 'off':>5} {'on' if row['thread_spinning'] else 'off':>4} "
+              f"{row['load_ms']:>8.1f} {row['wall_ms']:>8.2f} {row['cpu_ms']:>8.2f} {row['cores']:>5.2f}")
+
+
+if __name__ == "__main__":
+    main()
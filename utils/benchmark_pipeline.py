@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Measure detection pipeline throughput on any frame source.
+Runs without a camera or display, so it works on CI machines:
+
+    python -m utils.benchmark_pipeline --source synthetic:1920x1080 --frames 300
+"""
+
+import argparse
+import time
+from typing import Dict, Any, List
+
+import numpy as np
+
+from core.detector import FaceDetector
+from core.frame_source import create_frame_source
+from core.webcam import WebcamManager
+from utils.resource_path import resource_path
+
+
+# Frames excluded from the steady-state allocation count while the pool fills up
+WARMUP_FRAMES = 10
+
+
+def run_benchmark(source_spec: str, detector_type: str, num_frames: int, realtime: bool,
+                  threaded_capture: bool, pooled_buffers: bool = False,
+                  motion_gate: bool = False, face_tracking: bool = False,
+                  roi_detection: bool = False) -> Dict[str, Any]:
+    """
+    Run the capture and detection pipeline for a number of frames.
+
+    Args:
+        source_spec: Frame source specification (see create_frame_source)
+        detector_type: Detector type passed to FaceDetector
+        num_frames: Number of frames to run detection on
+        realtime: Deliver source frames at their frame rate instead of as fast as possible
+        threaded_capture: Use WebcamManager's background capture thread
+        pooled_buffers: Capture into pooled buffers and annotate them in place (threaded only)
+        motion_gate: Reuse the previous result for frames that did not change
+        face_tracking: Track faces between detector runs instead of detecting every frame
+        roi_detection: Search only near known faces between full-frame scans
+
+    Returns:
+        Dict with throughput and latency statistics
+    """
+    webcam = WebcamManager(threaded_capture=threaded_capture,
+                           frame_source=create_frame_source(source_spec, realtime=realtime),
+                           pooled_buffers=pooled_buffers)
+    detector = FaceDetector(detector_type=detector_type,
+                            model_path=resource_path('models/face_detection_yunet_2023mar.onnx'),
+                            motion_gate=motion_gate, face_tracking=face_tracking,
+                            roi_detection=roi_detection)
+
+    if not webcam.start():
+        raise RuntimeError(f"Could not start frame source {source_spec}")
+
+    latencies_ms: List[float] = []
+    total_faces = 0
+    last_seq = 0
+    warmup_allocations = 0
+    start = time.perf_counter()
+
+    try:
+        while len(latencies_ms) < num_frames:
+            if webcam.frame_pool is not None:
+                buffer = webcam.read_frame_buffer(timeout=1.0)
+                if buffer is None:
+                    continue
+
+                frame_start = time.perf_counter()
+                num_faces, _, _, _ = detector.detect(buffer.array, in_place=True)
+                latencies_ms.append((time.perf_counter() - frame_start) * 1000.0)
+                total_faces += num_faces
+                buffer.release()
+
+                if len(latencies_ms) == WARMUP_FRAMES:
+                    warmup_allocations = webcam.frame_pool.get_stats()["allocations"]
+                continue
+
+            if threaded_capture:
+                success, frame, last_seq, _ = webcam.read_latest(last_seq, timeout=1.0)
+            else:
+                success, frame = webcam.read_frame()
+            if not success:
+                if not threaded_capture:
+                    break
+                continue
+
+            frame_start = time.perf_counter()
+            num_faces, _, _, _ = detector.detect(frame)
+            latencies_ms.append((time.perf_counter() - frame_start) * 1000.0)
+            total_faces += num_faces
+    finally:
+        webcam.stop()
+
+    elapsed = time.perf_counter() - start
+    latencies = np.asarray(latencies_ms) if latencies_ms else np.zeros(1)
+
+    results = {
+        "frames": len(latencies_ms),
+        "elapsed_s": elapsed,
+        "fps": len(latencies_ms) / elapsed if elapsed > 0 else 0.0,
+        "latency_mean_ms": float(latencies.mean()),
+        "latency_p50_ms": float(np.percentile(latencies, 50)),
+        "latency_p95_ms": float(np.percentile(latencies, 95)),
+        "faces_per_frame": total_faces / max(1, len(latencies_ms)),
+    }
+
+    if motion_gate:
+        results["gate_skip_ratio"] = detector.get_gate_stats()["skip_ratio"]
+
+    if face_tracking:
+        results["detector_ratio"] = detector.get_tracking_stats()["detector_ratio"]
+
+    if roi_detection:
+        roi_stats = detector.get_roi_stats()
+        results["full_scans"] = roi_stats["full_scans"]
+        results["roi_scans"] = roi_stats["roi_scans"]
+        results["mean_roi_area"] = roi_stats["mean_roi_area"]
+
+    if webcam.frame_pool is not None:
+        # Buffers allocated after warm-up - 0 means the steady state is allocation-free
+        pool_stats = webcam.frame_pool.get_stats()
+        results["pool_buffers"] = pool_stats["pooled"]
+        results["pool_allocations"] = pool_stats["allocations"]
+        results["steady_state_allocations"] = pool_stats["allocations"] - warmup_allocations
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the EyesOff detection pipeline")
+    parser.add_argument("--source", default="synthetic:1280x720",
+                        help="'camera:<id>', 'video:<path>', 'images:<dir>' or 'synthetic[:<w>x<h>]'")
+    parser.add_argument("--detector", default="yunet", help="Detector type (yunet or eyes_off_model)")
+    parser.add_argument("--frames", type=int, default=300, help="Number of frames to process")
+    parser.add_argument("--realtime", action="store_true",
+                        help="Pace recorded/generated frames at their frame rate")
+    parser.add_argument("--threaded", action="store_true", help="Use the background capture thread")
+    parser.add_argument("--pooled", action="store_true",
+                        help="Capture into pooled frame buffers (implies --threaded)")
+    parser.add_argument("--motion-gate", action="store_true",
+                        help="Skip detection on frames that did not change")
+    parser.add_argument("--tracking", action="store_true",
+                        help="Track faces between detector runs")
+    parser.add_argument("--roi", action="store_true",
+                        help="Search only near known faces between full-frame scans")
+
+    args = parser.parse_args()
+
+    results = run_benchmark(args.source, args.detector, args.frames, args.realtime,
+                            args.threaded or args.pooled, args.pooled, args.motion_gate, args.tracking, args.roi)
+
+    print(f"Source: {args.source} | Detector: {args.detector}")
+    for key, value in results.items():
+        print(f"  {key}: {value:.2f}" if isinstance(value, float) else f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
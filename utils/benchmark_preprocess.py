@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of gaze classifier preprocessing: the original step-by-step version
+against the fused ClassifierPreprocessor. Reports time and temporary memory per face:
+
+    python -m utils.benchmark_preprocess --faces 8 --repeats 200
+"""
+
+import argparse
+from typing import Dict, Any, List
+
+import cv2 as cv
+import numpy as np
+
+from utils.benchmark_common import add_crop_arguments, measure_per_face, random_face_crops
+from utils.eyesoff_model import ClassifierPreprocessor
+
+
+def reference_preprocess(
+    face_bgr: np.ndarray,
+    size: int = 224,
+    mean=(0.485, 0.456, 0.406),
+    std=(0.229, 0.224, 0.225),
+) -> np.ndarray:
+    """The original per-face preprocessing, kept as the baseline."""
+    img = cv.resize(face_bgr, (size, size), interpolation=cv.INTER_LINEAR)
+    img = cv.cvtColor(img, cv.COLOR_BGR2RGB)
+    img = img.astype(np.float32) / 255.0
+    img = np.transpose(img, (2, 0, 1))
+    mean_arr = np.asarray(mean, dtype=np.float32)[:, None, None]
+    std_arr = np.asarray(std, dtype=np.float32)[:, None, None]
+    img = (img - mean_arr) / std_arr
+    img = np.expand_dims(img, axis=0).astype(np.float32)
+    return img
+
+
+def run_benchmark(num_faces: int, repeats: int, crop_size: int) -> Dict[str, Any]:
+    """
+    Compare the reference and fused preprocessing on a batch of random face crops.
+
+    Args:
+        num_faces: Number of face crops per batch
+        repeats: Timed runs per method
+        crop_size: Side length of the synthetic face crops
+
+    Returns:
+        Dict with the measurements of both methods and the largest output difference
+    """
+    faces: List[np.ndarray] = random_face_crops(num_faces, crop_size)
+    preprocessor = ClassifierPreprocessor()
+
+    def reference():
+        return np.concatenate([reference_preprocess(face) for face in faces], axis=0)
+
+    def fused():
+        return preprocessor(faces)
+
+    max_abs_diff = float(np.abs(reference() - fused()).max())
+
+    # One warm-up run lets the fused path allocate its buffers
+    return {
+        "reference": measure_per_face(reference, repeats, num_faces, warmup=1),
+        "fused": measure_per_face(fused, repeats, num_faces, warmup=1),
+        "max_abs_diff": max_abs_diff,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark gaze classifier preprocessing")
+    parser.add_argument("--faces", type=int, default=8, help="Face crops per batch")
+    add_crop_arguments(parser, repeats=100)
+
+    args = parser.parse_args()
+
+    results = run_benchmark(args.faces, args.repeats, args.crop_size)
+
+    for name in ("reference", "fused"):
+        stats = results[name]
+        print(f"{name:>9}: {stats['ms_per_face']:.3f} ms/face | "
+              f"peak temporaries {stats['peak_kb_per_face']:.0f} KB/face")
+    print(f"Max abs difference: {results['max_abs_diff']:.2e}")
+
+
+if __name__ == "__main__":
+    main()
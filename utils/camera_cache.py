@@ -0,0 +1,137 @@
+import json
+import os
+import time
+from typing import Dict, Any, Optional, Tuple
+
+
+class CameraCapabilityCache:
+    """
+    Persistent per-device database of camera capabilities.
+
+    Probing resolutions and properties renegotiates the camera stream, so the results are
+    stored on disk (next to the config file) and reused on later starts. Entries are keyed
+    by capture backend and device index - looking up device names can take seconds - and
+    record the resolution the device opens at and, when known, its name. A different
+    device appearing at the same index is recognised by those (see is_same_device) or by
+    rejecting the cached stream resolution, and is probed again.
+    """
+
+    # Bump when the stored entry layout changes - older files are discarded
+    SCHEMA_VERSION = 3
+    FILE_NAME = "camera_capabilities.json"
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the capability cache.
+
+        Args:
+            cache_dir: Directory to store the cache file in (normally the config directory)
+        """
+        self.cache_file = os.path.join(cache_dir, self.FILE_NAME)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    @staticmethod
+    def make_key(backend: str, index: int) -> str:
+        """
+        Build the cache key for a device.
+
+        Args:
+            backend: OpenCV capture backend name (e.g. 'AVFOUNDATION')
+            index: Camera index
+
+        Returns:
+            str: Cache key
+        """
+        return f"{backend}:{index}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored capabilities for a device.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Dict with 'resolutions', 'fps' and 'properties', or None if not cached
+        """
+        entry = self.entries.get(key)
+        return dict(entry) if entry else None
+
+    def put(self, key: str, resolutions, fps: float, properties: Dict[str, bool],
+            native_resolution: Optional[Tuple[int, int]] = None, name: Optional[str] = None):
+        """
+        Store the capabilities for a device and persist them.
+
+        Args:
+            key: Cache key from make_key
+            resolutions: Supported (width, height) resolutions, sorted by pixel count
+            fps: Frame rate the camera accepted
+            properties: Mapping of property name to whether the camera accepted it
+            native_resolution: (width, height) the device delivers right after opening
+            name: Device name, if known
+        """
+        self.entries[key] = {
+            "resolutions": [list(r) for r in resolutions],
+            "fps": float(fps),
+            "properties": dict(properties),
+            "native_resolution": list(native_resolution) if native_resolution else None,
+            "name": name,
+            "updated": time.time(),
+        }
+        self._save()
+
+    @staticmethod
+    def is_same_device(entry: Dict[str, Any], native_resolution: Optional[Tuple[int, int]],
+                       name: Optional[str]) -> bool:
+        """
+        Check whether a cached entry belongs to the device now open at its index.
+
+        Args:
+            entry: Cached entry from get
+            native_resolution: (width, height) the open device delivered right after opening
+            name: Name of the open device, if known
+
+        Returns:
+            bool: False if the native resolution or the name differ (unknown values match)
+        """
+        cached_resolution = entry.get("native_resolution")
+        if cached_resolution and native_resolution and tuple(cached_resolution) != tuple(native_resolution):
+            return False
+        cached_name = entry.get("name")
+        if cached_name and name and cached_name != name:
+            return False
+        return True
+
+    def invalidate(self, key: Optional[str] = None):
+        """
+        Drop cached capabilities so they are probed again on the next start.
+
+        Args:
+            key: Cache key to drop, or None to drop every device
+        """
+        if key is None:
+            self.entries = {}
+        else:
+            self.entries.pop(key, None)
+        self._save()
+
+    def _load(self):
+        """Load the cache file, discarding it if unreadable or from another schema version."""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r') as f:
+                    data = json.load(f)
+                if data.get("version") == self.SCHEMA_VERSION:
+                    self.entries = data.get("devices", {})
+        except Exception as e:
+            print(f"Error loading camera capability cache: {e}")
+            self.entries = {}
+
+    def _save(self):
+        """Write the cache file."""
+        try:
+            with open(self.cache_file, 'w') as f:
+                json.dump({"version": self.SCHEMA_VERSION, "devices": self.entries}, f, indent=4)
+        except Exception as e:
+            print(f"Error saving camera capability cache: {e}")
@@ -4,6 +4,7 @@ from typing import Dict, Any, Optional
 
 from PyQt5.QtCore import QSettings
 
+from utils.camera_cache import CameraCapabilityCache
 from utils.resource_path import resource_path
 from utils.platform import get_platform_manager
 
@@ -37,6 +38,9 @@ class ConfigManager:
         # Load configuration from files and settings
         self._load_config()
 
+        # Camera capability cache, stored next to the config file (created on first use)
+        self._camera_capability_cache = None
+
     # TODO - Add a path to where snapshots are saved
     def _get_default_config(self) -> Dict[str, Any]:
         """
@@ -55,6 +59,41 @@ class ConfigManager:
             
             # Camera settings
             "camera_id": 0,
+            "threaded_capture": True,  # Grab frames on a background thread into a latest-frame slot
+            "pooled_frame_buffers": True,  # Capture into reusable buffers instead of allocating per frame
+            "capture_mode": "detection",  # "detection" streams at low resolution, "full" at the highest
+            "mjpeg_reduced_decode": False,  # In detection mode, decode full resolution MJPEG at 1/2-1/8 scale
+            "adaptive_frame_rate": False,  # Drop to idle_fps while the scene is stable
+            "idle_fps": 2.0,
+            "idle_after_seconds": 10.0,  # Seconds of stable scene before switching to idle_fps
+            "motion_gate": False,  # Reuse the last detection result while the frame is unchanged
+            "motion_gate_max_interval": 1.0,  # Seconds after which detection runs regardless
+            "face_tracking": False,  # Follow faces between detector runs instead of detecting every frame
+            "detection_interval": 5,  # Frames between detector runs while tracking
+            "roi_detection": False,  # Between full scans, only search near known faces and the frame edges
+            "full_scan_interval": 1.0,  # Seconds between full-frame scans in ROI detection mode
+            "adaptive_input_size": False,  # Pick the YuNet input size from the sizes of recently seen faces
+            "input_size_min": 224,
+            "input_size_max": 640,
+            "tiled_detection": False,  # Periodically search the full resolution frame in tiles for distant faces
+            "tile_sweep_interval": 5.0,  # Seconds between tiled sweeps
+            "head_pose_filter": False,  # Treat faces turned away (from landmarks) as not looking
+            "head_pose_max_yaw": 45.0,  # Degrees
+            "head_pose_max_pitch": 40.0,  # Degrees
+            "gaze_max_per_frame": 0,  # Gaze classifications per frame, others keep their last result (0 = no limit)
+            "gaze_time_budget_ms": 0.0,  # Gaze classification time per frame (0 = no limit)
+            "gaze_cascade": False,  # Only classify gaze when the result can change whether an alert fires
+            # ONNX Runtime session of the gaze model - kept small so a background app does not
+            # compete with the foreground for cores (see utils/benchmark_ort.py)
+            "ort_intra_op_threads": 2,  # 0 = one per core
+            "ort_inter_op_threads": 1,
+            "ort_graph_optimization": "all",  # disabled / basic / extended / all
+            "ort_execution_mode": "sequential",  # sequential / parallel
+            "ort_memory_arena": True,
+            "ort_thread_spinning": False,
+            "ort_model_cache": True,  # Keep the optimized gaze model on disk for faster starts
+            "gaze_cache": True,  # Reuse a tracked face's gaze result while it is unchanged
+            "gaze_cache_max_age": 1.0,  # Seconds after which a tracked face is re-classified regardless
             
             # Alert settings
             "alert_on": False,  # alert is deactivated by default
@@ -202,6 +241,17 @@ class ConfigManager:
         # Save defaults to both QSettings and file
         self.save_config()
     
+    def get_camera_capability_cache(self) -> CameraCapabilityCache:
+        """
+        Get the shared camera capability cache stored next to the config file.
+
+        Returns:
+            CameraCapabilityCache: Cache instance
+        """
+        if self._camera_capability_cache is None:
+            self._camera_capability_cache = CameraCapabilityCache(os.path.dirname(self.config_file))
+        return self._camera_capability_cache
+
     def get_all(self) -> Dict[str, Any]:
         """
         Get all configuration values.
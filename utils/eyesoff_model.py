@@ -1,46 +1,368 @@
 
-from typing import Tuple
+import os
+import time
+from typing import Dict, Optional, Tuple, List
 
 import cv2 as cv
 import numpy as np
 import onnxruntime as ort
 from collections import deque
 
-def _preprocess_for_classifier(
-    face_bgr: np.ndarray,
-    size: int = 224,
-    mean=(0.485, 0.456, 0.406),
-    std=(0.229, 0.224, 0.225),
-) -> np.ndarray:
+
+# Suffix of gaze models with the preprocessing folded into the graph (see
+# utils/fold_gaze_preprocessing.py) - they take uint8 BGR NHWC crops directly
+FOLDED_MODEL_SUFFIX = "_uint8"
+
+
+def folded_model_path(model_path: str) -> str:
+    """
+    Path of the preprocessing-folded variant of a gaze model.
+
+    Args:
+        model_path: Path to the original ONNX model
+
+    Returns:
+        str: e.g. 'models/model_uint8.onnx' for 'models/model.onnx'
     """
-    Preprocess BGR face image into a normalized CHW float32 tensor
-    suitable for the EyesOff ONNX model.
+    stem, ext = os.path.splitext(model_path)
+    return f"{stem}{FOLDED_MODEL_SUFFIX}{ext or '.onnx'}"
+
+
+# Suffix of INT8 model variants (see utils/quantize_models.py)
+QUANTIZED_MODEL_SUFFIX = "_int8"
+
+
+def quantized_model_path(model_path: str) -> str:
+    """
+    Path of the INT8 variant of a model.
+
+    Args:
+        model_path: Path to the FP32 ONNX model
+
+    Returns:
+        str: e.g. 'models/model_int8.onnx' for 'models/model.onnx'
+    """
+    stem, ext = os.path.splitext(model_path)
+    return f"{stem}{QUANTIZED_MODEL_SUFFIX}{ext or '.onnx'}"
+
+
+def is_quantized_model(model_path: str) -> bool:
+    """Whether a model path names an INT8 variant."""
+    return os.path.splitext(model_path)[0].endswith(QUANTIZED_MODEL_SUFFIX)
+
+
+GRAPH_OPTIMIZATION_LEVELS = {
+    "disabled": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+
+EXECUTION_MODES = {
+    "sequential": ort.ExecutionMode.ORT_SEQUENTIAL,
+    "parallel": ort.ExecutionMode.ORT_PARALLEL,
+}
+
+# Config keys of the ONNX Runtime session settings and the make_session_options()
+# arguments they map to
+ORT_CONFIG_KEYS = {
+    "ort_intra_op_threads": "intra_op_threads",
+    "ort_inter_op_threads": "inter_op_threads",
+    "ort_graph_optimization": "graph_optimization",
+    "ort_execution_mode": "execution_mode",
+    "ort_memory_arena": "memory_arena",
+    "ort_thread_spinning": "thread_spinning",
+}
+
+
+def ort_settings_from_config(config: Dict) -> Dict:
+    """
+    Pick the ONNX Runtime session settings out of a config dict.
+
+    Returns:
+        Dict: make_session_options() keyword arguments for the keys present in config
+    """
+    return {option: config[key] for key, option in ORT_CONFIG_KEYS.items() if key in config}
+
+
+def make_session_options(
+    intra_op_threads: int = 2,
+    inter_op_threads: int = 1,
+    graph_optimization: str = "all",
+    execution_mode: str = "sequential",
+    memory_arena: bool = True,
+    thread_spinning: bool = False,
+) -> ort.SessionOptions:
+    """
+    Build ONNX Runtime session options.
+
+    The defaults suit a background app: ONNX Runtime would otherwise start one thread per
+    core and keep them spinning between runs, taking CPU from the user's foreground work
+    for a model that runs a few times a second.
+
+    Args:
+        intra_op_threads: Threads used inside an operator (0 = one per core)
+        inter_op_threads: Threads running independent operators in parallel execution
+            mode (0 = one per core)
+        graph_optimization: One of GRAPH_OPTIMIZATION_LEVELS
+        execution_mode: One of EXECUTION_MODES
+        memory_arena: Keep freed CPU memory in an arena for the next run instead of
+            returning it to the system
+        thread_spinning: Let idle worker threads busy-wait for work - slightly lower latency
+            at the cost of burning CPU between runs
+
+    Returns:
+        ort.SessionOptions
+
+    Raises:
+        ValueError: For an unknown optimization level or execution mode
+    """
+    if graph_optimization not in GRAPH_OPTIMIZATION_LEVELS:
+        raise ValueError(f"Unknown graph optimization level: {graph_optimization}")
+    if execution_mode not in EXECUTION_MODES:
+        raise ValueError(f"Unknown execution mode: {execution_mode}")
+
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = max(0, int(intra_op_threads))
+    options.inter_op_num_threads = max(0, int(inter_op_threads))
+    options.graph_optimization_level = GRAPH_OPTIMIZATION_LEVELS[graph_optimization]
+    options.execution_mode = EXECUTION_MODES[execution_mode]
+    options.enable_cpu_mem_arena = bool(memory_arena)
+
+    spinning = "1" if thread_spinning else "0"
+    options.add_session_config_entry("session.intra_op.allow_spinning", spinning)
+    options.add_session_config_entry("session.inter_op.allow_spinning", spinning)
+    return options
+
+
+class ClassifierPreprocessor:
     """
-    # Resize
-    img = cv.resize(face_bgr, (size, size), interpolation=cv.INTER_LINEAR)
-    # BGR -> RGB
-    img = cv.cvtColor(img, cv.COLOR_BGR2RGB)
-    # To float32 0..1
-    img = img.astype(np.float32) / 255.0
-    # HWC -> CHW
-    img = np.transpose(img, (2, 0, 1))
-    # Normalize
-    mean_arr = np.asarray(mean, dtype=np.float32)[:, None, None]
-    std_arr = np.asarray(std, dtype=np.float32)[:, None, None]
-    img = (img - mean_arr) / std_arr
-    # Add batch dim
-    img = np.expand_dims(img, axis=0).astype(np.float32)
-    return img
+    Fused preprocessing for the EyesOff classifier.
+
+    Resizes each BGR face crop into a reusable buffer, then writes it straight into a
+    reusable NCHW float32 tensor with the BGR -> RGB swap, HWC -> CHW transpose, scaling
+    to 0..1 and mean/std normalization done in one multiply-add per channel:
+
+        (x / 255 - mean) / std  ==  x * (1 / (255 * std)) + (-mean / std)
+
+    With uint8_output the crops are only resized, into a uint8 NHWC BGR batch, for models
+    that do the rest of the preprocessing in the graph.
+
+    The returned tensor is overwritten by the next call.
+    """
+
+    def __init__(
+        self,
+        size: int = 224,
+        mean=(0.485, 0.456, 0.406),
+        std=(0.229, 0.224, 0.225),
+        uint8_output: bool = False,
+        max_batch: int = 0,
+    ) -> None:
+        """
+        Args:
+            size: Model input spatial size.
+            mean: Per-channel (RGB) mean of 0..1 pixel values.
+            std: Per-channel (RGB) standard deviation of 0..1 pixel values.
+            uint8_output: Produce resized uint8 NHWC BGR crops instead of normalized NCHW float32.
+            max_batch: Faces to allocate the batch tensor for up front.
+        """
+        self.size = int(size)
+        self.uint8_output = uint8_output
+
+        # Per-channel constants, computed once
+        mean_arr = np.asarray(mean, dtype=np.float32)
+        std_arr = np.asarray(std, dtype=np.float32)
+        self._scale = (1.0 / (255.0 * std_arr)).astype(np.float32)
+        self._offset = (-mean_arr / std_arr).astype(np.float32)
+
+        # Reused buffers - the batch tensor grows to the largest batch seen
+        self._resized = np.empty((self.size, self.size, 3), dtype=np.uint8)
+        self._batch = np.empty(self._batch_shape(max_batch), dtype=self._batch_dtype())
+
+    def _batch_shape(self, num_faces: int) -> Tuple[int, int, int, int]:
+        if self.uint8_output:
+            return num_faces, self.size, self.size, 3
+        return num_faces, 3, self.size, self.size
+
+    def _batch_dtype(self):
+        return np.uint8 if self.uint8_output else np.float32
+
+    def __call__(self, faces_bgr: List[np.ndarray]) -> np.ndarray:
+        """
+        Preprocess face crops into a model input batch.
+
+        Args:
+            faces_bgr: Non-empty BGR face crops of any size.
+
+        Returns:
+            np.ndarray: Tensor of shape (len(faces_bgr), 3, size, size), or
+                (len(faces_bgr), size, size, 3) uint8 with uint8_output.
+        """
+        num_faces = len(faces_bgr)
+        if num_faces > len(self._batch):
+            self._batch = np.empty(self._batch_shape(num_faces), dtype=self._batch_dtype())
+        batch = self._batch[:num_faces]
+
+        if self.uint8_output:
+            for i, face_bgr in enumerate(faces_bgr):
+                cv.resize(face_bgr, (self.size, self.size), dst=batch[i], interpolation=cv.INTER_LINEAR)
+            return batch
+
+        for i, face_bgr in enumerate(faces_bgr):
+            cv.resize(face_bgr, (self.size, self.size), dst=self._resized, interpolation=cv.INTER_LINEAR)
+            for channel in range(3):
+                # RGB output channel c comes from BGR input channel 2 - c
+                out = batch[i, channel]
+                np.multiply(self._resized[:, :, 2 - channel], self._scale[channel], out=out, dtype=np.float32)
+                out += self._offset[channel]
+
+        return batch
 
 
 def _sigmoid(x: np.ndarray) -> np.ndarray:
     return 1.0 / (1.0 + np.exp(-x))
 
+
+def _box_iou(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> float:
+    inter_w = max(0, min(a[0] + a[2], b[0] + b[2]) - max(a[0], b[0]))
+    inter_h = max(0, min(a[1] + a[3], b[1] + b[3]) - max(a[1], b[1]))
+    intersection = inter_w * inter_h
+    union = a[2] * a[3] + b[2] * b[3] - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+class GazeTrackCache:
+    """
+    Per-face gaze results keyed by tracker track ID.
+
+    A face's last probability is reused while its box and crop look the same as when it
+    was last classified, and recomputed after a change or max_age seconds. Each track
+    keeps its own smoothing window, so smoothing never mixes different people.
+    """
+
+    # Side length of the grayscale crop thumbnails compared for appearance changes
+    THUMBNAIL_SIZE = 24
+
+    def __init__(
+        self,
+        smoothing_window: int = 1,
+        max_age: float = 1.0,
+        min_box_iou: float = 0.8,
+        appearance_threshold: float = 6.0,
+    ) -> None:
+        """
+        Args:
+            smoothing_window: Classifications averaged per track (1 = no smoothing).
+            max_age: Seconds after which a face is re-classified even if unchanged.
+            min_box_iou: Overlap with the box at the last classification needed for reuse.
+            appearance_threshold: Largest mean thumbnail difference (0-255) allowed for reuse.
+        """
+        self.smoothing_window = max(1, int(smoothing_window))
+        self.max_age = max_age
+        self.min_box_iou = min_box_iou
+        self.appearance_threshold = appearance_threshold
+
+        # track_id -> state at the last classification
+        self._entries: Dict[int, Dict] = {}
+        self.stats = {"reused": 0, "classified": 0}
+
+    def _thumbnail(self, face_bgr: np.ndarray) -> np.ndarray:
+        size = (self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE)
+        return cv.cvtColor(cv.resize(face_bgr, size, interpolation=cv.INTER_AREA), cv.COLOR_BGR2GRAY)
+
+    def lookup(self, track_id: int, bbox: Tuple[int, int, int, int], face_bgr: np.ndarray) -> Optional[float]:
+        """
+        Get the smoothed probability of a track if it can be reused for this frame.
+
+        Args:
+            track_id: Tracker ID of the face.
+            bbox: Face box (x, y, w, h) in this frame.
+            face_bgr: Face crop in this frame.
+
+        Returns:
+            The cached smoothed probability, or None if the face has to be classified.
+        """
+        entry = self._entries.get(track_id)
+        if entry is None or time.monotonic() - entry["time"] >= self.max_age:
+            return None
+        if _box_iou(bbox, entry["bbox"]) < self.min_box_iou:
+            return None
+        difference = float(cv.absdiff(self._thumbnail(face_bgr), entry["thumbnail"]).mean())
+        if difference > self.appearance_threshold:
+            return None
+
+        self.stats["reused"] += 1
+        return entry["smoothed"]
+
+    def store(self, track_id: int, bbox: Tuple[int, int, int, int], face_bgr: np.ndarray, prob: float) -> float:
+        """
+        Record a fresh classification of a track.
+
+        Args:
+            track_id: Tracker ID of the face.
+            bbox: Face box (x, y, w, h) the crop was taken from.
+            face_bgr: The classified face crop.
+            prob: Classifier probability of "looking".
+
+        Returns:
+            The track's smoothed probability.
+        """
+        entry = self._entries.get(track_id)
+        if entry is None:
+            entry = self._entries[track_id] = {"probs": deque(maxlen=self.smoothing_window)}
+
+        entry["probs"].append(prob)
+        entry["smoothed"] = float(np.mean(entry["probs"]))
+        entry["bbox"] = tuple(bbox)
+        entry["thumbnail"] = self._thumbnail(face_bgr)
+        entry["time"] = time.monotonic()
+
+        self.stats["classified"] += 1
+        return entry["smoothed"]
+
+    def last(self, track_id: int) -> Optional[float]:
+        """Get the smoothed probability of a track's last classification, however old, or None."""
+        entry = self._entries.get(track_id)
+        return entry["smoothed"] if entry is not None else None
+
+    def age(self, track_id: int) -> float:
+        """Seconds since a track was last classified (infinite if it never was)."""
+        entry = self._entries.get(track_id)
+        return time.monotonic() - entry["time"] if entry is not None else float("inf")
+
+    def prune(self, active_ids) -> None:
+        """Forget tracks that are no longer followed."""
+        active = set(active_ids)
+        for track_id in [track_id for track_id in self._entries if track_id not in active]:
+            del self._entries[track_id]
+
+    def clear(self) -> None:
+        """Forget all tracks and reset the statistics."""
+        self._entries.clear()
+        for key in self.stats:
+            self.stats[key] = 0
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Returns:
+            Dict: Reused and classified face counts and the fraction of reused results.
+        """
+        stats = dict(self.stats)
+        total = stats["reused"] + stats["classified"]
+        stats["reuse_ratio"] = stats["reused"] / total if total else 0.0
+        stats["tracks"] = len(self._entries)
+        return stats
+
+
 class EyesOffModel:
     """
     Thin wrapper over an ONNX gaze classifier.
 
     Assumes binary classifier with a single logit output per sample.
+
+    predict_batch() with track IDs caches and smooths results per tracked face (see
+    GazeTrackCache); without track IDs a single smoothing window is shared by all calls.
     """
 
     def __init__(
@@ -50,22 +372,48 @@ class EyesOffModel:
         decision_threshold: float = 0.5,
         use_gpu: bool = False,
         smoothing_window: int = 1,
+        gaze_cache: bool = True,
+        gaze_cache_max_age: float = 1.0,
+        ort_settings: Optional[Dict] = None,
+        model_cache=None,
+        io_binding: Optional[bool] = None,
+        max_batch: int = 16,
     ) -> None:
         """
         Args:
-            model_path: Path to the EyesOff ONNX model.
+            model_path: Path to the EyesOff ONNX model. If a preprocessing-folded variant
+                (see folded_model_path) exists next to it, that one is loaded instead.
             input_size: Input spatial size (e.g., 224).
             decision_threshold: Probability threshold for "looking".
             use_gpu: Whether to try GPU/CoreML provider; falls back to CPU.
             smoothing_window: Rolling window for probability smoothing
                               (1 = no smoothing).
+            gaze_cache: Reuse results of unchanged tracked faces (only applies when
+                predict_batch() is given track IDs).
+            gaze_cache_max_age: Seconds after which a tracked face is re-classified anyway.
+            ort_settings: make_session_options() arguments for the ONNX Runtime session.
+            model_cache: utils.model_cache.OptimizedModelCache to load the optimized graph
+                from (and store it in), or None to optimize on every load.
+            io_binding: Bind the preprocessed batch and a preallocated output buffer to the
+                session (ONNX Runtime IOBinding) instead of passing and returning new arrays.
+                None enables it when the session uses a provider other than the CPU - on
+                the CPU provider session.run() already reads NumPy inputs in place and
+                IOBinding measured no faster (see utils/benchmark_iobinding.py).
+            max_batch: Faces the input and output buffers are allocated for up front; larger
+                batches grow them.
         """
         self.input_size = int(input_size)
         self.decision_threshold = float(decision_threshold)
 
-        # Optional global smoothing (note: across calls, not per-face).
+        # Optional global smoothing (note: across calls, not per-face) for untracked faces.
         self._probs = deque(maxlen=max(1, int(smoothing_window)))
 
+        # Per-track results and smoothing for faces with tracker IDs
+        self.gaze_cache = gaze_cache
+        self.track_cache = GazeTrackCache(smoothing_window=smoothing_window, max_age=gaze_cache_max_age)
+        # Number of crops the last predict_batch() call classified
+        self.last_classified = 0
+
         # Provider setup
         if use_gpu:
             providers = [
@@ -80,15 +428,54 @@ class EyesOffModel:
         else:
             providers = ["CPUExecutionProvider"]
 
+        # Prefer the variant with normalization folded into the graph
+        if os.path.exists(folded_model_path(model_path)):
+            model_path = folded_model_path(model_path)
+
         # Create ONNX Runtime session
-        self.session = ort.InferenceSession(model_path, providers=providers)
+        if model_cache is not None:
+            self.session = model_cache.create_session(model_path, providers, ort_settings)
+        else:
+            self.session = ort.InferenceSession(model_path, sess_options=make_session_options(**(ort_settings or {})),
+                                                providers=providers)
         self.input_name = self.session.get_inputs()[0].name
         self.output_name = self.session.get_outputs()[0].name
 
+        # Folded models take uint8 crops - Python then only crops and resizes
+        self.uint8_input = self.session.get_inputs()[0].type == "tensor(uint8)"
+
+        # Fused preprocessing with reused buffers
+        self._preprocessor = ClassifierPreprocessor(size=self.input_size, uint8_output=self.uint8_input,
+                                                    max_batch=max_batch)
+
+        # Models exported with a fixed batch dimension of 1 need one run per face
+        batch_dim = self.session.get_inputs()[0].shape[0]
+        self.supports_batching = not (isinstance(batch_dim, int) and batch_dim == 1)
+
+        # IOBinding: the preprocessor's batch tensor is bound as the input, so preprocessing
+        # writes straight into the memory the model reads, and logits land in a reused
+        # buffer. Needs a float output of known size per sample.
+        if io_binding is None:
+            io_binding = any(provider != "CPUExecutionProvider" for provider in self.session.get_providers())
+        output = self.session.get_outputs()[0]
+        sample_shape = output.shape[1:]
+        self.io_binding = bool(io_binding and output.type == "tensor(float)"
+                               and all(isinstance(dim, int) and dim > 0 for dim in sample_shape))
+        if self.io_binding:
+            self._outputs = np.empty((max(1, max_batch), *sample_shape), dtype=np.float32)
+            # Binding per input memory (address, shape, dtype) - reused while the buffers stay put
+            self._bindings: Dict[Tuple, ort.IOBinding] = {}
+
         print(f"EyesOffModel loaded from: {model_path}")
         print(f"  Input name: {self.input_name}")
         print(f"  Output name: {self.output_name}")
         print(f"  Providers: {self.session.get_providers()}")
+        print(f"  Session options: {ort_settings or 'defaults'}")
+        if model_cache is not None:
+            print(f"  Optimized model cache: {model_cache.last_status}")
+        print(f"  Batched inference: {self.supports_batching}")
+        print(f"  uint8 input (preprocessing in graph): {self.uint8_input}")
+        print(f"  IOBinding: {self.io_binding}")
 
     def predict(self, face_bgr: np.ndarray) -> Tuple[float, bool]:
         """
@@ -101,16 +488,125 @@ class EyesOffModel:
         if face_bgr is None or face_bgr.size == 0:
             return 0.0, False
 
-        x = _preprocess_for_classifier(face_bgr, size=self.input_size)
-        outputs = self.session.run([self.output_name], {self.input_name: x})
-        logits = outputs[0]
+        x = self._preprocessor([face_bgr])
+        prob = float(self._run(x)[0])
+        return self._smooth(prob)
+
+    def predict_batch(
+        self,
+        faces_bgr: List[np.ndarray],
+        track_ids: Optional[List[int]] = None,
+        bboxes: Optional[List[Tuple[int, int, int, int]]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Optional[Tuple[float, bool]]]:
+        """
+        Run gaze prediction for all face crops of a frame in a single inference.
+
+        The crops are stacked into one tensor, so N faces cost one ONNX Runtime call
+        instead of N. Without track IDs results match calling predict() on each crop in order.
+
+        With track IDs (and the boxes the crops were taken from) each face is smoothed over
+        its own history, and with gaze_cache enabled unchanged faces reuse their last result
+        instead of being classified again. Call track_cache.prune() with the IDs still being
+        tracked to forget faces that left.
+
+        Args:
+            faces_bgr: Face crops (BGR, any size)
+            track_ids: Tracker ID per crop
+            bboxes: Face box (x, y, w, h) per crop, required with track_ids
+            limit: Classify at most this many crops, in order - cached results do not count
+
+        Returns:
+            List of (prob, is_looking) per crop; empty crops give (0.0, False) and crops
+            beyond limit None. last_classified holds the number of crops classified.
+        """
+        results: List[Optional[Tuple[float, bool]]] = [(0.0, False)] * len(faces_bgr)
+        valid = [i for i, face in enumerate(faces_bgr) if face is not None and face.size > 0]
+        self.last_classified = 0
+
+        if track_ids is not None:
+            if self.gaze_cache:
+                pending = []
+                for i in valid:
+                    prob = self.track_cache.lookup(track_ids[i], bboxes[i], faces_bgr[i])
+                    if prob is None:
+                        pending.append(i)
+                    else:
+                        results[i] = (prob, prob >= self.decision_threshold)
+                valid = pending
+
+        if limit is not None:
+            for i in valid[limit:]:
+                results[i] = None
+            valid = valid[:limit]
+
+        if not valid:
+            return results
+
+        self.last_classified = len(valid)
+
+        probs = self._run_batch([faces_bgr[i] for i in valid])
+
+        for i, prob in zip(valid, probs):
+            if track_ids is not None:
+                smoothed_prob = self.track_cache.store(track_ids[i], bboxes[i], faces_bgr[i], float(prob))
+                results[i] = (smoothed_prob, smoothed_prob >= self.decision_threshold)
+            else:
+                results[i] = self._smooth(float(prob))
+        return results
+
+    def _run_batch(self, faces_bgr: List[np.ndarray]) -> np.ndarray:
+        """Preprocess non-empty face crops and classify them, one run per face for fixed-batch models."""
+        batch = self._preprocessor(faces_bgr)
+
+        if self.supports_batching:
+            return self._run(batch)
+        return np.concatenate([self._run(batch[j:j + 1]) for j in range(len(faces_bgr))])
+
+    def _run(self, x: np.ndarray) -> np.ndarray:
+        """
+        Run the classifier on a preprocessed batch (NCHW float32, or NHWC uint8 for folded models).
+
+        Returns:
+            np.ndarray: Probability of "looking" per sample
+        """
+        if self.io_binding:
+            logits = self._run_bound(x)
+        else:
+            logits = self.session.run([self.output_name], {self.input_name: x})[0]
 
         # Handle different output shapes
         if logits.ndim == 2 and logits.shape[1] == 1:
             logits = logits[:, 0]
 
-        prob = float(_sigmoid(logits[0]))
+        return _sigmoid(logits.reshape(len(x), -1)[:, 0])
+
+    def _run_bound(self, x: np.ndarray) -> np.ndarray:
+        """
+        Run the classifier through IOBinding on x's memory.
+
+        Returns:
+            np.ndarray: Logits, a view into the output buffer overwritten by the next run
+        """
+        x = np.ascontiguousarray(x)
+        if len(x) > len(self._outputs):
+            self._outputs = np.empty((len(x), *self._outputs.shape[1:]), dtype=np.float32)
+            self._bindings.clear()
+        logits = self._outputs[:len(x)]
+
+        # The preprocessor reuses its batch buffer, so each batch size is bound once
+        key = (x.ctypes.data, x.shape, x.dtype)
+        binding = self._bindings.get(key)
+        if binding is None:
+            binding = self.session.io_binding()
+            binding.bind_input(self.input_name, "cpu", 0, x.dtype.type, list(x.shape), x.ctypes.data)
+            binding.bind_output(self.output_name, "cpu", 0, np.float32, list(logits.shape), logits.ctypes.data)
+            self._bindings[key] = binding
+        self.session.run_with_iobinding(binding)
+        return logits
 
+    def _smooth(self, prob: float) -> Tuple[float, bool]:
+        """Apply the optional global smoothing and the decision threshold to a probability."""
         # Optional smoothing (global)
         if len(self._probs) == self._probs.maxlen:
             self._probs.popleft()
@@ -0,0 +1,265 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from utils.yunet import YuNet
+
+
+# A region of the frame as (x, y, w, h) in pixels
+Region = Tuple[int, int, int, int]
+
+
+def detect_faces(yunet, image: np.ndarray, scale: float, confidence_threshold: float) -> np.ndarray:
+    """
+    Run YuNet on an image resized by scale and map the results back to image pixels.
+
+    Args:
+        yunet: utils.yunet.YuNet instance
+        image: BGR image (may be a view into a larger frame)
+        scale: Resize factor applied before detection
+        confidence_threshold: Minimum detection score
+
+    Returns:
+        np.ndarray: YuNet rows [x, y, w, h, 5 landmark (x, y) pairs, score] in image pixel
+            coordinates, shape (N, 15)
+    """
+    h, w = image.shape[:2]
+    new_w = max(1, int(w * scale))
+    new_h = max(1, int(h * scale))
+    resized = cv2.resize(image, (new_w, new_h))
+
+    yunet.setInputSize([new_w, new_h])
+    detections = yunet.infer(resized)
+
+    if detections.shape[0] == 0:
+        return np.empty((0, 15), dtype=np.float32)
+
+    # Score is the last column
+    detections = detections[detections[:, -1] >= confidence_threshold].astype(np.float32)
+    detections[:, :14] /= scale
+    return detections
+
+
+def plan_regions(frame_shape: Tuple[int, ...], bboxes: Sequence[Sequence[float]],
+                 padding: float = 0.5, border_fraction: float = 0.12) -> List[Region]:
+    """
+    Choose the parts of a frame to search when the face positions are roughly known.
+
+    Each known face is padded by padding times its size on every side, overlapping
+    regions are merged, and strips along the left and right edges are added so people
+    walking into view are still found.
+
+    Args:
+        frame_shape: Shape of the frame
+        bboxes: Known face boxes (x, y, w, h)
+        padding: Padding around each face as a fraction of its width/height
+        border_fraction: Width of each edge strip as a fraction of the frame width
+
+    Returns:
+        List of regions (x, y, w, h) inside the frame
+    """
+    frame_h, frame_w = frame_shape[:2]
+
+    boxes = []
+    for x, y, w, h in bboxes:
+        x0 = max(0, int(x - w * padding))
+        y0 = max(0, int(y - h * padding))
+        x1 = min(frame_w, int(x + w * (1 + padding)))
+        y1 = min(frame_h, int(y + h * (1 + padding)))
+        if x1 > x0 and y1 > y0:
+            boxes.append([x0, y0, x1, y1])
+
+    # Merge overlapping padded faces, so a face on the boundary is searched only once
+    merged = True
+    while merged:
+        merged = False
+        for i in range(len(boxes)):
+            for j in range(i + 1, len(boxes)):
+                a, b = boxes[i], boxes[j]
+                if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                    boxes[i] = [min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])]
+                    del boxes[j]
+                    merged = True
+                    break
+            if merged:
+                break
+
+    regions = [(x0, y0, x1 - x0, y1 - y0) for x0, y0, x1, y1 in boxes]
+
+    border_w = max(1, int(frame_w * border_fraction))
+    regions.append((0, 0, border_w, frame_h))
+    regions.append((frame_w - border_w, 0, border_w, frame_h))
+    return regions
+
+
+def detect_faces_in_regions(yunet, frame: np.ndarray, regions: Sequence[Region], base_scale: float,
+                            region_size: int, confidence_threshold: float,
+                            nms_threshold: float = 0.3) -> np.ndarray:
+    """
+    Run YuNet on regions of a frame and merge the results in frame coordinates.
+
+    Each region is resized so its longer side is region_size pixels, but never below the
+    full-frame scale and never above the native resolution - small regions around faces
+    are therefore searched at a higher resolution than a full-frame pass would use.
+
+    Args:
+        yunet: utils.yunet.YuNet instance
+        frame: BGR frame
+        regions: Regions (x, y, w, h) to search
+        base_scale: Scale a full-frame pass would use
+        region_size: Target size of a region's longer side
+        confidence_threshold: Minimum detection score
+        nms_threshold: IoU above which detections from overlapping regions are merged
+
+    Returns:
+        np.ndarray: YuNet rows in frame pixel coordinates, shape (N, 15)
+    """
+    results = []
+    for x, y, w, h in regions:
+        if w < 8 or h < 8:
+            continue
+        scale = min(1.0, max(base_scale, region_size / float(max(w, h))))
+        results.append(_detect_in_region(yunet, frame, (x, y, w, h), scale, confidence_threshold))
+
+    # Faces inside overlapping regions are found more than once
+    return merge_detections(results, confidence_threshold, nms_threshold)
+
+
+def _detect_in_region(yunet, frame: np.ndarray, region: Region, scale: float,
+                      confidence_threshold: float) -> np.ndarray:
+    """Run detect_faces() on one region and move the results into frame coordinates."""
+    x, y, w, h = region
+    detections = detect_faces(yunet, frame[y:y + h, x:x + w], scale, confidence_threshold)
+    # Box origin and landmarks - width and height do not move
+    detections[:, [0, 4, 6, 8, 10, 12]] += x
+    detections[:, [1, 5, 7, 9, 11, 13]] += y
+    return detections
+
+
+def merge_detections(results: Sequence[np.ndarray], confidence_threshold: float,
+                     nms_threshold: float = 0.3) -> np.ndarray:
+    """
+    Combine detections from several passes, keeping the best of overlapping boxes.
+
+    Args:
+        results: Arrays of YuNet rows in frame pixel coordinates
+        confidence_threshold: Minimum detection score
+        nms_threshold: IoU above which two boxes are the same face
+
+    Returns:
+        np.ndarray: Merged YuNet rows, shape (N, 15)
+    """
+    results = [detections for detections in results if len(detections)]
+    if not results:
+        return np.empty((0, 15), dtype=np.float32)
+
+    detections = np.concatenate(results)
+    if len(detections) == 1:
+        return detections
+
+    keep = cv2.dnn.NMSBoxes(detections[:, :4].tolist(), detections[:, -1].tolist(),
+                            confidence_threshold, nms_threshold)
+    return detections[np.asarray(keep, dtype=np.int64).reshape(-1)]
+
+
+def plan_tiles(frame_shape: Tuple[int, ...], tile_size: int = 640, overlap: float = 0.2) -> List[Region]:
+    """
+    Split a frame into overlapping square tiles.
+
+    Args:
+        frame_shape: Shape of the frame
+        tile_size: Side length of a tile in frame pixels
+        overlap: Fraction of a tile shared with its neighbour, so faces on a tile
+            boundary are whole in at least one tile
+
+    Returns:
+        List of tiles (x, y, w, h) covering the frame
+    """
+    frame_h, frame_w = frame_shape[:2]
+    step = max(1, int(tile_size * (1.0 - overlap)))
+
+    def starts(length: int) -> List[int]:
+        if length <= tile_size:
+            return [0]
+        positions = list(range(0, length - tile_size, step))
+        # Last tile flush with the far edge
+        positions.append(length - tile_size)
+        return positions
+
+    return [(x, y, min(tile_size, frame_w - x), min(tile_size, frame_h - y))
+            for y in starts(frame_h) for x in starts(frame_w)]
+
+
+class TiledFaceDetector:
+    """
+    High-resolution face detection over overlapping tiles of the full frame.
+
+    A full-frame pass at the detectors' target size shrinks a 1080p frame about 5x, so
+    the faces of people several metres away end up a few pixels wide. Here each tile
+    is searched at native resolution instead. Tiles run in parallel on a thread pool -
+    OpenCV releases the GIL during inference - each worker thread with its own YuNet
+    instance, and the results are merged with a global NMS.
+
+    This costs several full-frame passes, so it is meant as a periodic sweep next to the
+    regular low-resolution detection.
+    """
+
+    def __init__(self, model_path: str, confidence_threshold: float, nms_threshold: float = 0.3,
+                 tile_size: int = 640, overlap: float = 0.2, max_workers: Optional[int] = None):
+        """
+        Args:
+            model_path: Path to the YuNet model
+            confidence_threshold: Minimum detection score
+            nms_threshold: IoU above which detections are merged
+            tile_size: Side length of a tile in frame pixels
+            overlap: Fraction of a tile shared with its neighbour
+            max_workers: Worker threads (default: up to 4, one per CPU core)
+        """
+        self.model_path = model_path
+        self.confidence_threshold = confidence_threshold
+        self.nms_threshold = nms_threshold
+        self.tile_size = tile_size
+        self.overlap = overlap
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or min(4, os.cpu_count() or 1),
+                                            thread_name_prefix="TiledFaceDetector")
+        # YuNet instances are not thread safe - one per worker thread
+        self._local = threading.local()
+
+    def _yunet(self) -> YuNet:
+        yunet = getattr(self._local, "yunet", None)
+        if yunet is None:
+            yunet = self._local.yunet = YuNet(
+                modelPath=self.model_path,
+                inputSize=[self.tile_size, self.tile_size],
+                confThreshold=self.confidence_threshold,
+                nmsThreshold=self.nms_threshold,
+                backendId=cv2.dnn.DNN_BACKEND_OPENCV,
+                targetId=cv2.dnn.DNN_TARGET_CPU,
+            )
+        return yunet
+
+    def _detect_tile(self, frame: np.ndarray, tile: Region) -> np.ndarray:
+        return _detect_in_region(self._yunet(), frame, tile, 1.0, self.confidence_threshold)
+
+    def detect(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Detect faces on all tiles of a frame.
+
+        Args:
+            frame: BGR frame
+
+        Returns:
+            np.ndarray: YuNet rows in frame pixel coordinates, shape (N, 15)
+        """
+        tiles = plan_tiles(frame.shape, self.tile_size, self.overlap)
+        results = list(self._executor.map(lambda tile: self._detect_tile(frame, tile), tiles))
+        return merge_detections(results, self.confidence_threshold, self.nms_threshold)
+
+    def close(self):
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=True)
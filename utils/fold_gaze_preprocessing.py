@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Fold the gaze classifier's input preprocessing into its ONNX graph.
+
+The rewritten model takes resized uint8 BGR face crops in NHWC layout and performs the
+cast, HWC -> CHW transpose, BGR -> RGB swap, scaling to 0..1 and ImageNet mean/std
+normalization itself, so EyesOffModel only has to crop and resize. The result is checked
+numerically against the original model before it is kept:
+
+    python -m utils.fold_gaze_preprocessing models/best_classification_model_pretrain_finetune_VCD_and_customv2_b.onnx
+
+The output is written next to the input with the '_uint8' suffix, where EyesOffModel
+picks it up automatically. Requires the 'onnx' package (pip install onnx).
+"""
+
+import argparse
+import os
+import sys
+from typing import Optional, Tuple
+
+import numpy as np
+
+from utils.eyesoff_model import ClassifierPreprocessor, folded_model_path
+
+# Metadata recorded in folded models
+INPUT_FORMAT_KEY = "eyesoff_input_format"
+INPUT_FORMAT = "uint8_bgr_nhwc"
+
+IMAGENET_MEAN = (0.485, 0.456, 0.406)
+IMAGENET_STD = (0.229, 0.224, 0.225)
+
+
+def fold_preprocessing(model_path: str, output_path: str, mean=IMAGENET_MEAN, std=IMAGENET_STD) -> str:
+    """
+    Write a copy of the model whose input is uint8 BGR NHWC with preprocessing in the graph.
+
+    Args:
+        model_path: Path to the original model (float32 NCHW RGB input, normalized)
+        output_path: Path to write the folded model to
+        mean: Per-channel (RGB) mean the original model expects
+        std: Per-channel (RGB) standard deviation the original model expects
+
+    Returns:
+        str: output_path
+
+    Raises:
+        ValueError: If the model does not have a single NCHW float input
+    """
+    import onnx
+    from onnx import helper, numpy_helper, TensorProto
+
+    model = onnx.load(model_path)
+    graph = model.graph
+
+    initializer_names = {init.name for init in graph.initializer}
+    inputs = [graph_input for graph_input in graph.input if graph_input.name not in initializer_names]
+    if len(inputs) != 1:
+        raise ValueError(f"Expected a single model input, found {len(inputs)}")
+
+    original_input = inputs[0]
+    tensor_type = original_input.type.tensor_type
+    if tensor_type.elem_type != TensorProto.FLOAT or len(tensor_type.shape.dim) != 4:
+        raise ValueError("Expected a float32 NCHW model input")
+
+    batch_dim, channel_dim, height_dim, width_dim = tensor_type.shape.dim
+    if channel_dim.dim_value != 3:
+        raise ValueError("Expected a 3-channel model input")
+
+    batch = batch_dim.dim_param or batch_dim.dim_value or "batch"
+    new_input = helper.make_tensor_value_info(
+        f"{original_input.name}_uint8_bgr", TensorProto.UINT8,
+        [batch, height_dim.dim_value, width_dim.dim_value, 3])
+
+    # (x / 255 - mean) / std  ==  x * scale + offset
+    mean_arr = np.asarray(mean, dtype=np.float32)
+    std_arr = np.asarray(std, dtype=np.float32)
+    scale = (1.0 / (255.0 * std_arr)).astype(np.float32).reshape(1, 3, 1, 1)
+    offset = (-mean_arr / std_arr).astype(np.float32).reshape(1, 3, 1, 1)
+
+    prefix = "eyesoff_preprocess"
+    initializers = [
+        numpy_helper.from_array(np.array([2, 1, 0], dtype=np.int64), f"{prefix}_bgr_to_rgb"),
+        numpy_helper.from_array(scale, f"{prefix}_scale"),
+        numpy_helper.from_array(offset, f"{prefix}_offset"),
+    ]
+    # The last node produces the original input name, so the rest of the graph is unchanged
+    nodes = [
+        helper.make_node("Cast", [new_input.name], [f"{prefix}_float"], to=TensorProto.FLOAT),
+        helper.make_node("Transpose", [f"{prefix}_float"], [f"{prefix}_nchw"], perm=[0, 3, 1, 2]),
+        helper.make_node("Gather", [f"{prefix}_nchw", f"{prefix}_bgr_to_rgb"], [f"{prefix}_rgb"], axis=1),
+        helper.make_node("Mul", [f"{prefix}_rgb", f"{prefix}_scale"], [f"{prefix}_scaled"]),
+        helper.make_node("Add", [f"{prefix}_scaled", f"{prefix}_offset"], [original_input.name]),
+    ]
+
+    graph.input.remove(original_input)
+    graph.input.insert(0, new_input)
+    graph.initializer.extend(initializers)
+
+    original_nodes = list(graph.node)
+    del graph.node[:]
+    graph.node.extend(nodes + original_nodes)
+
+    onnx.helper.set_model_props(model, {
+        **{prop.key: prop.value for prop in model.metadata_props},
+        INPUT_FORMAT_KEY: INPUT_FORMAT,
+    })
+
+    onnx.checker.check_model(model)
+    onnx.save(model, output_path)
+    return output_path
+
+
+def check_equivalence(model_path: str, folded_path: str, num_samples: int = 16,
+                      seed: int = 0) -> Tuple[float, float]:
+    """
+    Compare the outputs of the original model (with Python preprocessing) and the folded model.
+
+    Args:
+        model_path: Path to the original model
+        folded_path: Path to the folded model
+        num_samples: Number of random crops to compare
+        seed: Random seed for the crops
+
+    Returns:
+        Tuple of (max absolute output difference, max absolute output value)
+    """
+    import onnxruntime as ort
+
+    original = ort.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+    folded = ort.InferenceSession(folded_path, providers=["CPUExecutionProvider"])
+
+    size = original.get_inputs()[0].shape[2]
+    rng = np.random.default_rng(seed)
+    # Smooth random crops look more like faces than pure noise; add noise on top
+    crops = []
+    for _ in range(num_samples):
+        low_res = rng.integers(0, 256, size=(8, 8, 3), dtype=np.uint8)
+        crop = np.asarray(np.clip(
+            np.kron(low_res, np.ones((size // 8 + 1, size // 8 + 1, 1)))[:size, :size]
+            + rng.normal(0, 12, size=(size, size, 3)), 0, 255), dtype=np.uint8)
+        crops.append(crop)
+
+    preprocessor = ClassifierPreprocessor(size=size)
+
+    max_diff = 0.0
+    max_value = 0.0
+    # Run one sample at a time so fixed-batch models are supported
+    for crop in crops:
+        expected = original.run(None, {original.get_inputs()[0].name: preprocessor([crop])})[0]
+        actual = folded.run(None, {folded.get_inputs()[0].name: crop[np.newaxis]})[0]
+        max_diff = max(max_diff, float(np.abs(expected - actual).max()))
+        max_value = max(max_value, float(np.abs(expected).max()))
+
+    return max_diff, max_value
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fold gaze model preprocessing into the ONNX graph")
+    parser.add_argument("model", help="Path to the original gaze ONNX model")
+    parser.add_argument("-o", "--output", help="Output path (default: <model>_uint8.onnx)")
+    parser.add_argument("--tolerance", type=float, default=1e-3,
+                        help="Maximum absolute output difference accepted by the equivalence check")
+    parser.add_argument("--samples", type=int, default=16, help="Number of crops used by the equivalence check")
+
+    args = parser.parse_args(argv)
+
+    try:
+        import onnx  # noqa: F401
+    except ImportError:
+        print("This tool requires the 'onnx' package: pip install onnx")
+        return 1
+
+    output_path = args.output or folded_model_path(args.model)
+
+    try:
+        fold_preprocessing(args.model, output_path)
+    except ValueError as e:
+        print(f"Cannot fold preprocessing into {args.model}: {e}")
+        return 1
+
+    max_diff, max_value = check_equivalence(args.model, output_path, num_samples=args.samples)
+    print(f"Equivalence check: max abs difference {max_diff:.2e} (outputs up to {max_value:.2f})")
+
+    if max_diff > args.tolerance:
+        os.remove(output_path)
+        print(f"Folded model differs by more than {args.tolerance} - not kept")
+        return 1
+
+    print(f"Folded model written to {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+from typing import Tuple
+
+import numpy as np
+
+
+# Landmark columns of a YuNet row: right eye, left eye, nose tip, right and left mouth corner
+RIGHT_EYE = slice(4, 6)
+LEFT_EYE = slice(6, 8)
+NOSE_TIP = slice(8, 10)
+RIGHT_MOUTH = slice(10, 12)
+LEFT_MOUTH = slice(12, 14)
+
+# Average face geometry, relative to half the distance between the eyes (yaw) and to the
+# distance from the eye line to the mouth line (pitch): how far the nose tip sits in front
+# of the eyes and mouth, and where it falls between eye line and mouth line when frontal
+YAW_NOSE_DEPTH = 1.0
+PITCH_NOSE_DEPTH = 0.5
+FRONTAL_NOSE_POSITION = 0.6
+
+
+def estimate_head_pose(detections: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Estimate head yaw and pitch from YuNet's five landmarks, for all faces at once.
+
+    The landmarks are first rotated so the eye line is horizontal, which removes head
+    roll. Turning the head moves the nose tip, which sits in front of the eyes and mouth,
+    sideways out of the middle between the eyes (yaw) and up or down between the eye line
+    and the mouth line (pitch). This is a rough estimate from average face proportions -
+    good enough to tell a face turned well away from one facing the camera.
+
+    Args:
+        detections: YuNet rows [x, y, w, h, 5 landmark (x, y) pairs, score], shape (N, 15)
+
+    Returns:
+        Tuple of (yaw, pitch) arrays in degrees, shape (N,). Yaw is positive when the nose
+        points to the right of the image, pitch when it points down.
+    """
+    detections = np.asarray(detections, dtype=np.float32).reshape(-1, 15)
+
+    right_eye = detections[:, RIGHT_EYE]
+    left_eye = detections[:, LEFT_EYE]
+    eye_centre = (right_eye + left_eye) / 2.0
+    mouth_centre = (detections[:, RIGHT_MOUTH] + detections[:, LEFT_MOUTH]) / 2.0
+
+    eye_vector = left_eye - right_eye
+    half_eye_distance = np.maximum(np.linalg.norm(eye_vector, axis=1) / 2.0, 1e-3)
+    # Unit vectors along the eye line and perpendicular to it, pointing towards the mouth
+    along = eye_vector / (2.0 * half_eye_distance[:, np.newaxis])
+    across = np.stack([-along[:, 1], along[:, 0]], axis=1)
+
+    nose = detections[:, NOSE_TIP] - eye_centre
+    mouth = mouth_centre - eye_centre
+
+    nose_offset = np.sum(nose * along, axis=1) / half_eye_distance
+    mouth_distance = np.maximum(np.sum(mouth * across, axis=1), 1e-3)
+    nose_position = np.sum(nose * across, axis=1) / mouth_distance
+
+    yaw = np.degrees(np.arctan(nose_offset / YAW_NOSE_DEPTH))
+    pitch = np.degrees(np.arctan((nose_position - FRONTAL_NOSE_POSITION) / PITCH_NOSE_DEPTH))
+    return yaw, pitch
+
+
+def frontal_mask(detections: np.ndarray, max_yaw: float, max_pitch: float) -> np.ndarray:
+    """
+    Find the faces whose estimated head pose is within the angle limits.
+
+    Args:
+        detections: YuNet rows, shape (N, 15)
+        max_yaw: Largest absolute yaw in degrees
+        max_pitch: Largest absolute pitch in degrees
+
+    Returns:
+        np.ndarray: Boolean mask, True for faces that may be looking at the camera
+    """
+    yaw, pitch = estimate_head_pose(detections)
+    return (np.abs(yaw) <= max_yaw) & (np.abs(pitch) <= max_pitch)
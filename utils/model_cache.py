@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of ONNX models as optimized by ONNX Runtime.
+
+Creating an InferenceSession runs graph optimization (constant folding, node fusions,
+layout changes) every time. ONNX Runtime can serialize the optimized graph, and loading
+that with optimization disabled skips the work on later starts and detector reloads.
+
+Measure the time to the first inference without and with the cache:
+
+    python -m utils.model_cache models/best_classification_model_pretrain_finetune_VCD_and_customv2_b.onnx
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import onnxruntime as ort
+
+from utils.eyesoff_model import make_session_options
+
+
+def file_checksum(path: str) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cpu_features() -> str:
+    """Instruction set extensions of this CPU (as detected by NumPy), comma-separated."""
+    try:
+        from numpy._core._multiarray_umath import __cpu_features__
+    except ImportError:
+        # NumPy < 2
+        from numpy.core._multiarray_umath import __cpu_features__
+    return ",".join(sorted(name for name, present in __cpu_features__.items() if present))
+
+
+def _provider_names(providers: List) -> List[str]:
+    """Provider names of an InferenceSession providers list (names or (name, options) tuples)."""
+    return [provider[0] if isinstance(provider, (tuple, list)) else provider for provider in providers]
+
+
+class OptimizedModelCache:
+    """
+    Cache of ONNX Runtime-optimized models in a directory.
+
+    Entries are keyed by the source model's checksum, the ONNX Runtime version, the
+    execution providers, the graph optimization level, the machine and the CPU's
+    instruction set extensions - the optimized graph can use kernels and layouts (the
+    NCHWc transformations of the "all" level) specific to any of these. A changed model,
+    ONNX Runtime update or a cache directory carried over to another CPU therefore
+    misses, writes a new entry and removes the outdated one.
+
+    Only CPU sessions are cached: graphs partitioned to other providers (e.g. CoreML)
+    contain compiled nodes ONNX Runtime cannot serialize.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir: Directory to store the optimized models in
+        """
+        self.cache_dir = cache_dir
+        # "hit", "miss" or "bypass" for the last create_session() call
+        self.last_status: Optional[str] = None
+
+    def cache_path(self, model_path: str, providers: List, graph_optimization: str) -> str:
+        """
+        Path of the cache entry for a model and session configuration.
+
+        Args:
+            model_path: Path to the source ONNX model
+            providers: Execution providers of the session
+            graph_optimization: Graph optimization level (see utils.eyesoff_model)
+
+        Returns:
+            str: '<cache_dir>/<model name>-<key>.onnx'
+        """
+        key = hashlib.sha256("|".join([
+            file_checksum(model_path),
+            ort.__version__,
+            ",".join(_provider_names(providers)),
+            graph_optimization,
+            platform.machine(),
+            cpu_features(),
+        ]).encode()).hexdigest()[:16]
+
+        stem = os.path.splitext(os.path.basename(model_path))[0]
+        return os.path.join(self.cache_dir, f"{stem}-{key}.onnx")
+
+    def create_session(self, model_path: str, providers: List,
+                       ort_settings: Optional[Dict] = None) -> ort.InferenceSession:
+        """
+        Create a session for a model, from the cached optimized graph when there is one.
+
+        Args:
+            model_path: Path to the source ONNX model
+            providers: Execution providers
+            ort_settings: make_session_options() arguments
+
+        Returns:
+            ort.InferenceSession
+        """
+        settings = dict(ort_settings or {})
+        graph_optimization = settings.get("graph_optimization", "all")
+
+        if graph_optimization == "disabled" or _provider_names(providers) != ["CPUExecutionProvider"]:
+            self.last_status = "bypass"
+            return ort.InferenceSession(model_path, sess_options=make_session_options(**settings),
+                                        providers=providers)
+
+        path = self.cache_path(model_path, providers, graph_optimization)
+
+        if os.path.exists(path):
+            try:
+                # Already optimized - optimizing again would only cost time
+                session = ort.InferenceSession(
+                    path, sess_options=make_session_options(**{**settings, "graph_optimization": "disabled"}),
+                    providers=providers)
+                self.last_status = "hit"
+                return session
+            except Exception as e:
+                print(f"Discarding unreadable optimized model {path}: {e}")
+                self._remove(path)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Written under a temporary name, so a crash never leaves a truncated entry behind
+        temp_path = f"{os.path.splitext(path)[0]}.{os.getpid()}.tmp.onnx"
+        options = make_session_options(**settings)
+        options.optimized_model_filepath = temp_path
+        session = ort.InferenceSession(model_path, sess_options=options, providers=providers)
+
+        try:
+            os.replace(temp_path, path)
+            self._remove_outdated(path)
+        except OSError as e:
+            print(f"Could not cache optimized model {path}: {e}")
+            self._remove(temp_path)
+
+        self.last_status = "miss"
+        return session
+
+    def _remove_outdated(self, path: str):
+        """Remove other entries of the same model - they were made for an older model or setup."""
+        stem = os.path.basename(path).rsplit("-", 1)[0]
+        for entry in glob.glob(os.path.join(glob.escape(self.cache_dir), f"{glob.escape(stem)}-*.onnx")):
+            if os.path.abspath(entry) != os.path.abspath(path):
+                self._remove(entry)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """Remove all cached models."""
+        for entry in glob.glob(os.path.join(glob.escape(self.cache_dir), "*.onnx")):
+            self._remove(entry)
+
+
+def time_to_first_inference(model_path: str, cache: Optional[OptimizedModelCache],
+                            ort_settings: Optional[Dict] = None) -> Tuple[float, float]:
+    """
+    Time creating a CPU session and running it once on a zero input.
+
+    Args:
+        model_path: Path to the ONNX model
+        cache: Optimized model cache to load through, or None for a plain session
+        ort_settings: make_session_options() arguments
+
+    Returns:
+        Tuple of (milliseconds to create the session, milliseconds to the end of the first run)
+    """
+    providers = ["CPUExecutionProvider"]
+    start = time.perf_counter()
+    if cache is None:
+        session = ort.InferenceSession(model_path, sess_options=make_session_options(**(ort_settings or {})),
+                                       providers=providers)
+    else:
+        session = cache.create_session(model_path, providers, ort_settings)
+    load_ms = (time.perf_counter() - start) * 1000.0
+
+    model_input = session.get_inputs()[0]
+    shape = [dim if isinstance(dim, int) else 1 for dim in model_input.shape]
+    dtype = np.uint8 if model_input.type == "tensor(uint8)" else np.float32
+    session.run(None, {model_input.name: np.zeros(shape, dtype=dtype)})
+    return load_ms, (time.perf_counter() - start) * 1000.0
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure cold start with and without the optimized model cache")
+    parser.add_argument("model", help="Path to the ONNX model")
+    parser.add_argument("--optimization", default="all", help="Graph optimization level")
+    parser.add_argument("--repeats", type=int, default=5, help="Measurements per case")
+
+    args = parser.parse_args(argv)
+    settings = {"graph_optimization": args.optimization}
+
+    cache_dir = tempfile.mkdtemp(prefix="eyesoff_model_cache_")
+    try:
+        cache = OptimizedModelCache(cache_dir)
+
+        uncached = [time_to_first_inference(args.model, None, settings) for _ in range(args.repeats)]
+        first = time_to_first_inference(args.model, cache, settings)
+        cached = [time_to_first_inference(args.model, cache, settings) for _ in range(args.repeats)]
+
+        print(f"{'':18} {'session ms':>10} {'first run ms':>12}")
+        for label, timings in (("Without cache", uncached), ("Filling the cache", [first]),
+                               ("From the cache", cached)):
+            load_ms, total_ms = np.median(np.asarray(timings), axis=0)
+            print(f"{label:18} {load_ms:>10.1f} {total_ms:>12.1f}")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+
+# Size of the grayscale thumbnails used to compare frames
+THUMBNAIL_SIZE = (64, 48)
+
+
+def make_thumbnail(frame: np.ndarray, size: Tuple[int, int] = THUMBNAIL_SIZE) -> np.ndarray:
+    """
+    Create a small grayscale thumbnail of a frame for cheap frame comparison.
+
+    Args:
+        frame: BGR frame
+        size: Thumbnail (width, height)
+
+    Returns:
+        np.ndarray: Grayscale thumbnail
+    """
+    # Shrink before converting so the colour conversion only touches a few thousand pixels.
+    # INTER_AREA averages whole blocks, which also suppresses sensor noise.
+    thumbnail = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+    if thumbnail.ndim == 3:
+        thumbnail = cv2.cvtColor(thumbnail, cv2.COLOR_BGR2GRAY)
+    return thumbnail
+
+
+def mean_difference(thumbnail: np.ndarray, previous: np.ndarray) -> float:
+    """
+    Mean absolute pixel difference between two thumbnails.
+
+    Args:
+        thumbnail: Current thumbnail
+        previous: Thumbnail to compare against
+
+    Returns:
+        float: Mean difference (0-255)
+    """
+    return float(cv2.absdiff(thumbnail, previous).mean())
+
+
+def changed_fraction(thumbnail: np.ndarray, previous: np.ndarray, pixel_threshold: int = 12) -> float:
+    """
+    Fraction of thumbnail pixels that changed by more than pixel_threshold.
+
+    Unlike the mean difference this also picks up small local changes, such as a
+    distant face appearing in one corner of the frame.
+
+    Args:
+        thumbnail: Current thumbnail
+        previous: Thumbnail to compare against
+        pixel_threshold: Minimum per-pixel difference (0-255) counted as a change
+
+    Returns:
+        float: Fraction of changed pixels (0.0-1.0)
+    """
+    diff = cv2.absdiff(thumbnail, previous)
+    return float(np.count_nonzero(diff > pixel_threshold)) / diff.size
@@ -71,6 +71,11 @@ class PlatformFileSystem(ABC):
     def get_snapshots_directory(self) -> str:
         """Get the snapshots directory."""
         pass
+
+    @abstractmethod
+    def get_model_cache_directory(self) -> str:
+        """Get the directory for cached optimized models."""
+        pass
     
     @abstractmethod
     def ensure_directory_exists(self, path: str) -> None:
@@ -254,6 +254,12 @@ class MacOSFileSystem(PlatformFileSystem):
         snapshots_dir = os.path.join(self.get_app_support_directory(), "face_snapshots")
         self.ensure_directory_exists(snapshots_dir)
         return snapshots_dir
+
+    def get_model_cache_directory(self) -> str:
+        """Get the directory for cached optimized models."""
+        cache_dir = os.path.join(self.get_app_support_directory(), "model_cache")
+        self.ensure_directory_exists(cache_dir)
+        return cache_dir
     
     def ensure_directory_exists(self, path: str) -> None:
         """Ensure a directory exists."""
@@ -164,6 +164,16 @@ class WindowsFileSystem(PlatformFileSystem):
         snapshots_dir = os.path.join(self.get_app_support_directory(), "face_snapshots")
         self.ensure_directory_exists(snapshots_dir)
         return snapshots_dir
+
+    def get_model_cache_directory(self) -> str:
+        """Get the directory for cached optimized models."""
+        # Local, not roaming, app data - the optimized models are specific to this machine's CPU
+        local_appdata = os.environ.get('LOCALAPPDATA')
+        if not local_appdata:
+            local_appdata = os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+        cache_dir = os.path.join(local_appdata, 'EyesOff', 'model_cache')
+        self.ensure_directory_exists(cache_dir)
+        return cache_dir
     
     def ensure_directory_exists(self, path: str) -> None:
         """Ensure a directory exists."""
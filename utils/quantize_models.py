@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Build INT8 variants of the face detection (YuNet) and gaze models.
+
+Both models are statically quantized with ONNX Runtime (QDQ format, per-channel INT8
+weights, UINT8 activations), calibrated on real camera frames. Each variant is then
+compared with its FP32 model on a labelled set and only kept if it agrees closely enough,
+loses little accuracy and actually runs faster on this machine:
+
+    python -m utils.quantize_models --calibration frames/ --labelled labelled/
+
+The calibration directory holds plain frames (the alert snapshots in the app support
+'face_snapshots' directory work well). The labelled directory holds frames and a
+labels.json mapping each file name to its faces:
+
+    {"frame_001.jpg": [{"bbox": [x, y, w, h], "looking": true}, ...], ...}
+
+"looking" may be left out of faces whose gaze is unknown. Kept variants are written next
+to the FP32 models with the '_int8' suffix, where FaceDetector.get_available_models()
+lists them; EyesOff.spec bundles every models/*_int8.onnx present at build time, so run
+this before building the app. Requires the 'onnx' package (pip install onnx).
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from utils.eyesoff_model import ClassifierPreprocessor, quantized_model_path
+from utils.resource_path import resource_path
+
+DEFAULT_YUNET_MODEL = 'models/face_detection_yunet_2023mar.onnx'
+DEFAULT_GAZE_MODEL = 'models/best_classification_model_pretrain_finetune_VCD_and_customv2_b.onnx'
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+# Detection settings of the app (EyesOffDetector / YuNetDetector defaults)
+YUNET_TARGET_SIZE = 340
+YUNET_CONFIDENCE = 0.6
+GAZE_BBOX_SCALE = 1.6
+
+
+# ---- Data ----
+
+def load_frames(directory: str, limit: Optional[int] = None) -> List[np.ndarray]:
+    """Load the images of a directory in name order."""
+    paths = sorted(path for path in glob.glob(os.path.join(glob.escape(directory), "*"))
+                   if path.lower().endswith(IMAGE_EXTENSIONS))
+    frames = [frame for frame in (cv2.imread(path) for path in paths[:limit]) if frame is not None]
+    return frames
+
+
+def load_labelled_set(directory: str) -> List[Tuple[np.ndarray, List[Dict[str, Any]]]]:
+    """
+    Load a labelled set - see the module docstring for its layout.
+
+    Returns:
+        List of (frame, faces) pairs
+    """
+    with open(os.path.join(directory, "labels.json"), "r") as f:
+        labels = json.load(f)
+
+    samples = []
+    for name, faces in sorted(labels.items()):
+        frame = cv2.imread(os.path.join(directory, name))
+        if frame is None:
+            print(f"Skipping unreadable labelled frame {name}")
+            continue
+        samples.append((frame, faces))
+    return samples
+
+
+def _yunet(model_path: str, input_size: Tuple[int, int]):
+    """OpenCV YuNet, as the app runs it."""
+    from utils.yunet import YuNet
+
+    return YuNet(modelPath=model_path, inputSize=list(input_size), confThreshold=YUNET_CONFIDENCE,
+                 nmsThreshold=0.3, topK=2500, backendId=cv2.dnn.DNN_BACKEND_OPENCV,
+                 targetId=cv2.dnn.DNN_TARGET_CPU)
+
+
+def detect(yunet, frame: np.ndarray) -> np.ndarray:
+    """Detect faces at the app's detection size; boxes (x, y, w, h) in frame pixels."""
+    from utils.face_regions import detect_faces
+
+    scale = YUNET_TARGET_SIZE / max(frame.shape[:2])
+    return detect_faces(yunet, frame, scale, YUNET_CONFIDENCE)[:, :4]
+
+
+def face_crop(frame: np.ndarray, bbox) -> np.ndarray:
+    """Crop a face the way EyesOffDetector does, enlarged around its box."""
+    from eyesoff_detector import EyesOffDetector
+
+    box = np.asarray(bbox, dtype=np.float32)
+    enlarged = EyesOffDetector._enlarge_bbox(box, frame.shape, scale=GAZE_BBOX_SCALE)
+    return EyesOffDetector._crop(frame, enlarged)
+
+
+def yunet_calibration_inputs(frames: List[np.ndarray], size: int) -> List[np.ndarray]:
+    """
+    YuNet network inputs for calibration.
+
+    The app feeds YuNet BGR frames without normalization, scaled to the detection size and
+    padded. The model file has a fixed square input, so frames are scaled to fit it and
+    padded at the bottom and right.
+    """
+    inputs = []
+    for frame in frames:
+        scale = size / max(frame.shape[:2])
+        resized = cv2.resize(frame, (max(1, int(frame.shape[1] * scale)), max(1, int(frame.shape[0] * scale))))
+        padded = np.zeros((size, size, 3), dtype=np.uint8)
+        padded[:resized.shape[0], :resized.shape[1]] = resized
+        inputs.append(cv2.dnn.blobFromImage(padded))
+    return inputs
+
+
+def gaze_calibration_inputs(frames: List[np.ndarray], yunet_path: str, input_size: int,
+                            max_faces: int = 200) -> List[np.ndarray]:
+    """Gaze network inputs for calibration - the faces the FP32 YuNet finds in the frames."""
+    preprocessor = ClassifierPreprocessor(size=input_size)
+    inputs = []
+    for frame in frames:
+        yunet = _yunet(yunet_path, (frame.shape[1], frame.shape[0]))
+        for bbox in detect(yunet, frame):
+            crop = face_crop(frame, bbox)
+            if crop.size:
+                inputs.append(preprocessor([crop]).copy())
+        if len(inputs) >= max_faces:
+            break
+    return inputs[:max_faces]
+
+
+# ---- Quantization ----
+
+def quantize(model_path: str, output_path: str, calibration_inputs: List[np.ndarray],
+             per_channel: bool = True) -> str:
+    """
+    Statically quantize a model to INT8.
+
+    Args:
+        model_path: Path to the FP32 model (single input)
+        output_path: Path to write the INT8 model to
+        calibration_inputs: Network inputs used to calibrate the activation ranges
+        per_channel: Quantize weights per output channel instead of per tensor
+
+    Returns:
+        str: output_path
+
+    Raises:
+        ValueError: Without calibration inputs
+    """
+    import onnxruntime as ort
+    from onnxruntime.quantization import (CalibrationDataReader, CalibrationMethod, QuantFormat, QuantType,
+                                          quantize_static)
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+
+    if not calibration_inputs:
+        raise ValueError("No calibration inputs - check the calibration frames")
+
+    input_name = ort.InferenceSession(model_path, providers=["CPUExecutionProvider"]).get_inputs()[0].name
+
+    class Reader(CalibrationDataReader):
+        def __init__(self):
+            self._inputs = iter(calibration_inputs)
+
+        def get_next(self):
+            x = next(self._inputs, None)
+            return None if x is None else {input_name: x}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Shape inference and constant folding first, as recommended before quantization.
+        # Symbolic shape inference needs sympy and is not needed for these CNNs.
+        prepared_path = os.path.join(temp_dir, "prepared.onnx")
+        quant_pre_process(model_path, prepared_path, skip_symbolic_shape=True)
+
+        quantize_static(prepared_path, output_path, Reader(),
+                        quant_format=QuantFormat.QDQ, per_channel=per_channel,
+                        activation_type=QuantType.QUInt8, weight_type=QuantType.QInt8,
+                        calibrate_method=CalibrationMethod.MinMax)
+    return output_path
+
+
+# ---- Evaluation ----
+
+def _matches(boxes_a: np.ndarray, boxes_b: np.ndarray, iou_threshold: float = 0.5) -> int:
+    """Number of greedy one-to-one box matches with IoU above the threshold."""
+    from core.tracker import iou_matrix
+
+    if len(boxes_a) == 0 or len(boxes_b) == 0:
+        return 0
+    iou = iou_matrix(np.asarray(boxes_a, dtype=np.float32), np.asarray(boxes_b, dtype=np.float32))
+    matches = 0
+    while iou.size and iou.max() >= iou_threshold:
+        i, j = np.unravel_index(np.argmax(iou), iou.shape)
+        iou[i, :] = 0
+        iou[:, j] = 0
+        matches += 1
+    return matches
+
+
+def _f1(matches: int, num_a: int, num_b: int) -> float:
+    return 2.0 * matches / (num_a + num_b) if num_a + num_b else 1.0
+
+
+def evaluate_yunet(fp32_path: str, int8_path: str,
+                   samples: List[Tuple[np.ndarray, List[Dict[str, Any]]]]) -> Dict[str, float]:
+    """
+    Compare the FP32 and INT8 YuNet models as OpenCV runs them in the app.
+
+    Returns:
+        Dict with the detection agreement (F1 between the two models' boxes), each model's
+        F1 against the labelled boxes and the median detection time of each model
+    """
+    results = {"fp32": [], "int8": []}
+    timings = {"fp32": [], "int8": []}
+    for name, path in (("fp32", fp32_path), ("int8", int8_path)):
+        for frame, _ in samples:
+            yunet = _yunet(path, (frame.shape[1], frame.shape[0]))
+            detect(yunet, frame)  # Warm up
+            start = time.perf_counter()
+            results[name].append(detect(yunet, frame))
+            timings[name].append((time.perf_counter() - start) * 1000.0)
+
+    counts = {"agree": 0, "fp32": 0, "int8": 0, "labels": 0, "fp32_hits": 0, "int8_hits": 0}
+    for (frame, faces), fp32, int8 in zip(samples, results["fp32"], results["int8"]):
+        labels = np.array([face["bbox"] for face in faces], dtype=np.float32).reshape(-1, 4)
+        counts["agree"] += _matches(fp32, int8)
+        counts["fp32"] += len(fp32)
+        counts["int8"] += len(int8)
+        counts["labels"] += len(labels)
+        counts["fp32_hits"] += _matches(fp32, labels)
+        counts["int8_hits"] += _matches(int8, labels)
+
+    return {
+        "agreement": _f1(counts["agree"], counts["fp32"], counts["int8"]),
+        "fp32_accuracy": _f1(counts["fp32_hits"], counts["fp32"], counts["labels"]),
+        "int8_accuracy": _f1(counts["int8_hits"], counts["int8"], counts["labels"]),
+        "fp32_ms": float(np.median(timings["fp32"])),
+        "int8_ms": float(np.median(timings["int8"])),
+    }
+
+
+def evaluate_gaze(fp32_path: str, int8_path: str, samples: List[Tuple[np.ndarray, List[Dict[str, Any]]]],
+                  threshold: float = 0.5, repeats: int = 20) -> Dict[str, float]:
+    """
+    Compare the FP32 and INT8 gaze models on the labelled faces.
+
+    Returns:
+        Dict with the decision agreement between the models, each model's accuracy on the
+        faces with a 'looking' label (NaN without any) and the median time of each model
+        for a batch of all faces (one run per face for fixed-batch models)
+    """
+    import onnxruntime as ort
+
+    crops, looking = [], []
+    for frame, faces in samples:
+        for face in faces:
+            crop = face_crop(frame, face["bbox"])
+            if crop.size:
+                crops.append(crop)
+                looking.append(face.get("looking"))
+
+    if not crops:
+        raise ValueError("The labelled set has no usable faces")
+
+    probs, timings = {}, {}
+    for name, path in (("fp32", fp32_path), ("int8", int8_path)):
+        session = ort.InferenceSession(path, providers=["CPUExecutionProvider"])
+        model_input = session.get_inputs()[0]
+        batch = ClassifierPreprocessor(size=model_input.shape[2])(crops).copy()
+        batches = ([batch[i:i + 1] for i in range(len(batch))] if model_input.shape[0] == 1 else [batch])
+
+        def run():
+            return np.concatenate([session.run(None, {model_input.name: x})[0].reshape(len(x), -1)[:, 0]
+                                   for x in batches])
+
+        logits = run()
+        start = time.perf_counter()
+        for _ in range(repeats):
+            run()
+        timings[name] = (time.perf_counter() - start) * 1000.0 / repeats
+        probs[name] = 1.0 / (1.0 + np.exp(-logits))
+
+    decisions = {name: prob >= threshold for name, prob in probs.items()}
+    labelled = np.array([label is not None for label in looking])
+    truth = np.array([bool(label) for label in looking])
+
+    def accuracy(decision: np.ndarray) -> float:
+        return float(np.mean(decision[labelled] == truth[labelled])) if labelled.any() else float("nan")
+
+    return {
+        "agreement": float(np.mean(decisions["fp32"] == decisions["int8"])),
+        "fp32_accuracy": accuracy(decisions["fp32"]),
+        "int8_accuracy": accuracy(decisions["int8"]),
+        "fp32_ms": timings["fp32"],
+        "int8_ms": timings["int8"],
+    }
+
+
+def passes_gate(report: Dict[str, float], min_agreement: float, max_accuracy_drop: float,
+                min_speedup: float) -> Tuple[bool, List[str]]:
+    """
+    Check an evaluation report against the thresholds.
+
+    Returns:
+        Tuple of (passed, reasons for failing)
+    """
+    reasons = []
+    if report["agreement"] < min_agreement:
+        reasons.append(f"agreement {report['agreement']:.3f} < {min_agreement}")
+    drop = report["fp32_accuracy"] - report["int8_accuracy"]
+    if not np.isnan(drop) and drop > max_accuracy_drop:
+        reasons.append(f"accuracy drop {drop:.3f} > {max_accuracy_drop}")
+    speedup = report["fp32_ms"] / report["int8_ms"] if report["int8_ms"] > 0 else 0.0
+    if speedup < min_speedup:
+        reasons.append(f"speedup {speedup:.2f}x < {min_speedup}x")
+    return not reasons, reasons
+
+
+def _print_report(name: str, report: Dict[str, float]):
+    speedup = report["fp32_ms"] / report["int8_ms"] if report["int8_ms"] > 0 else 0.0
+    print(f"{name}: agreement {report['agreement']:.3f}, "
+          f"accuracy FP32 {report['fp32_accuracy']:.3f} / INT8 {report['int8_accuracy']:.3f}, "
+          f"{report['fp32_ms']:.2f} ms -> {report['int8_ms']:.2f} ms ({speedup:.2f}x)")
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build and check INT8 variants of the YuNet and gaze models")
+    parser.add_argument("--calibration", required=True, help="Directory of calibration frames")
+    parser.add_argument("--labelled", required=True, help="Directory of labelled frames with labels.json")
+    parser.add_argument("--yunet", default=resource_path(DEFAULT_YUNET_MODEL), help="FP32 YuNet model")
+    parser.add_argument("--gaze", default=resource_path(DEFAULT_GAZE_MODEL), help="FP32 gaze model")
+    parser.add_argument("--models", default="yunet,gaze", help="Comma-separated models to quantize")
+    parser.add_argument("--max-frames", type=int, default=100, help="Calibration frames to use")
+    parser.add_argument("--per-tensor", action="store_true", help="Quantize weights per tensor instead of per channel")
+    parser.add_argument("--min-agreement", type=float, default=0.95,
+                        help="Smallest agreement with the FP32 model (detection F1 / equal gaze decisions)")
+    parser.add_argument("--max-accuracy-drop", type=float, default=0.02,
+                        help="Largest accuracy loss against the labels")
+    parser.add_argument("--min-speedup", type=float, default=1.2,
+                        help="Smallest speedup over the FP32 model on this machine")
+
+    args = parser.parse_args(argv)
+
+    try:
+        import onnx  # noqa: F401
+    except ImportError:
+        print("This tool requires the 'onnx' package: pip install onnx")
+        return 1
+
+    frames = load_frames(args.calibration, args.max_frames)
+    samples = load_labelled_set(args.labelled)
+    if not frames or not samples:
+        print("Need at least one calibration frame and one labelled frame")
+        return 1
+
+    models = [name for name in args.models.split(",") if name]
+    failed = False
+
+    for name in models:
+        if name == "yunet":
+            import onnxruntime as ort
+            fp32_path = args.yunet
+            size = ort.InferenceSession(fp32_path, providers=["CPUExecutionProvider"]).get_inputs()[0].shape[2]
+            inputs = yunet_calibration_inputs(frames, size)
+        elif name == "gaze":
+            import onnxruntime as ort
+            fp32_path = args.gaze
+            size = ort.InferenceSession(fp32_path, providers=["CPUExecutionProvider"]).get_inputs()[0].shape[2]
+            inputs = gaze_calibration_inputs(frames, args.yunet, size)
+        else:
+            print(f"Unknown model {name!r} - expected yunet or gaze")
+            return 1
+
+        output_path = quantized_model_path(fp32_path)
+        print(f"Quantizing {fp32_path} with {len(inputs)} calibration inputs...")
+        try:
+            quantize(fp32_path, output_path, inputs, per_channel=not args.per_tensor)
+        except ValueError as e:
+            print(f"Cannot quantize {fp32_path}: {e}")
+            failed = True
+            continue
+
+        if name == "yunet":
+            report = evaluate_yunet(fp32_path, output_path, samples)
+        else:
+            report = evaluate_gaze(fp32_path, output_path, samples)
+        _print_report(name, report)
+
+        passed, reasons = passes_gate(report, args.min_agreement, args.max_accuracy_drop, args.min_speedup)
+        if passed:
+            print(f"INT8 model written to {output_path}")
+        else:
+            os.remove(output_path)
+            print(f"INT8 model not kept: {'; '.join(reasons)}")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ from typing import Tuple, List, Optional
 import cv2 as cv
 import numpy as np
 
+from utils.face_regions import detect_faces, detect_faces_in_regions
 from utils.yunet import YuNet
 
 
@@ -24,7 +25,10 @@ class YuNetDetector:
 			top_k (int): Limits the maximum number of detection candidates to consider before applying NMS
 		"""
 		self.confidence_threshold = confidence_threshold
+		self.nms_threshold = nms_threshold
 		self.target_size = 340
+		# Longer side of the regions searched by locate(frame, regions)
+		self.region_size = 192
 
 		backend_id = cv.dnn.DNN_BACKEND_OPENCV
 		target_id = cv.dnn.DNN_TARGET_CPU
@@ -40,12 +44,16 @@ class YuNetDetector:
 			targetId=target_id,
 		)
 
-	def detect(self, frame: np.ndarray) -> Tuple[int, List[Tuple[int, int, int, int]], np.ndarray, int]:
+		# Visualization data of the last detect() call, redrawn by annotate_last()
+		self._last_detection_result = None
+
+	def detect(self, frame: np.ndarray, in_place: bool = False) -> Tuple[int, List[Tuple[int, int, int, int]], np.ndarray, int]:
 		"""
 		Detect faces in the given frame.
 
 		Args:
 			frame (np.ndarray): Input image frame
+			in_place (bool): Draw the annotations directly onto frame instead of a copy
 
 		Returns:
 			Tuple containing:
@@ -53,44 +61,76 @@ class YuNetDetector:
 				- List of bounding boxes [x, y, width, height]
 				- Annotated frame with visualizations
 		"""
+		return self.process_detections(frame, self.locate(frame), in_place)
+
+	def locate(self, frame: np.ndarray, regions: Optional[List[Tuple[int, int, int, int]]] = None) -> np.ndarray:
+		"""
+		Run YuNet on the frame without building a result.
+
+		Args:
+			frame (np.ndarray): Input image frame
+			regions (List[Tuple[int, int, int, int]]): Only search these (x, y, w, h) regions,
+				each at up to region_size pixels (see utils.face_regions)
+
+		Returns:
+			np.ndarray: Detection rows above the confidence threshold, in frame pixel coordinates -
+				[x, y, w, h, 5 landmark (x, y) pairs, score], shape (N, 15)
+		"""
 		# Resize frame while maintaining aspect ratio
-		h, w = frame.shape[:2]
-		scale_factor = self.target_size / max(h, w)
-		new_w = int(w * scale_factor)
-		new_h = int(h * scale_factor)
-		resized = cv.resize(frame, (new_w, new_h))
+		scale_factor = self.target_size / max(frame.shape[:2])
 
-		# Run face detection
-		self.detector.setInputSize([new_w, new_h])
-		detections = self.detector.infer(resized)
+		if regions is not None:
+			return detect_faces_in_regions(self.detector, frame, regions, scale_factor, self.region_size,
+										   self.confidence_threshold, self.nms_threshold)
+		return detect_faces(self.detector, frame, scale_factor, self.confidence_threshold)
 
-		# Extract bounding boxes and scale back to original size
-		bboxes = []
-		if detections.shape[0] > 0:
-			# Scale factor to convert back to original size
-			inverse_scale = 1.0 / scale_factor
+	def process_detections(self, frame: np.ndarray, detections: np.ndarray, in_place: bool = False,
+						   track_ids: Optional[List[int]] = None) -> Tuple[int, List[Tuple[int, int, int, int]], np.ndarray, int]:
+		"""
+		Build the detection result for faces found by locate() or moved there by the tracker.
+
+		Args:
+			frame (np.ndarray): Input image frame
+			detections (np.ndarray): Detection rows in frame pixel coordinates, see locate()
+			in_place (bool): Draw the annotations directly onto frame instead of a copy
+			track_ids (List[int]): Unused - YuNet results do not depend on the face's history
 
+		Returns:
+			Same as detect()
+		"""
+		bboxes = []
+		if len(detections) > 0:
 			# For visualization, create a compatible detection result format
-			detection_result = self._prepare_visualization_data(detections, frame, inverse_scale)
+			detection_result = self._prepare_visualization_data(detections, frame, 1.0)
 
 			# Extract bounding boxes in the expected format
 			for det in detections:
-				if det[-1] >= self.confidence_threshold:  # Check confidence
-					# Scale back to original coordinates
-					x = int(det[0] * inverse_scale)
-					y = int(det[1] * inverse_scale)
-					w = int(det[2] * inverse_scale)
-					h = int(det[3] * inverse_scale)
-					bboxes.append((x, y, w, h))
+				bboxes.append((int(det[0]), int(det[1]), int(det[2]), int(det[3])))
 		else:
 			# Create empty detection result
 			detection_result = type('', (), {'detections': []})()
 
 		# Create visualized frame
-		annotated_frame = self._visualize(frame, detection_result)
+		self._last_detection_result = detection_result
+		annotated_frame = self._visualize(frame, detection_result, in_place)
 
 		return len(bboxes), bboxes, annotated_frame, len(bboxes)
 
+	def annotate_last(self, frame: np.ndarray, in_place: bool = False) -> np.ndarray:
+		"""
+		Draw the result of the last detect() call onto another frame of the same size.
+
+		Args:
+			frame (np.ndarray): Frame to annotate
+			in_place (bool): Draw directly onto frame instead of a copy
+
+		Returns:
+			Annotated frame
+		"""
+		if self._last_detection_result is None:
+			return frame if in_place else frame.copy()
+		return self._visualize(frame, self._last_detection_result, in_place)
+
 	def _prepare_visualization_data(self, detections, frame, inverse_scale):
 		"""
 		Prepare detection data in a format compatible with the visualization method.
@@ -171,13 +211,14 @@ class YuNetDetector:
 		y_px = min(math.floor(normalized_y * image_height), image_height - 1)
 		return x_px, y_px
 
-	def _visualize(self, image: np.ndarray, detection_result) -> np.ndarray:
+	def _visualize(self, image: np.ndarray, detection_result, in_place: bool = False) -> np.ndarray:
 		"""
 		Draw bounding boxes and keypoints on the input image.
 
 		Args:
 			image: The input RGB image
 			detection_result: The face detection results
+			in_place: Draw onto image itself instead of a copy
 
 		Returns:
 			Image with bounding boxes and keypoints
@@ -190,7 +231,7 @@ class YuNetDetector:
 		FONT_THICKNESS = 5
 		TEXT_COLOR = (255, 0, 0)  # Blue (BGR)
 
-		annotated_image = image.copy()
+		annotated_image = image if in_place else image.copy()
 		height, width, _ = image.shape
 
 		for detection in detection_result.detections: